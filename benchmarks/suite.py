@@ -0,0 +1,400 @@
+"""
+Benchmarks for the engine hot paths, run on the seeded position corpus.
+
+Each benchmark has a setup that builds fresh state (untimed) and returns the
+callable to time. Results are per call timings in microseconds with
+percentiles, written as JSON and optionally compared to a saved baseline.
+
+    python entry_script.py bench [--filter NAME] [--output results.json]
+                                 [--baseline baseline.json] [--save-baseline]
+"""
+import argparse
+from dataclasses import dataclass
+from itertools import islice
+import json
+import os
+from pathlib import Path
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from typing import Callable
+
+from game_play.analytics import GameArchive
+from game_play.bingo_table import BingoTable, build_bingo_table
+from game_play.dictionary import Dictionary
+from game_play.lexi_grid import LexiGrid
+from game_play.move import Move
+from game_play.position_corpus import iter_clean_plays, load_corpus, make_play_move
+from game_play.word import PlayedWord
+from game_play.board import Board
+from helper.text_output import suppress_output
+
+BENCH_DIR = Path(__file__).parent
+DEFAULT_BASELINE = BENCH_DIR / "baseline.json"
+CORPUS_CACHE = BENCH_DIR / "position_corpus.json"
+DEFAULT_THRESHOLD = 0.25  # flag a regression when p50 is 25% slower than the baseline
+
+
+@dataclass
+class Benchmark:
+    name: str
+    setup: Callable[[], Callable[[], object]]
+    repeat: int = 50
+    number: int = 1  # calls per timed sample, for operations too quick to time one by one
+
+
+BENCHMARKS: list[Benchmark] = []
+
+
+def benchmark(name: str, repeat: int = 50, number: int = 1):
+    def register(setup):
+        BENCHMARKS.append(Benchmark(name, setup, repeat, number))
+        return setup
+    return register
+
+
+class Fixtures:
+    """Lazily built state shared by the benchmark setups; `cleanup` removes what was written to disk."""
+    _dictionary: Dictionary | None = None
+    _corpus: dict[str, dict] | None = None
+    _bingo_table: BingoTable | None = None
+    _bingo_path = Path(tempfile.gettempdir()) / f"lexigrid_bench_bingos_{os.getpid()}.bin"
+
+    @classmethod
+    def dictionary(cls) -> Dictionary:
+        if cls._dictionary is None:
+            with suppress_output():
+                cls._dictionary = Dictionary()
+                cls._dictionary.all_words
+        return cls._dictionary
+
+    @classmethod
+    def corpus(cls) -> dict[str, dict]:
+        if cls._corpus is None:
+            with suppress_output():
+                cls._corpus = load_corpus(CORPUS_CACHE)
+        return cls._corpus
+
+    @classmethod
+    def bingo_table(cls) -> BingoTable:
+        # Building over the whole lexicon takes seconds, far longer than the lookups being timed
+        if cls._bingo_table is None:
+            with suppress_output():
+                build_bingo_table(cls._bingo_path, cls.dictionary().all_words)
+            cls._bingo_table = BingoTable(cls._bingo_path)
+        return cls._bingo_table
+
+    @classmethod
+    def cleanup(cls):
+        if cls._bingo_table is not None:
+            cls._bingo_table.close()
+            cls._bingo_table = None
+        cls._bingo_path.unlink(missing_ok=True)
+
+    @classmethod
+    def game(cls, key: str = "midgame-0") -> LexiGrid:
+        return LexiGrid.from_dict(cls.corpus()[key], dictionary=cls.dictionary())
+
+    @classmethod
+    def game_with_play(cls, key: str = "midgame-0") -> tuple[LexiGrid, tuple[str, int, int, bool]]:
+        game = cls.game(key)
+        play = next(iter_clean_plays(game, cls.dictionary().index))
+        return game, play
+
+
+# --- Benchmarks -----------------------------------------------------------
+
+@benchmark("dictionary.cold_load", repeat=5)
+def bench_dictionary_cold_load():
+    dictionary = Dictionary()
+
+    def run():
+        with suppress_output():
+            return dictionary.all_words
+    return run
+
+
+@benchmark("dictionary.check_word", repeat=200, number=100)
+def bench_dictionary_lookup():
+    dictionary = Fixtures.dictionary()
+    words = ["AARDVARK", "quiz", "  Ribosomes ", "ZZZQX", "cat"] * 20
+    words_iter = iter(words * 10_000)
+    return lambda: dictionary.check_word(next(words_iter))
+
+
+@benchmark("word_index.find", repeat=50, number=5)
+def bench_word_index_find():
+    index = Fixtures.dictionary().index
+    queries = [
+        {"rack": "AEINRST"}, {"anagram": "AEINRS?"}, {"pattern": "?A?E"},
+        {"length": 7, "contains": "Q", "excludes": "U"}, {"pattern": "Q???", "excludes": "U"},
+    ]
+    queries_iter = iter(queries * 100)
+    return lambda: index.find(**next(queries_iter))
+
+
+@benchmark("word_index.two_blank_rack", repeat=50, number=4)
+def bench_two_blank_rack():
+    index = Fixtures.dictionary().index
+    index.drop_one  # built once per index, outside the timed calls
+    racks_iter = iter(["AEIST??", "QZXJE??", "RTNLS??", "EEIOU??"] * 100)
+    return lambda: index.words_from_rack(next(racks_iter))
+
+
+@benchmark("move_gen.two_blank_rack", repeat=30)
+def bench_move_gen_two_blanks():
+    game = Fixtures.game("midgame-0")
+    game.players[game.current_player_idx].rack = list("AEIRT**")
+    index = Fixtures.dictionary().index
+    index.drop_one
+    return lambda: list(islice(iter_clean_plays(game, index), 50))
+
+
+@benchmark("bingo_table.find", repeat=50, number=20)
+def bench_bingo_table_find():
+    table = Fixtures.bingo_table()
+    racks_iter = iter(["AEINRST", "RETAINS", "QZXJKVW", "AEILNRT", "EINORST"] * 1000)
+    return lambda: table.find(next(racks_iter))
+
+
+@benchmark("lexi_grid.place_word", repeat=100)
+def bench_place_word():
+    game, play = Fixtures.game_with_play()
+    move = make_play_move(game, *play)
+
+    def run():
+        with suppress_output():
+            return game.place_word(move)
+    return run
+
+
+@benchmark("lexi_grid.place_word_auto_validate", repeat=100)
+def bench_place_word_auto_validate():
+    # Compare with lexi_grid.place_word for the per-move cost of the rule
+    game, play = Fixtures.game_with_play()
+    game.auto_validate = True
+    move = make_play_move(game, *play)
+
+    def run():
+        with suppress_output():
+            return game.place_word(move)
+    return run
+
+
+@benchmark("lexi_grid.calculate_score", repeat=100)
+def bench_calculate_score():
+    game, (word, row, col, is_horizontal) = Fixtures.game_with_play()
+    player = game.players[game.current_player_idx]
+    played_word = PlayedWord(word, row, col, is_horizontal)
+    with suppress_output():
+        played_word.get_scoring_tiles(game.board)
+    for r, c, letter, is_played in played_word.iterate_word_positions_and_is_played():
+        if is_played:
+            game.board.place_tile(r, c, letter, player.name, game.turn)
+
+    def run():
+        with suppress_output():
+            game.calculate_score(player, played_word, False)
+    return run
+
+
+@benchmark("board.to_dict", repeat=100)
+def bench_board_to_dict():
+    board = Fixtures.game("endgame-0").board
+    return board.to_dict
+
+
+@benchmark("board.from_dict", repeat=100)
+def bench_board_from_dict():
+    game = Fixtures.game("endgame-0")
+    board_dict = game.board.to_dict()
+    return lambda: Board.from_dict(board_dict, players=game.players)
+
+
+@benchmark("lexi_grid.save_game", repeat=30)
+def bench_save_game():
+    game = Fixtures.game("endgame-0")
+    path = Path(tempfile.gettempdir()) / f"lexigrid_bench_{os.getpid()}.json"
+
+    def run():
+        with suppress_output():
+            game.save_game(path)
+    return run
+
+
+@benchmark("lexi_grid.load_game", repeat=30)
+def bench_load_game():
+    path = Path(tempfile.gettempdir()) / f"lexigrid_bench_load_{os.getpid()}.json"
+    with suppress_output():
+        Fixtures.game("endgame-0").save_game(path)
+    dictionary = Fixtures.dictionary()
+
+    def run():
+        with open(path, "r", encoding="utf8") as in_file:
+            return LexiGrid.from_dict(json.load(in_file), dictionary=dictionary)
+    return run
+
+
+@benchmark("lexi_grid.load_game_lazy", repeat=30)
+def bench_load_game_lazy():
+    path = Path(tempfile.gettempdir()) / f"lexigrid_bench_load_lazy_{os.getpid()}.json"
+    with suppress_output():
+        Fixtures.game("endgame-0").save_game(path)
+    dictionary = Fixtures.dictionary()
+
+    def run():
+        with open(path, "r", encoding="utf8") as in_file:
+            return LexiGrid.from_dict(json.load(in_file), dictionary=dictionary, lazy=True)
+    return run
+
+
+@benchmark("analytics.add_corpus", repeat=30)
+def bench_analytics_add_corpus():
+    games = list(Fixtures.corpus().items())
+
+    def run():
+        archive = GameArchive()
+        archive.add_games(games)
+        return archive.summary()
+    return run
+
+
+@benchmark("board.display", repeat=30)
+def bench_board_display():
+    board = Fixtures.game("endgame-0").board
+
+    def run():
+        with suppress_output():
+            board.display()
+    return run
+
+
+@benchmark("board.display_one_row_changed", repeat=30)
+def bench_board_display_one_row_changed():
+    game, (word, row, col, is_horizontal) = Fixtures.game_with_play()
+    board = game.board
+    with suppress_output():
+        board.display()
+    board.place_tile(row, col, word[0], None, game.turn)
+
+    def run():
+        with suppress_output():
+            board.display()
+    return run
+
+
+@benchmark("move.parse_move_input", repeat=200, number=100)
+def bench_parse_move_input():
+    game = Fixtures.game()
+    player = game.players[game.current_player_idx]
+    lines = ["play hello h8 h", "pass", "play quiz 10 c down", "save game.json", "end"]
+    lines_iter = iter(lines * 10_000)
+    return lambda: Move(next(lines_iter), default_player=player, players=game.players)
+
+
+# --- Runner ---------------------------------------------------------------
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    idx = min(len(sorted_values) - 1, max(0, round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[idx]
+
+
+def run_benchmark(bench: Benchmark) -> dict:
+    bench.setup()()  # warm up caches and lazy imports outside the measurement
+    samples = []
+    for _ in range(bench.repeat):
+        run = bench.setup()
+        start = time.perf_counter_ns()
+        for _ in range(bench.number):
+            run()
+        samples.append((time.perf_counter_ns() - start) / bench.number / 1000)
+    samples.sort()
+    return {
+        "unit": "us",
+        "samples": len(samples),
+        "calls_per_sample": bench.number,
+        "mean": statistics.fmean(samples),
+        "min": samples[0],
+        "p50": percentile(samples, 50),
+        "p90": percentile(samples, 90),
+        "p99": percentile(samples, 99),
+        "max": samples[-1],
+    }
+
+
+def run_benchmarks(name_filter: str | None = None) -> dict:
+    results = {}
+    try:
+        for bench in BENCHMARKS:
+            if name_filter and name_filter not in bench.name:
+                continue
+            results[bench.name] = run_benchmark(bench)
+    finally:
+        Fixtures.cleanup()
+    return {
+        "meta": {
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "results": results,
+    }
+
+
+def compare_to_baseline(current: dict, baseline: dict, threshold: float = DEFAULT_THRESHOLD) -> list[dict]:
+    comparisons = []
+    for name, stats in current["results"].items():
+        base = baseline.get("results", {}).get(name)
+        if base is None:
+            continue
+        ratio = stats["p50"] / base["p50"] if base["p50"] else float("inf")
+        comparisons.append({
+            "name": name,
+            "baseline_p50": base["p50"],
+            "current_p50": stats["p50"],
+            "ratio": ratio,
+            "regression": ratio > 1 + threshold,
+        })
+    return comparisons
+
+
+def run_benchmarks_cli(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="Lexigrid bench", description="Time the engine hot paths")
+    parser.add_argument("--filter", default=None, help="only run benchmarks whose name contains this")
+    parser.add_argument("--output", default=None, help="write the JSON results here")
+    parser.add_argument("--baseline", default=str(DEFAULT_BASELINE), help="baseline JSON to compare against")
+    parser.add_argument("--save-baseline", action="store_true", help="store these results as the new baseline")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="allowed p50 slowdown ratio")
+    args = parser.parse_args(argv)
+
+    current = run_benchmarks(args.filter)
+    print(f"{'benchmark':32} {'p50 us':>12} {'p90 us':>12} {'p99 us':>12}")
+    for name, stats in current["results"].items():
+        print(f"{name:32} {stats['p50']:12.2f} {stats['p90']:12.2f} {stats['p99']:12.2f}")
+
+    regressions = []
+    baseline_path = Path(args.baseline)
+    if baseline_path.exists() and not args.save_baseline:
+        with open(baseline_path, "r", encoding="utf8") as in_file:
+            current["comparison"] = compare_to_baseline(current, json.load(in_file), args.threshold)
+        regressions = [c for c in current["comparison"] if c["regression"]]
+        for comparison in regressions:
+            print(f"REGRESSION {comparison['name']}: p50 {comparison['baseline_p50']:.2f} -> "
+                  f"{comparison['current_p50']:.2f} us ({comparison['ratio']:.2f}x)")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf8") as out_file:
+            json.dump(current, out_file, indent=2)
+    if args.save_baseline:
+        with open(baseline_path, "w", encoding="utf8") as out_file:
+            json.dump(current, out_file, indent=2)
+        print(f"Baseline saved to {baseline_path}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(run_benchmarks_cli())
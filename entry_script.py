@@ -1,16 +1,28 @@
 import argparse
-from game_play.main import play_game
-from tests.test_helper_generic import run_tests
-# from tests.test_lexi_grid import test_main
-
-
+from importlib import import_module
 
+# "module:function" per command, imported only when that command runs so startup
+# never pays for the engine, colorama or the tests. Each function takes the
+# arguments that follow the command name on the command line, --help included.
 COMMANDS = {
-    "play" : play_game,
-    # "test_main" : test_main,
-    "test_generic" : run_tests,
+    "play" : "game_play.main:play_game",
+    "serve" : "game_play.server:run_server_cli",
+    "script" : "game_play.batch:run_scripts_cli",
+    "bench" : "benchmarks.suite:run_benchmarks_cli",
+    "memory" : "game_play.memory:memory_report_cli",
+    "find" : "game_play.word_index:find_words_cli",
+    "opening" : "game_play.opening_book:opening_book_cli",
+    "bingo" : "game_play.bingo_table:bingo_table_cli",
+    "stats" : "game_play.analytics:stats_cli",
+    "ratings" : "game_play.ratings:ratings_cli",
+    # "test_main" : "tests.test_lexi_grid:test_main",
+    "test_generic" : "tests.test_helper_generic:run_tests",
 }
 
+def load_command(spec: str):
+    module_name, _, function_name = spec.partition(":")
+    return getattr(import_module(module_name), function_name)
+
 def main(argv=None) -> int:
     parser = argparse.ArgumentParser(
         prog="Lexigrid",
@@ -23,9 +35,14 @@ def main(argv=None) -> int:
         default="play",
         help="which commands to run"
     )
+    parser.add_argument(
+        "command_argv",
+        nargs=argparse.REMAINDER,
+        help="arguments for the command (see <command> --help)"
+    )
     args = parser.parse_args(argv)
-    COMMANDS[args.command]()
-    return 0
+    result = load_command(COMMANDS[args.command])(args.command_argv)
+    return result if isinstance(result, int) else 0
 
 if __name__ == "__main__":
-    raise SystemExit(main())
\ No newline at end of file
+    raise SystemExit(main())
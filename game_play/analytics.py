@@ -0,0 +1,288 @@
+"""
+Statistics over archived games, kept in columnar NumPy arrays.
+
+Saved games (LexiGrid.to_dict JSON, one game per file or a corpus of them keyed by
+name) are flattened into three tables:
+
+    moves     one row per TurnScore: game, player, turn, action, score, bingo, challenge
+    words     one row per scored word: game, move row, word id, length, start square, blanks
+    squares   one row per game: which squares hold a tile, and which hold a blank
+
+Dashboard numbers are computed over whole columns at once. The running totals,
+word counts and square heatmaps are folded in batch by batch, so adding new games
+never goes back over the ones already loaded.
+
+    python entry_script.py stats saved_games/ [--top 20] [--json]
+"""
+import argparse
+import json
+from pathlib import Path
+from typing import Iterable, Iterator
+
+import numpy as np
+
+import config
+from game_play.move_types import MoveOptions
+from helper.generic import two_d_to_one_d_coordinate
+
+ACTIONS = list(MoveOptions)
+ACTION_CODES = {action.value: code for code, action in enumerate(ACTIONS)}
+NO_ACTION = -1
+PLAY_CODE = ACTION_CODES[MoveOptions.PLAY.value]
+CHALLENGE_CODE = ACTION_CODES[MoveOptions.CHALLENGE.value]
+# Turns a player took, as opposed to challenge adjustments
+TURN_CODES = np.array([ACTION_CODES[action.value] for action in (MoveOptions.PLAY, MoveOptions.PASS, MoveOptions.EXCHANGE, MoveOptions.SKIP)])
+NUM_SQUARES = config.BOARD_WIDTH * config.BOARD_HEIGHT
+
+MOVE_COLUMNS = {
+    "game": np.int32, "player": np.int8, "turn": np.int32, "action": np.int8, "score": np.int32,
+    "is_bingo": np.bool_, "is_challenger": np.int8, "is_challenge_successful": np.int8, "num_words": np.int16,
+}
+WORD_COLUMNS = {
+    "game": np.int32, "move": np.int64, "word": np.int32, "length": np.int16,
+    "square": np.int16, "is_horizontal": np.bool_, "num_blanks": np.int8,
+}
+SQUARE_COLUMNS = {"game": np.int32, "occupied": (np.bool_, NUM_SQUARES), "blank": (np.bool_, NUM_SQUARES)}
+
+
+def _tristate(value: bool | None) -> int:
+    return -1 if value is None else int(value)
+
+
+class ColumnTable:
+    """Named columns of one length; appends grow the arrays by doubling."""
+
+    def __init__(self, columns: dict):
+        self._data: dict[str, np.ndarray] = {}
+        for name, spec in columns.items():
+            dtype, width = spec if isinstance(spec, tuple) else (spec, None)
+            self._data[name] = np.empty((16,) if width is None else (16, width), dtype=dtype)
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self._data[name][:self.size]
+
+    def append(self, columns: dict[str, np.ndarray]):
+        count = len(next(iter(columns.values())))
+        needed = self.size + count
+        for name, data in self._data.items():
+            if needed > len(data):
+                grown = np.empty((max(needed, 2 * len(data)),) + data.shape[1:], dtype=data.dtype)
+                grown[:self.size] = data[:self.size]
+                self._data[name] = data = grown
+            data[self.size:needed] = columns[name]
+        self.size = needed
+
+
+class GameArchive:
+    def __init__(self):
+        self.games: list[str] = []
+        self.moves = ColumnTable(MOVE_COLUMNS)
+        self.words = ColumnTable(WORD_COLUMNS)
+        self.squares = ColumnTable(SQUARE_COLUMNS)
+        self.vocabulary: list[str] = []
+        self._word_ids: dict[str, int] = {}
+        # Folded in as each batch arrives
+        self.totals = {"turns": 0, "turn_score": 0, "plays": 0, "bingos": 0, "challenges": 0, "successful_challenges": 0}
+        self.word_counts = np.zeros(0, dtype=np.int64)
+        self.tile_heatmap = np.zeros(NUM_SQUARES, dtype=np.int64)
+        self.blank_heatmap = np.zeros(NUM_SQUARES, dtype=np.int64)
+
+    def __len__(self):
+        return len(self.games)
+
+    def _word_id(self, word: str) -> int:
+        word_id = self._word_ids.get(word)
+        if word_id is None:
+            word_id = self._word_ids[word] = len(self.vocabulary)
+            self.vocabulary.append(word)
+        return word_id
+
+    def add_games(self, games: Iterable[tuple[str, dict]]) -> int:
+        """Flatten a batch of saved games into the tables and fold it into the totals. Returns the games added."""
+        moves = {name: [] for name in MOVE_COLUMNS}
+        words = {name: [] for name in WORD_COLUMNS}
+        occupied, blanks, square_games = [], [], []
+        first_move = self.moves.size
+        for key, game in games:
+            game_idx = len(self.games)
+            self.games.append(key)
+            for player_idx, player in enumerate(game.get("players", [])):
+                for turn_score in player.get("score_history", []):
+                    move_row = first_move + len(moves["game"])
+                    scored_words = turn_score.get("scored_words", [])
+                    moves["game"].append(game_idx)
+                    moves["player"].append(player_idx)
+                    moves["turn"].append(turn_score.get("turn", 0))
+                    moves["action"].append(ACTION_CODES.get(turn_score.get("move_action"), NO_ACTION))
+                    moves["score"].append(turn_score.get("total_score", 0))
+                    moves["is_bingo"].append(turn_score.get("is_bingo", False))
+                    moves["is_challenger"].append(_tristate(turn_score.get("is_challenger")))
+                    moves["is_challenge_successful"].append(_tristate(turn_score.get("is_challenge_successful")))
+                    moves["num_words"].append(len(scored_words))
+                    for item in scored_words:
+                        word = item.get("word", {})
+                        words["game"].append(game_idx)
+                        words["move"].append(move_row)
+                        words["word"].append(self._word_id(word.get("word", "")))
+                        words["length"].append(len(word.get("word", "")))
+                        words["square"].append(two_d_to_one_d_coordinate(word.get("start_row", 0), word.get("start_col", 0)))
+                        words["is_horizontal"].append(word.get("is_horizontal", True))
+                        words["num_blanks"].append(len(word.get("blanks", [])))
+            grid = game.get("board", {}).get("grid", {})
+            letters = grid.get("letteres", [])
+            occupied.append([letter is not None for row in letters for letter in row] or [False] * NUM_SQUARES)
+            blanks.append([bool(blank) for row in grid.get("is_blank", []) for blank in row] or [False] * NUM_SQUARES)
+            square_games.append(game_idx)
+
+        num_games = len(square_games)
+        if not num_games:
+            return 0
+        move_batch = {name: np.array(values, dtype=MOVE_COLUMNS[name]) for name, values in moves.items()}
+        word_batch = {name: np.array(values, dtype=WORD_COLUMNS[name]) for name, values in words.items()}
+        square_batch = {
+            "game": np.array(square_games, dtype=np.int32),
+            "occupied": np.array(occupied, dtype=np.bool_).reshape(num_games, NUM_SQUARES),
+            "blank": np.array(blanks, dtype=np.bool_).reshape(num_games, NUM_SQUARES),
+        }
+        if len(move_batch["game"]):
+            self.moves.append(move_batch)
+        if len(word_batch["game"]):
+            self.words.append(word_batch)
+        self.squares.append(square_batch)
+        self._fold(move_batch, word_batch, square_batch)
+        return num_games
+
+    def _fold(self, moves: dict[str, np.ndarray], words: dict[str, np.ndarray], squares: dict[str, np.ndarray]):
+        is_turn = np.isin(moves["action"], TURN_CODES)
+        is_play = moves["action"] == PLAY_CODE
+        is_challenge = (moves["action"] == CHALLENGE_CODE) & (moves["is_challenger"] == 1)
+        self.totals["turns"] += int(is_turn.sum())
+        self.totals["turn_score"] += int(moves["score"][is_turn].sum())
+        self.totals["plays"] += int(is_play.sum())
+        self.totals["bingos"] += int((moves["is_bingo"] & is_play).sum())
+        self.totals["challenges"] += int(is_challenge.sum())
+        self.totals["successful_challenges"] += int((is_challenge & (moves["is_challenge_successful"] == 1)).sum())
+        counts = np.bincount(words["word"], minlength=len(self.vocabulary))
+        counts[:len(self.word_counts)] += self.word_counts
+        self.word_counts = counts
+        self.tile_heatmap += squares["occupied"].sum(axis=0)
+        self.blank_heatmap += squares["blank"].sum(axis=0)
+
+    def add_game(self, key: str, game: dict) -> int:
+        return self.add_games([(key, game)])
+
+    def add_files(self, paths: Iterable[Path | str]) -> int:
+        """Add saved games, a file at a time. A file holds one game or a corpus of named games."""
+        return sum(self.add_games(iter_saved_games(path)) for path in find_game_files(paths))
+
+    # --- Aggregations over the columns ----------------------------------------
+
+    @staticmethod
+    def _rate(numerator: int, denominator: int) -> float:
+        return numerator / denominator if denominator else 0.0
+
+    def average_score_per_turn(self) -> float:
+        return self._rate(self.totals["turn_score"], self.totals["turns"])
+
+    def bingo_rate(self) -> float:
+        """Share of plays that were bingos."""
+        return self._rate(self.totals["bingos"], self.totals["plays"])
+
+    def challenge_success_rate(self) -> float:
+        return self._rate(self.totals["successful_challenges"], self.totals["challenges"])
+
+    def average_score_per_turn_by_game(self) -> np.ndarray:
+        is_turn = np.isin(self.moves["action"], TURN_CODES)
+        games = self.moves["game"]
+        turns = np.bincount(games, weights=is_turn, minlength=len(self.games))
+        scores = np.bincount(games, weights=np.where(is_turn, self.moves["score"], 0), minlength=len(self.games))
+        return np.divide(scores, turns, out=np.zeros_like(scores), where=turns > 0)
+
+    def word_length_counts(self) -> dict[int, int]:
+        """How many scored words there are of each length."""
+        counts = np.bincount(self.words["length"])
+        return {length: int(count) for length, count in enumerate(counts) if count}
+
+    def top_words(self, count: int = 10) -> list[tuple[str, int]]:
+        if not len(self.word_counts):
+            return []
+        count = min(count, len(self.word_counts))
+        top = np.argpartition(-self.word_counts, count - 1)[:count]
+        top = top[np.lexsort((top, -self.word_counts[top]))]
+        return [(self.vocabulary[word_id], int(self.word_counts[word_id])) for word_id in top]
+
+    def square_heatmap(self, blanks: bool = False) -> np.ndarray:
+        """Games with a tile (or a blank) on each square, shaped like the board."""
+        heatmap = self.blank_heatmap if blanks else self.tile_heatmap
+        return heatmap.reshape(config.BOARD_HEIGHT, config.BOARD_WIDTH)
+
+    def summary(self, top: int = 10) -> dict:
+        return {
+            "games": len(self.games),
+            "moves": len(self.moves),
+            "words": len(self.words),
+            "average_score_per_turn": self.average_score_per_turn(),
+            "bingo_rate": self.bingo_rate(),
+            "challenge_success_rate": self.challenge_success_rate(),
+            "top_words": self.top_words(top),
+        }
+
+
+def find_game_files(paths: Iterable[Path | str]) -> list[Path]:
+    files = []
+    for path in map(Path, paths):
+        files.extend(sorted(path.rglob("*.json")) if path.is_dir() else [path])
+    return files
+
+
+def is_saved_game(data) -> bool:
+    return isinstance(data, dict) and "players" in data and "board" in data
+
+
+def iter_saved_games(path: Path | str) -> Iterator[tuple[str, dict]]:
+    with open(path, "r", encoding="utf8") as in_file:
+        data = json.load(in_file)
+    if is_saved_game(data):
+        yield str(path), data
+        return
+    for key, game in (data.items() if isinstance(data, dict) else ()):
+        if is_saved_game(game):
+            yield f"{path}:{key}", game
+
+
+def format_heatmap(heatmap: np.ndarray) -> str:
+    width = max(2, len(str(int(heatmap.max()))) if heatmap.size else 2)
+    header = "    " + " ".join(f"{chr(65 + col):>{width}}" for col in range(heatmap.shape[1]))
+    rows = [f"{row + 1:>3} " + " ".join(f"{int(count):>{width}}" for count in heatmap[row]) for row in range(heatmap.shape[0])]
+    return "\n".join([header] + rows)
+
+
+def stats_cli(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="Lexigrid stats", description="Statistics over saved games")
+    parser.add_argument("paths", nargs="+", help="saved game files or directories of them")
+    parser.add_argument("--top", type=int, default=10, help="how many of the most played words to list")
+    parser.add_argument("--json", action="store_true", help="print the summary and heatmap as JSON")
+    args = parser.parse_args(argv)
+
+    archive = GameArchive()
+    archive.add_files(args.paths)
+    summary = archive.summary(args.top)
+    if args.json:
+        print(json.dumps(summary | {"square_heatmap": archive.square_heatmap().tolist()}, indent=2))
+        return 0
+    print(f"{summary['games']} games, {summary['moves']} moves, {summary['words']} scored words")
+    print(f"Average score per turn: {summary['average_score_per_turn']:.2f}")
+    print(f"Bingo rate: {summary['bingo_rate']:.1%} of plays")
+    print(f"Challenge success rate: {summary['challenge_success_rate']:.1%}")
+    print("Most played words: " + ", ".join(f"{word} ({count})" for word, count in summary["top_words"]))
+    print("Games with a tile on each square:")
+    print(format_heatmap(archive.square_heatmap()))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(stats_cli())
@@ -0,0 +1,184 @@
+"""
+Replay scripted games without the console.
+
+A script is a text file of moves in the console syntax (see Move.parse_move_input),
+one per line. Moves are made by the player on turn unless prefixed with @name.
+Header lines set up the game:
+
+    #players alice bob      start a fresh game with these players
+    #load saved_game.json   continue a saved game instead
+
+A "#rack alice AEINRST" line anywhere in the script swaps that player's rack for
+those tiles from the bag, so a script does not depend on the random tile draw.
+Any other line starting with # is a comment.
+"""
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+import json
+import os
+from pathlib import Path
+import time
+from typing import Iterable
+
+from game_play.lexi_grid import LexiGrid
+from game_play.move_types import MoveOptions, MoveResult
+from game_play.player import Player
+from helper.text_output import suppress_output
+
+SCRIPT_SUFFIXES = (".txt", ".lgs")
+
+
+@dataclass
+class ScriptResult:
+    path: str
+    moves: int = 0
+    rejected: int = 0
+    ended: bool = False
+    scores: dict[str, int] = field(default_factory=dict)
+    errors: list[str] = field(default_factory=list)
+    seconds: float = 0.0
+
+
+def load_game_for_script(header: dict[str, str], base_dir: Path) -> LexiGrid:
+    if "load" in header:
+        load_path = Path(header["load"])
+        if not load_path.is_absolute():
+            load_path = base_dir / load_path
+        with open(load_path, "r", encoding="utf8") as in_file:
+            return LexiGrid.from_dict(json.load(in_file))
+    names = header.get("players", "").split()
+    if not names:
+        raise ValueError("Script needs a '#players' or '#load' header")
+    return LexiGrid([Player(name) for name in names])
+
+
+def set_rack(game: LexiGrid, directive: str):
+    tokens = directive.split()
+    if len(tokens) != 3:
+        raise ValueError(f"Expected '#rack <player> <letters>', got '{directive}'")
+    for player in game.players:
+        if player.is_player(tokens[1]):
+            game.replace_rack(player, list(tokens[2].upper()))
+            return
+    raise ValueError(f"Player not found: {tokens[1]}")
+
+
+def run_script_lines(game: LexiGrid, lines: Iterable[tuple[int, str]], result: ScriptResult):
+    for line_no, line in lines:
+        if line.startswith("#rack"):
+            try:
+                set_rack(game, line)
+            except ValueError as err:
+                result.errors.append(f"line {line_no}: {err}")
+            continue
+        player = game.players[game.current_player_idx]
+        if player.is_skip_next_turn:
+            skip = game.parse_move("pass", player)
+            skip.action = MoveOptions.SKIP
+            game.make_move(skip)
+        try:
+            move = game.parse_move(line)
+        except (ValueError, IndexError) as err:
+            result.errors.append(f"line {line_no}: {err}")
+            continue
+        if move.action == MoveOptions.SAVE:
+            # Scripts never write save files as a side effect
+            continue
+        result.moves += 1
+        try:
+            move_result = game.make_move(move)
+        except (ValueError, IndexError) as err:
+            result.errors.append(f"line {line_no}: {err}")
+            continue
+        if move_result == MoveResult.RETRY:
+            result.rejected += 1
+        elif move_result == MoveResult.END:
+            result.ended = True
+            break
+
+
+def run_script(path: Path | str) -> ScriptResult:
+    path = Path(path)
+    result = ScriptResult(path=str(path))
+    start = time.perf_counter()
+    header: dict[str, str] = {}
+    moves: list[tuple[int, str]] = []
+    try:
+        with open(path, "r", encoding="utf8") as script_file:
+            for line_no, raw_line in enumerate(script_file, start=1):
+                line = raw_line.strip()
+                if not line:
+                    continue
+                if line.startswith("#") and not line.startswith("#rack"):
+                    key, _, value = line[1:].partition(" ")
+                    if key in ("players", "load"):
+                        header[key] = value.strip()
+                    continue
+                moves.append((line_no, line))
+        with suppress_output():
+            game = load_game_for_script(header, path.parent)
+            run_script_lines(game, moves, result)
+        result.scores = {player.name: player.current_score for player in game.players}
+    except (OSError, ValueError) as err:
+        result.errors.append(str(err))
+    except Exception as err:
+        # Any other engine failure ends this script only; the rest of the batch still runs
+        result.errors.append(f"{type(err).__name__}: {err}")
+    result.seconds = time.perf_counter() - start
+    return result
+
+
+def find_scripts(paths: Iterable[Path | str]) -> list[Path]:
+    scripts = []
+    for path in map(Path, paths):
+        if path.is_dir():
+            scripts.extend(sorted(p for p in path.rglob("*") if p.suffix in SCRIPT_SUFFIXES))
+        else:
+            scripts.append(path)
+    return scripts
+
+
+def run_scripts(paths: Iterable[Path | str], max_workers: int | None = None) -> tuple[list[ScriptResult], float]:
+    scripts = find_scripts(paths)
+    start = time.perf_counter()
+    if max_workers == 1 or len(scripts) <= 1:
+        results = [run_script(script) for script in scripts]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(run_script, scripts, chunksize=max(1, len(scripts) // (4 * (os.cpu_count() or 1)))))
+    return results, time.perf_counter() - start
+
+
+def run_scripts_cli(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="Lexigrid script", description="Replay scripted games in parallel")
+    parser.add_argument("paths", nargs="+", help="script files or directories of scripts")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: one per core)")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args(argv)
+
+    results, wall_seconds = run_scripts(args.paths, args.workers)
+    total_moves = sum(result.moves for result in results)
+    summary = {
+        "games": len(results),
+        "moves": total_moves,
+        "failed_games": sum(1 for result in results if result.errors),
+        "wall_seconds": wall_seconds,
+        "moves_per_second": total_moves / wall_seconds if wall_seconds else 0.0,
+    }
+    if args.json:
+        print(json.dumps({"results": [asdict(result) for result in results], "summary": summary}, indent=2))
+    else:
+        for result in results:
+            scores = " ".join(f"{name}={score}" for name, score in result.scores.items())
+            status = "ended" if result.ended else "open"
+            print(f"{result.path}: {result.moves} moves, {result.rejected} rejected, {status}, {scores}")
+            for error in result.errors:
+                print(f"    {error}")
+        print(f"{summary['games']} games, {total_moves} moves in {wall_seconds:.3f}s "
+              f"({summary['moves_per_second']:.0f} moves/s)")
+    return 1 if summary["failed_games"] else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(run_scripts_cli())
@@ -0,0 +1,192 @@
+"""
+Bingo finder: the 7 and 8 letter words a full rack makes, on its own or through
+one letter already on the board, from a single lookup in a table on disk.
+
+Keys are sorted 7-letter racks packed into 64 bits (helper.generic.pack_rack).
+A 7-letter word is filed under its own letters and an 8-letter word under each
+7-letter rack inside it, tagged with the letter that has to be on the board.
+The file holds an open addressing hash table of the keys (linear probing, at most
+half full), the postings each slot points at and the words. It is memory-mapped,
+so a lookup reads one slot run and one run of postings however big the lexicon.
+
+    python entry_script.py bingo build bingos.bin
+    python entry_script.py bingo find bingos.bin AEINRST RETAIN?
+"""
+import argparse
+from array import array
+from itertools import combinations_with_replacement
+import mmap
+from pathlib import Path
+import struct
+import sys
+import time
+import tracemalloc
+from typing import Iterable
+
+from game_play.tile import BLANK_TILE
+from game_play.word_index import ALPHABET, BLANKS
+from helper.generic import RACK_LETTER_BITS, char_to_num, num_to_char, pack_rack
+
+MAGIC = b"LXBT"
+VERSION = 1
+BINGO_LENGTH = 7
+# magic, version, hash bits, slots, postings, words
+HEADER = struct.Struct("<4sHHIII12x")
+# packed rack, first posting, number of postings; a zero key is an empty slot
+SLOT = struct.Struct("<QIH2x")
+WORD = struct.Struct("<8s")
+# A posting is word id << 5 | board letter (1-26), or no letter (0) for a 7-letter word
+LETTER_MASK = (1 << RACK_LETTER_BITS) - 1
+FIBONACCI = 0x9E3779B97F4A7C15
+MASK_64 = (1 << 64) - 1
+
+
+def slot_for(key: int, bits: int) -> int:
+    return ((key * FIBONACCI) & MASK_64) >> (64 - bits)
+
+
+def bingo_postings(words: Iterable[str]) -> tuple[list[str], dict[int, list[int]]]:
+    """The sorted 7 and 8 letter words and packed rack -> postings."""
+    bingo_words = sorted({word.upper() for word in words if len(word) in (BINGO_LENGTH, BINGO_LENGTH + 1) and word.isalpha()})
+    postings: dict[int, list[int]] = {}
+    for word_id, word in enumerate(bingo_words):
+        if len(word) == BINGO_LENGTH:
+            postings.setdefault(pack_rack(word), []).append(word_id << RACK_LETTER_BITS)
+            continue
+        for letter in set(word):
+            rack = word.replace(letter, "", 1)
+            postings.setdefault(pack_rack(rack), []).append(word_id << RACK_LETTER_BITS | char_to_num(letter))
+    return bingo_words, postings
+
+
+def build_bingo_table(path: Path | str, words: Iterable[str], trace_memory: bool = False) -> dict[str, float]:
+    """Write the table to `path` and return its size and build numbers, with the peak memory if traced."""
+    start = time.perf_counter()
+    if trace_memory:
+        tracemalloc.start()
+    bingo_words, postings = bingo_postings(words)
+    bits = max(4, (2 * len(postings) - 1).bit_length())
+    slots = bytearray(SLOT.size << bits)
+    flat = array("I")
+    for key in sorted(postings):
+        slot = slot_for(key, bits)
+        while SLOT.unpack_from(slots, slot * SLOT.size)[0]:
+            slot = (slot + 1) & ((1 << bits) - 1)
+        SLOT.pack_into(slots, slot * SLOT.size, key, len(flat), len(postings[key]))
+        flat.extend(postings[key])
+    if sys.byteorder != "little":
+        flat.byteswap()
+    with open(path, "wb") as out_file:
+        out_file.write(HEADER.pack(MAGIC, VERSION, bits, 1 << bits, len(flat), len(bingo_words)))
+        out_file.write(slots)
+        out_file.write(flat.tobytes())
+        for word in bingo_words:
+            out_file.write(WORD.pack(word.encode("ascii")))
+    peak = None
+    if trace_memory:
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return {
+        "words": len(bingo_words),
+        "racks": len(postings),
+        "slots": 1 << bits,
+        "postings": len(flat),
+        "file_bytes": Path(path).stat().st_size,
+        "build_seconds": time.perf_counter() - start,
+        "peak_build_bytes": peak,
+    }
+
+
+class BingoTable:
+    def __init__(self, path: Path | str):
+        self._file = open(path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self.bits, self.num_slots, self.num_postings, self.num_words = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"{path} is not a version {VERSION} bingo table")
+        self._postings_offset = HEADER.size + self.num_slots * SLOT.size
+        self._words_offset = self._postings_offset + 4 * self.num_postings
+
+    def close(self):
+        if not self._map.closed:
+            self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _postings(self, rack: str) -> tuple[int, ...]:
+        key = pack_rack(rack)
+        slot = slot_for(key, self.bits)
+        while True:
+            slot_key, first, count = SLOT.unpack_from(self._map, HEADER.size + slot * SLOT.size)
+            if slot_key == key:
+                return struct.unpack_from(f"<{count}I", self._map, self._postings_offset + 4 * first)
+            if not slot_key:
+                return ()
+            slot = (slot + 1) & (self.num_slots - 1)
+
+    def word(self, word_id: int) -> str:
+        return WORD.unpack_from(self._map, self._words_offset + WORD.size * word_id)[0].rstrip(b"\0").decode("ascii")
+
+    def _racks(self, rack: str) -> Iterable[str]:
+        # Blanks are interchangeable, so each multiset of letters for them is looked up once:
+        # 26 lookups for one blank, 351 for two
+        rack = rack.upper()
+        fixed = "".join(letter for letter in rack if letter not in BLANKS and letter != BLANK_TILE)
+        return [fixed + "".join(letters) for letters in combinations_with_replacement(ALPHABET, len(rack) - len(fixed))]
+
+    def find(self, rack: str) -> tuple[list[str], dict[str, list[str]]]:
+        """(7-letter bingos, board letter -> 8-letter bingos through it) for a 7-tile rack; ? or * is a blank."""
+        if len(rack) != BINGO_LENGTH:
+            raise ValueError(f"A bingo rack has {BINGO_LENGTH} tiles, got {rack!r}")
+        sevens: set[str] = set()
+        eights: dict[str, set[str]] = {}
+        for letters in self._racks(rack):
+            for posting in self._postings(letters):
+                word = self.word(posting >> RACK_LETTER_BITS)
+                board_letter = posting & LETTER_MASK
+                if board_letter:
+                    eights.setdefault(num_to_char(board_letter), set()).add(word)
+                else:
+                    sevens.add(word)
+        return sorted(sevens), {letter: sorted(eights[letter]) for letter in sorted(eights)}
+
+
+def bingo_table_cli(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="Lexigrid bingo", description="Build or query the bingo table")
+    commands = parser.add_subparsers(dest="action", required=True)
+    build = commands.add_parser("build", help="build the table from the lexicon")
+    build.add_argument("path")
+    find = commands.add_parser("find", help="bingos for racks")
+    find.add_argument("path")
+    find.add_argument("racks", nargs="+", help="seven tiles each, ? for a blank")
+    args = parser.parse_args(argv)
+
+    if args.action == "build":
+        from game_play.dictionary import Dictionary
+        from helper.text_output import suppress_output
+
+        with suppress_output():
+            words = Dictionary().all_words
+        stats = build_bingo_table(args.path, words, trace_memory=True)
+        print(f"{stats['words']} words under {stats['racks']} racks in {stats['slots']} slots")
+        print(f"{stats['file_bytes'] / 2**20:.1f} MiB on disk, built in {stats['build_seconds']:.2f}s "
+              f"(slower for the memory tracing) with a {stats['peak_build_bytes'] / 2**20:.1f} MiB peak")
+        return 0
+    with BingoTable(args.path) as table:
+        for rack in args.racks:
+            start = time.perf_counter()
+            sevens, eights = table.find(rack)
+            elapsed_us = (time.perf_counter() - start) * 1e6
+            through = " ".join(f"{letter}:{','.join(words)}" for letter, words in eights.items())
+            print(f"{rack.upper()} ({elapsed_us:.0f} us): {' '.join(sevens) or '-'} | {through or '-'}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(bingo_table_cli())
@@ -1,8 +1,9 @@
 from typing import TYPE_CHECKING
 
 import config
+from game_play.board_renderer import BoardRenderer
 from game_play.tile import LexiGridTile
-from helper.text_output import center_colored_text
+from helper.text_output import plain_output_default
 
 if TYPE_CHECKING:
     from game_play.player import Player
@@ -11,26 +12,26 @@ class Board:
     def __init__(self):
         self.grid = [[LexiGridTile() for _ in range(config.BOARD_WIDTH)] for _ in range(config.BOARD_HEIGHT)]
         self._initialize_special_tiles()
+        self._renderers: dict[bool, BoardRenderer] = {}
     
     def _initialize_special_tiles(self):
         for bonus, positions in config.SPECIAL_SQUARES.items():
             for row, col in positions:
                 self.grid[row][col].bonus = bonus
     
-    def display(self):
-        def print_bar():
-            print("    " + "-----" * config.BOARD_WIDTH)
+    def renderer(self, plain: bool | None = None) -> BoardRenderer:
+        plain = plain_output_default() if plain is None else plain
+        renderer = self._renderers.get(plain)
+        if renderer is None:
+            renderer = self._renderers[plain] = BoardRenderer(plain)
+        return renderer
 
-        print("\n     " + "   ".join(f"{chr(65 + i):2}" for i in range(config.BOARD_WIDTH)))
-        print_bar()
+    def display(self, plain: bool | None = None):
+        # Without colours when plain is set, or by default when NO_COLOR is set
+        print(self.renderer(plain).render(self))
 
-        for i, row in enumerate(self.grid):
-            row_display = " | ".join(center_colored_text(str(tile), 2) for tile in row)
-            print(f"{i+1:2} | {row_display} |")
-            print_bar()
-
-    def place_tile(self, row: int, col: int, letter: str, player_name: str | None, turn: int):
-        return self.grid[row][col].place_tile(letter, player_name, turn)
+    def place_tile(self, row: int, col: int, letter: str, player_name: str | None, turn: int, is_blank: bool = False):
+        return self.grid[row][col].place_tile(letter, player_name, turn, is_blank)
     
     def get_tile(self, row: int, col: int) -> LexiGridTile:
         return self.grid[row][col]
@@ -44,7 +45,8 @@ class Board:
             "letter": tile.letter,
             "bonus": tile.bonus,
             "placed_by": tile.placed_by,
-            "turn_placed": tile.turn_placed
+            "turn_placed": tile.turn_placed,
+            "is_blank": tile.is_blank
         }
 
     def clear_letters(self):
@@ -63,10 +65,13 @@ class Board:
                 [tile.letter for tile in row] for row in self.grid
             ],
             "placed_by": [
-                [tile.placed_by for tile in row] for row in self.grid
+                [tile.placed_by_id for tile in row] for row in self.grid
             ],
             "turn_placed": [
                 [tile.turn_placed for tile in row] for row in self.grid
+            ],
+            "is_blank": [
+                [tile.is_blank for tile in row] for row in self.grid
             ]
         }}
 
@@ -84,13 +89,16 @@ class Board:
         grid_data = d.get("grid", {})
         if grid_data.get("board_width", 0) != config.BOARD_WIDTH or grid_data.get("board_height", 0) != config.BOARD_HEIGHT:
             raise ValueError("Config file does not conform with loaded board size.")
+        # Games saved before blank tiles existed have no is_blank grid
+        blanks = grid_data.get("is_blank") or [[False] * config.BOARD_WIDTH for _ in range(config.BOARD_HEIGHT)]
         for r in range(config.BOARD_HEIGHT):
             for c in range(config.BOARD_WIDTH):
                 tile_data = {
                     "bonus":        grid_data["bonuses"][r][c],
                     "letter":       grid_data["letteres"][r][c],
                     "placed_by":    grid_data["placed_by"][r][c],
-                    "turn_placed":  grid_data["turn_placed"][r][c]
+                    "turn_placed":  grid_data["turn_placed"][r][c],
+                    "is_blank":     blanks[r][c]
                 }
                 board.grid[r][c] = LexiGridTile.from_dict(tile_data, player_lookup)
         return board
@@ -0,0 +1,80 @@
+"""
+Text rendering of the board with cached cells and rows.
+
+A cell's text only depends on its letter, bonus and whether it is a blank, so rendered cells are shared
+by every renderer. Each renderer remembers the rows of its last frame and only
+re-renders rows whose squares changed. `redraw` goes one step further for
+terminals: it emits cursor movements that rewrite just the changed rows of a
+frame that is still on screen.
+"""
+from typing import TYPE_CHECKING
+
+import config
+from helper.text_output import center_colored_text
+
+if TYPE_CHECKING:
+    from game_play.board import Board
+    from game_play.tile import LexiGridTile
+
+CELL_WIDTH = 2
+
+
+class BoardRenderer:
+    # (letter, bonus, is_blank, plain) -> padded cell text
+    _cells: dict[tuple[str | None, str | None, bool, bool], str] = {}
+
+    def __init__(self, plain: bool = False):
+        self.plain = plain
+        self.header = "\n     " + "   ".join(f"{chr(65 + i):2}" for i in range(config.BOARD_WIDTH))
+        self.bar = "    " + "-----" * config.BOARD_WIDTH
+        self._row_keys: list[tuple | None] = [None] * config.BOARD_HEIGHT
+        self._rows: list[str] = [""] * config.BOARD_HEIGHT
+        self._frame_drawn = False
+
+    def cell(self, tile: "LexiGridTile") -> str:
+        key = (tile.letter, tile.bonus, tile.is_blank, self.plain)
+        text = self._cells.get(key)
+        if text is None:
+            if not self.plain:
+                raw = str(tile)
+            elif tile.letter:
+                # Blanks show in lower case, as on a score sheet
+                raw = tile.letter.lower() if tile.is_blank else tile.letter
+            else:
+                raw = tile.bonus or "_"
+            text = self._cells[key] = center_colored_text(raw, CELL_WIDTH)
+        return text
+
+    def update(self, board: "Board") -> list[int]:
+        """Re-render the rows that changed since the last call and return their indexes."""
+        changed = []
+        for i, row in enumerate(board.grid):
+            key = tuple([(tile.letter, tile.bonus, tile.is_blank) for tile in row])
+            if key != self._row_keys[i]:
+                self._row_keys[i] = key
+                self._rows[i] = f"{i+1:2} | " + " | ".join([self.cell(tile) for tile in row]) + " |"
+                changed.append(i)
+        return changed
+
+    def render(self, board: "Board") -> str:
+        self.update(board)
+        lines = [self.header, self.bar]
+        for row in self._rows:
+            lines.append(row)
+            lines.append(self.bar)
+        self._frame_drawn = True
+        return "\n".join(lines)
+
+    def redraw(self, board: "Board") -> str:
+        """
+        Output that brings the last rendered frame up to date, assuming the cursor is still
+        on the line below it. Plain mode and the first frame get a full render instead.
+        """
+        if self.plain or not self._frame_drawn:
+            return self.render(board) + "\n"
+        out = []
+        for i in self.update(board):
+            # Row i is 2 * (height - i) lines above the line below the frame
+            distance = 2 * (config.BOARD_HEIGHT - i)
+            out.append(f"\x1b[{distance}A\r{self._rows[i]}\x1b[K\x1b[{distance}B\r")
+        return "".join(out)
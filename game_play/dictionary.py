@@ -1,23 +1,64 @@
+import threading
+
+from game_play.hooks import HookTable
+from game_play.word_index import WordIndex
+
+
 class Dictionary:
     def __init__(self):
         self._all_words = None
+        self._index: WordIndex | None = None
+        self._hooks: HookTable | None = None
+        # One Dictionary is shared by the server's worker threads; each table is built once, by one of them
+        self._build_lock = threading.RLock()
     
     @property
     def all_words(self):
         if self._all_words is None:
-            print("Initializing Dictionary")
-            self._all_words = set()
-            with open("Collins Scrabble Words (2019).txt",  "r", encoding='utf8') as file:
-
-                file.readline()
-                file.readline()
-                for line in file:
-                    self._all_words.add(line.strip().capitalize())
+            with self._build_lock:
+                if self._all_words is None:
+                    print("Initializing Dictionary")
+                    all_words = set()
+                    with open("Collins Scrabble Words (2019).txt",  "r", encoding='utf8') as file:
+
+                        file.readline()
+                        file.readline()
+                        for line in file:
+                            all_words.add(line.strip().capitalize())
+                    self._all_words = all_words
         return self._all_words
     
+    @property
+    def index(self) -> WordIndex:
+        # Built on first use, a query needs it but a game usually does not
+        if self._index is None:
+            with self._build_lock:
+                if self._index is None:
+                    self._index = WordIndex(self.all_words)
+        return self._index
+
+    @property
+    def hooks(self) -> HookTable:
+        if self._hooks is None:
+            with self._build_lock:
+                if self._hooks is None:
+                    self._hooks = HookTable(self.all_words)
+        return self._hooks
+
+    def front_hooks(self, word: str) -> str:
+        return self.hooks.front_hooks(word)
+
+    def back_hooks(self, word: str) -> str:
+        return self.hooks.back_hooks(word)
+
     def check_word(self, word: str):
         return word.strip().capitalize() in self.all_words
 
+    def check_words(self, words) -> list[str]:
+        """The words that are not in the lexicon, each once, in the order given."""
+        all_words = self.all_words
+        return [word for word in dict.fromkeys(words) if word.strip().capitalize() not in all_words]
+
         
 if __name__ == "__main__":
     d = Dictionary()
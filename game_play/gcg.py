@@ -0,0 +1,429 @@
+"""
+Import and export of games in the GCG annotated-game format.
+
+Parsing is streaming: `iter_gcg` yields pragmas and events line by line so
+large archives never have to be held in memory. Replaying a record rebuilds
+every TurnScore through the LexiGrid engine and compares the running totals
+against the cumulative scores written in the file.
+"""
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from enum import Enum
+from pathlib import Path
+import re
+from typing import Iterable, Iterator, TextIO
+
+import config
+from game_play.lexi_grid import LexiGrid
+from game_play.move import Move
+from game_play.move_types import MoveOptions, WordPlay
+from game_play.player import Player
+from game_play.scoring import TurnScore
+from game_play.tile import BLANK_TILE, TileBag, split_blanks, tile_distribution
+from helper.generic import char_to_num
+from helper.text_output import suppress_output
+
+GCG_BLANK = "?"
+PLAYED_THROUGH = "."
+# GCG records standard games, which have two blanks even where the local distribution has none
+GCG_NUM_BLANKS = 2
+
+
+def gcg_word_to_notation(word: str) -> str:
+    # GCG writes a played blank as the lower case letter it stands for
+    return "".join(BLANK_TILE + letter.upper() if letter.islower() else letter for letter in word)
+
+
+def notation_to_gcg_word(word: str) -> str:
+    letters, is_blank = split_blanks(word)
+    return "".join(letter.lower() if blank else letter for letter, blank in zip(letters, is_blank))
+
+
+class GcgEventType(Enum):
+    PLAY = "play"
+    EXCHANGE = "exchange"
+    PASS = "pass"
+    WITHDRAWN = "withdrawn"          # phony taken back after a challenge: "--"
+    CHALLENGE_BONUS = "challenge"    # "(challenge)" bonus for a valid word
+    TIME_PENALTY = "time"            # "(time)" overtime penalty
+    END_RACK = "end_rack"            # "(RACK)" points for opponent's final rack
+
+
+@dataclass
+class GcgPlayer:
+    nick: str
+    name: str
+
+
+@dataclass
+class GcgEvent:
+    nick: str
+    rack: str
+    event_type: GcgEventType
+    score: int
+    cumulative: int
+    position: str | None = None
+    word: str | None = None
+    exchanged: str | None = None
+    line_no: int = 0
+
+    def to_word_play(self) -> WordPlay | None:
+        if self.event_type != GcgEventType.PLAY:
+            return None
+        return gcg_position_to_word_play(self.position, self.word)
+
+
+@dataclass
+class GcgRecord:
+    players: list[GcgPlayer] = field(default_factory=list)
+    events: list[GcgEvent] = field(default_factory=list)
+    pragmas: list[tuple[str, str]] = field(default_factory=list)
+
+
+@dataclass
+class GcgMismatch:
+    line_no: int
+    nick: str
+    expected: int
+    actual: int
+
+
+@dataclass
+class GcgImportResult:
+    path: str
+    players: list[str] = field(default_factory=list)
+    final_scores: list[int] = field(default_factory=list)
+    num_events: int = 0
+    mismatches: list[GcgMismatch] = field(default_factory=list)
+    error: str | None = None
+
+    @property
+    def is_consistent(self) -> bool:
+        return self.error is None and not self.mismatches
+
+
+EVENT_RE = re.compile(r"^>(?P<nick>[^:]+):\s*(?P<body>.*)$")
+SCORE_RE = re.compile(r"^(?P<score>[+-]\d+)\s+(?P<cumulative>-?\d+)$")
+ROW_FIRST_RE = re.compile(r"^(?P<row>\d+)(?P<col>[A-Za-z])$")
+COL_FIRST_RE = re.compile(r"^(?P<col>[A-Za-z])(?P<row>\d+)$")
+
+
+def gcg_position_to_word_play(position: str, word: str) -> WordPlay:
+    # GCG puts the row first for horizontal plays (8D) and the column first for vertical plays (D8)
+    if match := ROW_FIRST_RE.match(position):
+        direction = "H"
+    elif match := COL_FIRST_RE.match(position):
+        direction = "V"
+    else:
+        raise ValueError(f"Invalid GCG position: {position}")
+    return WordPlay(word, int(match["row"]), match["col"].lower(), direction)
+
+
+def word_play_to_gcg_position(word_play: WordPlay) -> str:
+    col = word_play.col.upper() if isinstance(word_play.col, str) else chr(64 + word_play.col)
+    if word_play.direction == "H":
+        return f"{word_play.row}{col}"
+    return f"{col}{word_play.row}"
+
+
+def parse_gcg_event(body: str, nick: str, line_no: int = 0) -> GcgEvent:
+    tokens = body.split()
+    if len(tokens) < 3:
+        raise ValueError(f"Line {line_no}: incomplete GCG event: {body}")
+    score_match = SCORE_RE.match(" ".join(tokens[-2:]))
+    if not score_match:
+        raise ValueError(f"Line {line_no}: missing score and cumulative score: {body}")
+    score = int(score_match["score"])
+    cumulative = int(score_match["cumulative"])
+    head = tokens[:-2]
+
+    # End of game rack points have no rack of their own: ">nick: (AEI) +6 350"
+    if len(head) == 1 and head[0].startswith("(") and head[0].endswith(")"):
+        return GcgEvent(nick, "", GcgEventType.END_RACK, score, cumulative,
+                        exchanged=head[0][1:-1], line_no=line_no)
+
+    rack, rest = head[0], head[1:]
+    event = GcgEvent(nick, rack, GcgEventType.PASS, score, cumulative, line_no=line_no)
+    if not rest or rest == ["-"]:
+        return event
+    if rest == ["--"]:
+        event.event_type = GcgEventType.WITHDRAWN
+    elif rest == ["(challenge)"]:
+        event.event_type = GcgEventType.CHALLENGE_BONUS
+    elif rest == ["(time)"]:
+        event.event_type = GcgEventType.TIME_PENALTY
+    elif len(rest) == 1 and rest[0].startswith("("):
+        event.event_type = GcgEventType.END_RACK
+        event.exchanged = rest[0].strip("()")
+    elif len(rest) == 1 and rest[0].startswith("-"):
+        event.event_type = GcgEventType.EXCHANGE
+        event.exchanged = rest[0][1:]
+    elif len(rest) == 2:
+        event.event_type = GcgEventType.PLAY
+        event.position, event.word = rest
+    else:
+        raise ValueError(f"Line {line_no}: can not parse GCG event: {body}")
+    return event
+
+
+def iter_gcg(lines: Iterable[str]) -> Iterator[GcgPlayer | GcgEvent | tuple[str, str]]:
+    """Yield players, events and other pragmas one line at a time."""
+    for line_no, raw_line in enumerate(lines, start=1):
+        line = raw_line.strip()
+        if not line:
+            continue
+        if line.startswith("#"):
+            key, _, value = line[1:].partition(" ")
+            if key in ("player1", "player2") or (key.startswith("player") and key[6:].isdigit()):
+                nick, _, name = value.strip().partition(" ")
+                yield GcgPlayer(nick, name.strip() or nick)
+            else:
+                yield (key, value.strip())
+        elif event_match := EVENT_RE.match(line):
+            yield parse_gcg_event(event_match["body"], event_match["nick"].strip(), line_no)
+        # Anything else is a continuation of a free text note and carries no game data
+
+
+def read_gcg(source: Path | str | TextIO) -> GcgRecord:
+    record = GcgRecord()
+    if isinstance(source, (str, Path)):
+        with open(source, "r", encoding="utf8") as gcg_file:
+            return read_gcg(gcg_file)
+    for item in iter_gcg(source):
+        if isinstance(item, GcgPlayer):
+            record.players.append(item)
+        elif isinstance(item, GcgEvent):
+            record.events.append(item)
+        else:
+            record.pragmas.append(item)
+    return record
+
+
+def format_gcg_event(event: GcgEvent) -> str:
+    score = f"{event.score:+d} {event.cumulative}"
+    if event.event_type == GcgEventType.PLAY:
+        action = f"{event.position} {event.word}"
+    elif event.event_type == GcgEventType.EXCHANGE:
+        action = f"-{event.exchanged}"
+    elif event.event_type == GcgEventType.PASS:
+        action = "-"
+    elif event.event_type == GcgEventType.WITHDRAWN:
+        action = "--"
+    elif event.event_type == GcgEventType.CHALLENGE_BONUS:
+        action = "(challenge)"
+    elif event.event_type == GcgEventType.TIME_PENALTY:
+        action = "(time)"
+    else:
+        return f">{event.nick}: ({event.exchanged}) {score}"
+    return f">{event.nick}: {event.rack} {action} {score}"
+
+
+def write_gcg(record: GcgRecord, out: TextIO):
+    out.write("#character-encoding UTF-8\n")
+    for i, player in enumerate(record.players, start=1):
+        out.write(f"#player{i} {player.nick} {player.name}\n")
+    for key, value in record.pragmas:
+        if key != "character-encoding":
+            out.write(f"#{key} {value}\n")
+    for event in record.events:
+        out.write(format_gcg_event(event) + "\n")
+
+
+def game_to_gcg(game: LexiGrid) -> GcgRecord:
+    """
+    Convert a game's move history to a GCG record.
+    Racks are not stored in the game history, so the tiles each move put down stand in for the rack.
+    """
+    record = GcgRecord(players=[GcgPlayer(p.email.replace(" ", "_"), p.name) for p in game.players])
+    nicks = {id(p): gp.nick for p, gp in zip(game.players, record.players)}
+    history_idx = {id(p): 0 for p in game.players}
+    totals = {id(p): 0 for p in game.players}
+
+    def next_score(player: Player) -> TurnScore | None:
+        idx = history_idx[id(player)]
+        if idx >= len(player.score_history):
+            return None
+        history_idx[id(player)] += 1
+        return player.score_history[idx]
+
+    # Squares covered by the plays exported so far, and each player's latest play in case it is withdrawn
+    covered: set[tuple[int, int]] = set()
+    last_play = {id(p): set() for p in game.players}
+
+    def held_tiles(move: Move) -> str:
+        # Letters on squares an earlier play covered are played through, not from the rack
+        letters, is_blank = split_blanks(move.word_play.word)
+        row = move.word_play.row - 1
+        col = char_to_num(move.word_play.col) - 1
+        placed = set()
+        held = []
+        for i, letter in enumerate(letters):
+            square = (row, col + i) if move.word_play.direction == "H" else (row + i, col)
+            if square not in covered:
+                placed.add(square)
+                held.append(GCG_BLANK if is_blank[i] else letter)
+        covered.update(placed)
+        last_play[id(move.player)] = placed
+        return "".join(held)
+
+    def add_event(player: Player, rack: str, event_type: GcgEventType, score: int, **kwargs):
+        totals[id(player)] += score
+        record.events.append(GcgEvent(nicks[id(player)], rack, event_type, score, totals[id(player)], **kwargs))
+
+    for move in game.previous_moves:
+        if move is None or move.player is None:
+            continue
+        player = move.player
+        if move.action == MoveOptions.PLAY and move.word_play is not None:
+            turn_score = next_score(player)
+            if turn_score is None:
+                continue
+            word = notation_to_gcg_word(move.word_play.word)
+            add_event(player, held_tiles(move), GcgEventType.PLAY, turn_score.total_score,
+                      position=word_play_to_gcg_position(move.word_play), word=word)
+        elif move.action == MoveOptions.EXCHANGE:
+            letters = "".join(move.exchange_letters).upper().replace(BLANK_TILE, GCG_BLANK)
+            add_event(player, letters, GcgEventType.EXCHANGE, 0, exchanged=letters)
+        elif move.action in (MoveOptions.PASS, MoveOptions.SKIP):
+            add_event(player, "", GcgEventType.PASS, 0)
+        elif move.action == MoveOptions.CHALLENGE and move.is_challenge_successful is not None:
+            challenger_score = next_score(player)
+            challenged = move.challenged_player
+            if move.is_challenge_successful and challenged is not None:
+                withdrawn_score = next_score(challenged)
+                covered.difference_update(last_play[id(challenged)])
+                if withdrawn_score is not None:
+                    add_event(challenged, "", GcgEventType.WITHDRAWN, withdrawn_score.total_score)
+            if challenger_score is not None and challenger_score.total_score:
+                add_event(player, "", GcgEventType.CHALLENGE_BONUS, challenger_score.total_score)
+    return record
+
+
+class GcgReplay:
+    """Replays a GcgRecord through a LexiGrid, checking each cumulative score."""
+
+    def __init__(self, record: GcgRecord, tile_bag: TileBag | None = None):
+        self.record = record
+        players = [Player(p.nick, p.name) for p in record.players]
+        # Racks are taken out of the game's bag, so the default bag holds the record's blanks too
+        if tile_bag is None:
+            distribution = tile_distribution()
+            tile_bag = TileBag(counts=distribution | {BLANK_TILE: distribution.get(BLANK_TILE, GCG_NUM_BLANKS)})
+        self.game = LexiGrid(players, tile_bag=tile_bag)
+        self.players_by_nick = {p.nick: player for p, player in zip(record.players, players)}
+        self.moves_made = {p.nick: 0 for p in record.players}
+        self.mismatches: list[GcgMismatch] = []
+
+    def _resolve_word(self, word_play: WordPlay) -> WordPlay:
+        # Played-through letters are written as "." or wrapped in brackets; the board supplies them
+        word = word_play.word.replace("(", "").replace(")", "")
+        row = word_play.row - 1
+        col = char_to_num(word_play.col) - 1
+        letters = []
+        for i, letter in enumerate(word):
+            if letter == PLAYED_THROUGH:
+                r, c = (row, col + i) if word_play.direction == "H" else (row + i, col)
+                if not (0 <= r < config.BOARD_HEIGHT and 0 <= c < config.BOARD_WIDTH):
+                    raise ValueError(f"Played through square off the board in {word_play.word}")
+                letter = self.game.board.get_letter(r, c) or letter
+            letters.append(letter)
+        return WordPlay("".join(letters), word_play.row, word_play.col, word_play.direction)
+
+    def _rack_for_play(self, rack: str) -> list[str]:
+        return [BLANK_TILE if letter == GCG_BLANK else letter for letter in rack.upper()]
+
+    def _start_move(self, player: Player):
+        self.game.current_player_idx = self.game.players.index(player)
+        self.game.turn = self.moves_made[player.email]
+        self.moves_made[player.email] += 1
+
+    def apply(self, event: GcgEvent):
+        player = self.players_by_nick.get(event.nick)
+        if player is None:
+            raise ValueError(f"Line {event.line_no}: unknown player {event.nick}")
+
+        if event.event_type == GcgEventType.PLAY:
+            self._start_move(player)
+            word_play = self._resolve_word(event.to_word_play())
+            self.game.replace_rack(player, self._rack_for_play(event.rack))
+            move = Move(default_player=player)
+            move.action = MoveOptions.PLAY
+            move.word_play = WordPlay(gcg_word_to_notation(word_play.word), word_play.row, word_play.col, word_play.direction)
+            move.set_turn(self.game.turn)
+            self.game.previous_moves.append(move)
+            if not self.game.place_word(move):
+                raise ValueError(f"Line {event.line_no}: engine rejected {event.position} {event.word}")
+        elif event.event_type == GcgEventType.WITHDRAWN:
+            prev_score = player.score_history[-1] if player.score_history else None
+            if prev_score is None:
+                raise ValueError(f"Line {event.line_no}: nothing to withdraw for {event.nick}")
+            self.game.return_letters(prev_player=player, prev_turn=prev_score.turn)
+            player.add_score(TurnScore(
+                move_action=MoveOptions.CHALLENGE,
+                turn=prev_score.turn,
+                is_challenger=False,
+                is_challenge_successful=True,
+                prev_move_score=prev_score.total_score
+            ))
+        elif event.event_type in (GcgEventType.EXCHANGE, GcgEventType.PASS):
+            self._start_move(player)
+            action = MoveOptions.EXCHANGE if event.event_type == GcgEventType.EXCHANGE else MoveOptions.PASS
+            player.add_score(TurnScore(action, self.game.turn))
+        else:
+            # Challenge bonuses, time penalties and end of game rack points are not engine rules,
+            # so the recorded adjustment is taken as is
+            adjustment = TurnScore(MoveOptions.PASS, self.game.turn)
+            adjustment.total_score = event.score
+            player.add_score(adjustment)
+
+        if player.current_score != event.cumulative:
+            self.mismatches.append(GcgMismatch(event.line_no, event.nick, event.cumulative, player.current_score))
+
+    def run(self) -> LexiGrid:
+        with suppress_output():
+            for event in self.record.events:
+                self.apply(event)
+        return self.game
+
+
+def replay_gcg(record: GcgRecord, tile_bag: TileBag | None = None) -> tuple[LexiGrid, list[GcgMismatch]]:
+    replay = GcgReplay(record, tile_bag)
+    game = replay.run()
+    return game, replay.mismatches
+
+
+def import_gcg_file(path: Path | str) -> GcgImportResult:
+    result = GcgImportResult(path=str(path))
+    try:
+        record = read_gcg(path)
+        result.players = [p.nick for p in record.players]
+        result.num_events = len(record.events)
+        game, result.mismatches = replay_gcg(record)
+        result.final_scores = [p.current_score for p in game.players]
+    except (OSError, ValueError, KeyError, IndexError) as err:
+        result.error = str(err)
+    return result
+
+
+def import_gcg_files(paths: Iterable[Path | str], max_workers: int | None = None, chunksize: int = 64) -> Iterator[GcgImportResult]:
+    """Replay many GCG files across a process pool, yielding results in input order."""
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        yield from executor.map(import_gcg_file, paths, chunksize=chunksize)
+
+
+def find_gcg_files(directory: Path | str) -> Iterator[Path]:
+    yield from sorted(Path(directory).rglob("*.gcg"))
+
+
+if __name__ == "__main__":
+    import sys
+
+    gcg_paths = []
+    for arg in sys.argv[1:]:
+        gcg_paths.extend(find_gcg_files(arg) if Path(arg).is_dir() else [Path(arg)])
+    consistent = 0
+    for res in import_gcg_files(gcg_paths):
+        consistent += res.is_consistent
+        if not res.is_consistent:
+            print(f"{res.path}: {res.error or f'{len(res.mismatches)} score mismatches'}")
+    print(f"{consistent}/{len(gcg_paths)} games replayed with matching scores")
@@ -0,0 +1,53 @@
+"""
+Front and back hooks: the single letters that can go before or after a word to
+make another word (CAT takes S at the back and S at the front: CATS, SCAT).
+
+The table keeps one int per hookable word, front hooks in bits 0-25 and back
+hooks in bits 26-51, and is built in a single pass over the lexicon.
+"""
+from typing import Iterable
+
+from game_play.word_index import ALPHABET, LETTER_BITS
+
+BACK_SHIFT = 26
+FRONT_MASK = (1 << BACK_SHIFT) - 1
+
+
+def mask_letters(mask: int) -> str:
+    return "".join(letter for letter in ALPHABET if mask & LETTER_BITS[letter])
+
+
+class HookTable:
+    def __init__(self, words: Iterable[str]):
+        lexicon = {word.upper() for word in words}
+        self.masks: dict[str, int] = {}
+        for word in lexicon:
+            if len(word) < 2:
+                continue
+            # word = letter + shorter: front hook of shorter; shorter + letter: back hook
+            front_of, back_of = word[1:], word[:-1]
+            if front_of in lexicon:
+                self.masks[front_of] = self.masks.get(front_of, 0) | LETTER_BITS[word[0]]
+            if back_of in lexicon:
+                self.masks[back_of] = self.masks.get(back_of, 0) | (LETTER_BITS[word[-1]] << BACK_SHIFT)
+
+    def __len__(self):
+        return len(self.masks)
+
+    def front_mask(self, word: str) -> int:
+        return self.masks.get(word.upper(), 0) & FRONT_MASK
+
+    def back_mask(self, word: str) -> int:
+        return self.masks.get(word.upper(), 0) >> BACK_SHIFT
+
+    def front_hooks(self, word: str) -> str:
+        return mask_letters(self.front_mask(word))
+
+    def back_hooks(self, word: str) -> str:
+        return mask_letters(self.back_mask(word))
+
+    def takes_front_hook(self, word: str, letter: str) -> bool:
+        return bool(self.front_mask(word) & LETTER_BITS.get(letter.upper(), 0))
+
+    def takes_back_hook(self, word: str, letter: str) -> bool:
+        return bool(self.back_mask(word) & LETTER_BITS.get(letter.upper(), 0))
@@ -0,0 +1,71 @@
+"""
+Saved records that are only turned into objects when something reads them.
+
+A resumed game needs its board and racks straight away, but rarely more than the
+last entry of a score history or move list. LazyRecords keeps each saved entry as
+its dict until that entry is first read, and saving writes the untouched dicts back
+as they are.
+"""
+from collections.abc import MutableSequence
+from typing import Any, Callable, Iterable
+
+
+class LazyRecords(MutableSequence):
+    __slots__ = ("_items", "_decode", "_raw")
+
+    def __init__(self, raw: Iterable[Any], decode: Callable[[dict], Any]):
+        self._items = list(raw)
+        self._decode = decode
+        self._raw = sum(isinstance(item, dict) for item in self._items)
+
+    @property
+    def num_raw(self) -> int:
+        """Entries still held as saved dicts."""
+        return self._raw
+
+    def _materialize(self, index: int):
+        item = self._items[index]
+        if isinstance(item, dict):
+            item = self._items[index] = self._decode(item)
+            self._raw -= 1
+        return item
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._materialize(i) for i in range(*index.indices(len(self._items)))]
+        return self._materialize(index)
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            raise TypeError("LazyRecords does not support slice assignment")
+        self._raw -= isinstance(self._items[index], dict)
+        self._items[index] = value
+
+    def __delitem__(self, index):
+        removed = self._items[index] if isinstance(index, slice) else [self._items[index]]
+        self._raw -= sum(isinstance(item, dict) for item in removed)
+        del self._items[index]
+
+    def __len__(self):
+        return len(self._items)
+
+    def __iter__(self):
+        for index in range(len(self._items)):
+            yield self._materialize(index)
+
+    def insert(self, index, value):
+        self._items.insert(index, value)
+        self._raw += isinstance(value, dict)
+
+    def to_dicts(self) -> list:
+        return [item if isinstance(item, dict) or item is None else item.to_dict() for item in self._items]
+
+    def __repr__(self):
+        return f"LazyRecords({len(self._items)} records, {self._raw} not loaded)"
+
+
+def records_to_dicts(records: Iterable[Any]) -> list:
+    """to_dict of every record, keeping None entries; saved dicts of a LazyRecords are passed through."""
+    if isinstance(records, LazyRecords):
+        return records.to_dicts()
+    return [record.to_dict() if record is not None else None for record in records]
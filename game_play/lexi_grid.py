@@ -1,4 +1,4 @@
-from collections import defaultdict
+from collections import Counter, defaultdict
 from dataclasses import dataclass
 import json
 from pathlib import Path
@@ -8,37 +8,58 @@ from typing import Optional, Tuple
 
 import config
 from game_play.board import Board
+from game_play.lazy_records import LazyRecords, records_to_dicts
 from game_play.player import Player
 from game_play.scoring import TurnScore
-from game_play.tile import LexiGridTile, TileBag
+from game_play.tile import LexiGridTile, TileBag, split_blanks
 from game_play.word import PlayedWord, ScoredWord
 from game_play.dictionary import Dictionary
 from game_play.move import Move
 from game_play.move_types import MoveOptions, MoveResult
+from game_play.timing import NULL_PHASE, PhaseTimer, PhaseTimings, is_timing_enabled
+from game_play.unseen import UnseenTracker
 from helper.generic import char_to_num, two_d_to_one_d_coordinate
 from helper.text_output import center_colored_text
 
+MOVE_PHASES = {action: f"make_move.{action.name.lower()}" for action in MoveOptions}
+
 class LexiGrid:
     def __init__(
         self,
         players: list[Player],
         shuffle_players: bool = False,
         debug: bool = False,
-
+        dictionary: Dictionary | None = None,
+        seed: int | None = None,
+        auto_validate: bool = False,
+        tile_bag: TileBag | None = None,
+        exchange_returns_first: bool = False,
     ):
+        # One seed fixes the bag, the player order and anything else random in the game
+        self.seed: int = seed if seed is not None else random.randrange(2**32)
+        self.rng = random.Random(self.seed)
         self.board = Board()
-        self.tile_bag = TileBag()
-        self.dictionary = Dictionary()
-        self.players: list[Player] = players if not shuffle_players else random.shuffle(players)
-        Move.players = self.players  # Set class variable for Move
+        bag_seed = self.rng.randrange(2**32)
+        self.tile_bag = tile_bag if tile_bag is not None else TileBag(seed=bag_seed)
+        self.dictionary = dictionary if dictionary is not None else Dictionary()
+        if shuffle_players:
+            players = list(players)
+            self.rng.shuffle(players)
+        self.players: list[Player] = players
         self.num_players = len(self.players)
         self.turn = 0
         self.current_player_idx = 0
         self.previous_moves: list[Move | None] = []
         self.last_turn_score: TurnScore | None = None
+        # Rule mode: reject plays forming words outside the lexicon instead of waiting for a challenge
+        self.auto_validate = auto_validate
+        # Rule mode: exchanged tiles go back in the bag before the replacements are drawn
+        self.exchange_returns_first = exchange_returns_first
+        self.timings: PhaseTimings | None = PhaseTimings() if is_timing_enabled() else None
         
         for player in self.players:
             player.refill_rack(self.tile_bag)
+        self.unseen = UnseenTracker(self.players)
 
     
     @classmethod
@@ -70,6 +91,24 @@ class LexiGrid:
             elif auto_refill:
                 player.refill_rack(g.tile_bag)
 
+    def enable_timing(self):
+        if self.timings is None:
+            self.timings = PhaseTimings()
+
+    def phase(self, name: str) -> PhaseTimer:
+        # Shared no-op when timing is off, so instrumented code pays one call
+        if self.timings is None:
+            return NULL_PHASE
+        return PhaseTimer(self.timings, name)
+
+    def parse_move(self, user_input: str, player: Player | None = None) -> Move:
+        if player is None:
+            player = self.players[self.current_player_idx]
+        with self.phase("parse_move"):
+            move = Move(user_input, default_player=player, players=self.players)
+        move.set_turn(self.turn)
+        return move
+
     def pass_turn(self) -> MoveResult:
         self.next_turn()
         self.print_scores()
@@ -83,6 +122,55 @@ class LexiGrid:
         player = self.players[self.current_player_idx]
         self.last_turn_score = None
 
+        with self.phase("place_word.validate"):
+            if not self.is_valid_placement(played_word):
+                return False
+
+        with self.phase("place_word.print_tiles"):
+            played_word.display_played_word_info()
+
+        with self.phase("place_word.rack_check"):
+            correct_tiles, is_bingo = player.does_player_have_correct_tiles(played_word)
+        if not correct_tiles:
+            print(f"❌ {player.name} does not have the correct letters in their rack: {played_word.needed_tiles_str_format()}")
+            return False
+
+        with self.phase("place_word.place_tiles"):
+            for i, (row, col, letter, is_placed_letter) in enumerate(played_word.iterate_word_positions_and_is_played()):
+                if is_placed_letter:
+                    if not self.board.place_tile(row, col, letter, player.name, self.turn, played_word.is_blank[i]):
+                        raise Exception("Placing letter overtop of another!")
+
+        with self.phase("place_word.score"):
+            turn_score = self.score_turn(played_word, is_bingo)
+        if self.auto_validate:
+            with self.phase("place_word.validate_words"):
+                turn_score.invalid_words = self.dictionary.check_words(
+                    [scored_word.word for scored_word in turn_score.scored_words.values()]
+                )
+            if turn_score.invalid_words:
+                for row, col, _, is_placed_letter in played_word.iterate_word_positions_and_is_played():
+                    if is_placed_letter:
+                        self.board.get_tile(row, col).clear()
+                print(f"❌ Not valid: {', '.join(turn_score.invalid_words)}")
+                return False
+        with self.phase("place_word.apply_score"):
+            self.apply_turn_score(player, turn_score)
+        with self.phase("place_word.refill"):
+            placed_letters = played_word.needed_tiles_str_format()
+            player.use_rack_letters(placed_letters)
+            self.unseen.tiles_placed(player, list(placed_letters))
+            move.drawn_tiles = player.refill_rack(self.tile_bag)
+            self.unseen.tiles_drawn(player, move.drawn_tiles)
+        
+        placed_turn = self.turn
+        self.next_turn()
+        with self.phase("place_word.print"):
+            print(f"✅ Word '{played_word.word}' placed at ({row}, {col}) going {'horizontal' if played_word.is_horizontal else 'vertical'} by {player} (Turn {placed_turn})")
+            self.print_scores()
+        return True
+
+    def is_valid_placement(self, played_word: PlayedWord) -> bool:
         center_row = config.BOARD_HEIGHT // 2
         center_col = config.BOARD_WIDTH // 2
         if self.board.get_tile(center_row, center_col).letter is None and not any(
@@ -119,24 +207,6 @@ class LexiGrid:
             if not touches_existing:
                 print("❌ Word must connect to existing tiles.")
                 return False
-        
-        played_word.display_played_word_info()
-
-        correct_tiles, is_bingo = player.does_player_have_correct_tiles(played_word)
-        if not correct_tiles:
-            print(f"❌ {player.name} does not have the correct letters in their rack: {played_word.needed_tiles_str_format()}")
-            return False
-
-        for row, col, letter, is_placed_letter in played_word.iterate_word_positions_and_is_played():
-            if is_placed_letter:
-                if not self.board.place_tile(row, col, letter, player.name, self.turn):
-                    raise Exception("Placing letter overtop of another!")
-
-        self.calculate_score(player, played_word, is_bingo)
-        
-        print(f"✅ Word '{played_word.word}' placed at ({row}, {col}) going {'horizontal' if played_word.is_horizontal else 'vertical'} by {player} (Turn {self.turn})")
-        self.next_turn()
-        self.print_scores()
         return True
 
     def next_turn(self):
@@ -161,16 +231,24 @@ class LexiGrid:
         start_row = row
         
         word_to_score = ""
+        blanks = []
         while (row < config.BOARD_HEIGHT and col < config.BOARD_WIDTH and self.board.get_tile(row, col).letter is not None):
-            word_to_score += self.board.get_tile(row, col).letter
+            tile = self.board.get_tile(row, col)
+            if tile.is_blank:
+                blanks.append(len(word_to_score))
+            word_to_score += tile.letter
             row, col = (row, col + 1) if is_horizontal else (row + 1, col)
 
         if len(word_to_score) > 1:
-            return ScoredWord(word_to_score, start_row, start_col, is_horizontal, bonuses)
+            return ScoredWord(word_to_score, start_row, start_col, is_horizontal, bonuses, blanks)
         return None
 
 
     def calculate_score(self, player: Player, played_word: PlayedWord, is_bingo: int):
+        self.apply_turn_score(player, self.score_turn(played_word, is_bingo))
+
+    def score_turn(self, played_word: PlayedWord, is_bingo: int) -> TurnScore:
+        """Score the words formed by tiles already on the board, without crediting anyone."""
         turn_bonuses = self.get_turn_bonuses(played_word)
         turn_score = TurnScore(MoveOptions.PLAY, turn=self.turn)
         
@@ -184,7 +262,9 @@ class LexiGrid:
                                                                 not played_word.is_horizontal,
                                                                 turn_bonuses))
         turn_score.apply_bingo_bonus(is_bingo)
+        return turn_score
 
+    def apply_turn_score(self, player: Player, turn_score: TurnScore):
         player.add_score(turn_score)
         self.last_turn_score = turn_score
         turn_score.print_score_summary()
@@ -200,22 +280,63 @@ class LexiGrid:
 
     def load_board_state(self, state, placed_by=None, turn=None, empty_char="."):
         self.board.load_state(state, placed_by=placed_by, turn=turn, empty_char=empty_char)
+        self.unseen.rebuild(self.board)
+
+    def replace_rack(self, player: Player, letters: list[str]):
+        """
+        Swap a player's rack for these tiles. The old tiles go back in the bag and the new ones come out
+        of it; a tile only another rack holds is taken from there, and that player draws a replacement.
+        """
+        others = [other for other in self.players if other is not player]
+        in_bag = Counter(self.tile_bag.counts) + Counter(player.rack)
+        from_racks = Counter(letters) - in_bag
+        missing = from_racks - sum((Counter(other.rack) for other in others), Counter())
+        if missing:
+            raise ValueError(f"Not in the bag or on another rack: {''.join(sorted(missing.elements()))}")
+        self.tile_bag.return_tiles(player.rack)
+        self.tile_bag.take_tiles(list((Counter(letters) - from_racks).elements()))
+        player.rack = list(letters)
+        for other in others:
+            taken = False
+            for letter in other.rack[:]:
+                if from_racks[letter] > 0:
+                    other.rack.remove(letter)
+                    from_racks[letter] -= 1
+                    taken = True
+            if taken:
+                other.refill_rack(self.tile_bag)
+        self.unseen.rebuild(self.board)
 
     def export_board_state(self, empty_char="."):
         return self.board.export_state(empty_char=empty_char)
 
-    def display_board(self):
-        self.board.display()
+    def display_board(self, plain: bool | None = None):
+        self.board.display(plain)
 
     def resolve_challenge(self, prev_move) -> bool | None:
         if prev_move.action != MoveOptions.PLAY:
             print(f"Cannot challenge a non-play move! The last move was a {prev_move.action}.")
             return None
         
-        prev_word = prev_move.word_play.word
-        challenge_result = not self.dictionary.check_word(prev_word)
-        print(f"{prev_word} is {'not ' if challenge_result else ''}a valid word")
-        return challenge_result
+        invalid_words = self.get_invalid_words(prev_move)
+        if invalid_words:
+            print(f"Not valid: {', '.join(invalid_words)}")
+        else:
+            print("Every word formed is valid")
+        return bool(invalid_words)
+
+    def get_invalid_words(self, prev_move: Move) -> list[str]:
+        # Every word the play formed, cross words included, checked in one lexicon call.
+        # The verdict is kept on the turn's score so later challenges reuse it.
+        history = prev_move.player.score_history
+        turn_score = history[-1] if history else None
+        if turn_score is None or turn_score.move_action != MoveOptions.PLAY or not turn_score.scored_words:
+            return self.dictionary.check_words([split_blanks(prev_move.word_play.word)[0]])
+        if turn_score.invalid_words is None:
+            turn_score.invalid_words = self.dictionary.check_words(
+                [scored_word.word for scored_word in turn_score.scored_words.values()]
+            )
+        return turn_score.invalid_words
     
     def get_prev_turn_and_idx(self):
         return (self.turn + (-1 if self.current_player_idx == 0 else 0), 
@@ -227,19 +348,19 @@ class LexiGrid:
         for r in range(config.BOARD_HEIGHT):
             for c in range(config.BOARD_WIDTH):
                 tile = self.board.get_tile(r, c)
-                if tile.letter is not None and tile.placed_by == prev_player and tile.turn_placed == prev_turn:
-                    returned_letters.append(tile.letter)
-                    tile.letter = None
-                    tile.placed_by = None
-                    tile.turn_placed = None
+                if tile.letter is not None and tile.placed_by in (prev_player, prev_player.name) and tile.turn_placed == prev_turn:
+                    returned_letters.append(tile.rack_letter)
+                    tile.clear()
 
         if returned_letters:
             prev_player.rack.extend(returned_letters)
+        return returned_letters
 
 
     def make_challenge(self, move: Move) -> MoveResult:
         prev_move = self.previous_moves[-2] # we already added the current move to this list, so we need to go 2 back
-        is_challenge_successful: bool | None = self.resolve_challenge(prev_move)
+        with self.phase("make_challenge.dictionary"):
+            is_challenge_successful: bool | None = self.resolve_challenge(prev_move)
         if is_challenge_successful is None:
             return MoveResult.RETRY
         prev_player = prev_move.player 
@@ -256,7 +377,14 @@ class LexiGrid:
         if not prev_score:
             raise Exception(f"Missing {prev_player.name}'s last score")
         
-        self.return_letters(prev_player=prev_player, prev_turn=prev_score.turn)
+        with self.phase("make_challenge.revert"):
+            lifted_letters = self.return_letters(prev_player=prev_player, prev_turn=prev_score.turn)
+            self.unseen.tiles_lifted(prev_player, lifted_letters)
+            # The tiles drawn after the withdrawn play go back in the bag
+            if prev_move.drawn_tiles and prev_player.does_player_have_letters(prev_move.drawn_tiles):
+                prev_player.use_rack_letters(prev_move.drawn_tiles)
+                self.tile_bag.return_tiles(prev_move.drawn_tiles)
+                self.unseen.tiles_returned(prev_player, prev_move.drawn_tiles)
         
         prev_player.add_score(TurnScore(
             move_action=MoveOptions.CHALLENGE,
@@ -273,21 +401,34 @@ class LexiGrid:
             prev_move_score=prev_score.total_score
         ))
         
-        print(f"✅ Challenge successful. Reverted {prev_player.name}'s last move.")
-
-        self.print_scores()
+        with self.phase("make_challenge.print"):
+            print(f"✅ Challenge successful. Reverted {prev_player.name}'s last move.")
+            self.print_scores()
         return MoveResult.NEXT
 
-    def exchange_letters(self, move: Move):
+    def exchange_letters(self, move: Move) -> MoveResult:
+        try:
+            new_letters = self.tile_bag.exchange(move.exchange_letters, return_first=self.exchange_returns_first)
+        except ValueError as err:
+            print(f"❌ {err}")
+            self.previous_moves.pop()
+            return MoveResult.RETRY
         move.player.use_rack_letters(move.exchange_letters)
-        new_letters = move.player.refill_rack(self.tile_bag)
+        move.player.rack.extend(new_letters)
+        self.unseen.tiles_returned(move.player, move.exchange_letters)
+        self.unseen.tiles_drawn(move.player, new_letters)
         ex_let = ', '.join([a.upper() for a in move.exchange_letters])
         nl = ", ".join([a for a in new_letters])
         print(f"{move.player.name} exchanged {ex_let} for {nl}")
         print(move.player)
         self.next_turn()
+        return MoveResult.NEXT
         
     def make_move(self, move: Move) -> MoveResult:
+        with self.phase(MOVE_PHASES[move.action]):
+            return self._make_move(move)
+
+    def _make_move(self, move: Move) -> MoveResult:
         if move.action != MoveOptions.SAVE:
             self.previous_moves.append(move)
         player_name =  self.players[self.current_player_idx].name
@@ -318,6 +459,7 @@ class LexiGrid:
         if move.action == MoveOptions.PLAY and move.word_play is not None:
             if not self.place_word(move):
                 print("❌ Invalid move. Try again.")
+                self.previous_moves.pop()  # a rejected play is not part of the history and can not be challenged
                 return MoveResult.RETRY
 
             if self.tile_bag.is_empty() and all(len(p.rack) == 0 for p in self.players):
@@ -331,41 +473,57 @@ class LexiGrid:
     def save_game(self, file_path: Path | None ):
         if not file_path:
             file_path = "saved_game.json"
-        with open(file_path, "w", encoding="utf8") as save_file:
-            save_file.write(json.dumps(self.to_dict()))
+        with self.phase("save_game.serialize"):
+            data = json.dumps(self.to_dict())
+        with self.phase("save_game.write"):
+            with open(file_path, "w", encoding="utf8") as save_file:
+                save_file.write(data)
         print(f"File saved to {file_path}")
 
     def to_dict(self):
         return {
+            "seed": self.seed,
+            "auto_validate": self.auto_validate,
+            "exchange_returns_first": self.exchange_returns_first,
             "players": [player.to_dict() for player in self.players],
             "board": self.board.to_dict(),
             "tile_bag": self.tile_bag.to_dict(),
             "turn": self.turn,
             "current_player_idx": self.current_player_idx,
-            "previous_moves": [
-                move.to_dict() if move is not None else None
-                for move in self.previous_moves
-            ],
+            "previous_moves": records_to_dicts(self.previous_moves),
             "last_turn_score": self.last_turn_score.to_dict() if self.last_turn_score else None
         }
 
     @classmethod
-    def from_dict(self, d: dict):
-        players = [Player.from_dict(p) for p in d.get("players", [])]
+    def from_dict(self, d: dict, dictionary: Dictionary | None = None, lazy: bool = False):
+        """With `lazy`, score histories and moves stay as saved dicts until first read (see LazyRecords),
+        so resuming a game only builds its board and racks."""
+        players = [Player.from_dict(p, lazy=lazy) for p in d.get("players", [])]
         game = LexiGrid.__new__(LexiGrid)
+        game.seed = d.get("seed", None)
+        if game.seed is None:
+            game.seed = random.randrange(2**32)
+        game.rng = random.Random(game.seed)
+        game.auto_validate = d.get("auto_validate", False)
+        game.exchange_returns_first = d.get("exchange_returns_first", False)
         game.board = Board.from_dict(d.get("board", {}), players=players)
         game.tile_bag = TileBag.from_dict(d.get("tile_bag", {}))
-        game.dictionary = Dictionary()
+        game.dictionary = dictionary if dictionary is not None else Dictionary()
         game.players = players
-        Move.players = players
+        game.unseen = UnseenTracker(players)
+        game.unseen.rebuild(game.board)
         game.num_players = len(players)
         game.turn = d.get("turn", 0)
         game.current_player_idx = d.get("current_player_idx", 0)
-        game.previous_moves = []
-        for item in d.get("previous_moves", []):
-            game.previous_moves.append(Move.from_dict(item, players) if item else None)
+        if lazy:
+            game.previous_moves = LazyRecords(d.get("previous_moves", []), lambda item: Move.from_dict(item, players))
+        else:
+            game.previous_moves = []
+            for item in d.get("previous_moves", []):
+                game.previous_moves.append(Move.from_dict(item, players) if item else None)
         last_turn_score = d.get("last_turn_score", None)
         game.last_turn_score = TurnScore.from_dict(last_turn_score) if last_turn_score else None
+        game.timings = PhaseTimings() if is_timing_enabled() else None
         return game
 
 if __name__ == "__main__":
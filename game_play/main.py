@@ -1,3 +1,4 @@
+import argparse
 import json
 from pathlib import Path
 import sys
@@ -7,7 +8,7 @@ from game_play.move_types import MoveOptions
 from game_play.player import Player
 import config
 
-def get_player_input(player: Player) -> Move:
+def get_player_input(game: LexiGrid, player: Player) -> Move:
         print(f"{player.name}'s rack: ")
         print(" ".join([a for a in player.rack]))
         user_input = input(
@@ -25,13 +26,13 @@ def get_player_input(player: Player) -> Move:
                 "5. END - End the game.\n"
                 "6. SAVE <FILE_NAME> - Saves the game\n"
                 )
-            return get_player_input(player)
+            return get_player_input(game, player)
         else:
             try:
-                return Move(user_input, default_player=player)
+                return game.parse_move(user_input, player)
             except ValueError as ve:
                 print(f"Invalid move input: {ve}. Please try again.")
-                return get_player_input(player)
+                return get_player_input(game, player)
 
 def is_int(input: str):
     try:
@@ -58,8 +59,9 @@ def get_initial_input() -> LexiGrid:
             return LexiGrid.from_dict(json.loads(text))
 
 
-def play_game():
+def play_game(argv: list[str] | None = None):
     """Runs the LexiGrid game loop."""
+    argparse.ArgumentParser(prog="Lexigrid play", description="Play LexiGrid in the terminal").parse_args(argv)
     game = get_initial_input()
 
     while True:
@@ -72,7 +74,7 @@ def play_game():
         print("\n🔹 Current Board:")
         game.display_board()
 
-        move = get_player_input(player)
+        move = get_player_input(game, player)
         move.set_turn(game.turn)
 
         if (move.action == MoveOptions.END):
@@ -0,0 +1,233 @@
+"""
+Memory accounting for games and lexicons.
+
+`game_memory_breakdown` reports deep sizes per component of a LexiGrid. Objects
+reachable from several components (players are referenced by board tiles and
+moves) are counted once, under the first component that reaches them, so the
+components add up to the game total. The lexicon is reported separately because
+games normally share one Dictionary.
+
+`GrowthTracer` wraps tracemalloc snapshots to show where memory grows between
+two points of a game's lifetime.
+
+`archive_memory` loads a large archive (the games of a corpus over and over) and
+reports what the loaded games keep alive, per game and per kind of record.
+
+    python entry_script.py memory saved_game.json [--turns 20] [--json]
+    python entry_script.py memory benchmarks/position_corpus.json --archive 10000
+"""
+import argparse
+from enum import Enum
+import json
+import sys
+import tracemalloc
+from types import BuiltinFunctionType, FunctionType, MethodType, ModuleType
+
+from game_play.dictionary import Dictionary
+from game_play.lexi_grid import LexiGrid
+from helper.text_output import suppress_output
+
+# Shared singletons and code, never owned by a game
+_SKIPPED_TYPES = (type, ModuleType, FunctionType, BuiltinFunctionType, MethodType, Enum)
+
+
+def deep_sizeof(obj, seen: set[int] | None = None) -> int:
+    """Size of `obj` and everything it references that is not already in `seen`."""
+    seen = seen if seen is not None else set()
+    size = 0
+    stack = [obj]
+    while stack:
+        current = stack.pop()
+        if id(current) in seen or isinstance(current, _SKIPPED_TYPES):
+            continue
+        seen.add(id(current))
+        size += sys.getsizeof(current)
+        if isinstance(current, dict):
+            stack.extend(current.keys())
+            stack.extend(current.values())
+        elif isinstance(current, (list, tuple, set, frozenset)):
+            stack.extend(current)
+        elif isinstance(current, (str, bytes, int, float, bool)) or current is None:
+            continue
+        else:
+            if hasattr(current, "__dict__"):
+                stack.append(current.__dict__)
+            for slot in getattr(type(current), "__slots__", ()):
+                if hasattr(current, slot):
+                    stack.append(getattr(current, slot))
+    return size
+
+
+def game_memory_breakdown(game: LexiGrid, include_dictionary: bool = False) -> dict[str, int]:
+    seen: set[int] = set()
+    if not include_dictionary:
+        seen.add(id(game.dictionary))
+    score_histories = [player.score_history for player in game.players]
+    scored_words = [
+        word for history in score_histories for turn_score in history for word in turn_score.scored_words.values()
+    ]
+    breakdown = {
+        # Bonus dicts first, so they are reported on their own rather than inside score_history
+        "scored_word_bonuses": deep_sizeof([word.bonuses for word in scored_words], seen),
+        "score_history": deep_sizeof(score_histories, seen),
+        "players": deep_sizeof(game.players, seen),
+        "board": deep_sizeof(game.board, seen),
+        "previous_moves": deep_sizeof(game.previous_moves, seen),
+        "last_turn_score": deep_sizeof(game.last_turn_score, seen),
+        "tile_bag": deep_sizeof(game.tile_bag, seen),
+        "unseen": deep_sizeof(game.unseen, seen),
+    }
+    breakdown["other"] = deep_sizeof(game, seen)
+    breakdown["total"] = sum(breakdown.values())
+    if include_dictionary:
+        breakdown["dictionary"] = dictionary_size(game.dictionary)
+    return breakdown
+
+
+def dictionary_size(dictionary: Dictionary) -> int:
+    with suppress_output():
+        dictionary.all_words
+    return deep_sizeof(dictionary)
+
+
+class GrowthTracer:
+    """Named tracemalloc snapshots and the top allocation differences between them."""
+    def __init__(self, frames: int = 1):
+        self.frames = frames
+        self.snapshots: dict[str, tracemalloc.Snapshot] = {}
+        self._started_here = False
+
+    def start(self):
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+            self._started_here = True
+
+    def stop(self):
+        if self._started_here:
+            tracemalloc.stop()
+            self._started_here = False
+
+    def checkpoint(self, label: str):
+        self.snapshots[label] = tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+        ))
+
+    def growth(self, start: str, end: str, limit: int = 10) -> list[dict]:
+        stats = self.snapshots[end].compare_to(self.snapshots[start], "lineno")
+        return [
+            {
+                "location": f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}",
+                "size_diff": stat.size_diff,
+                "count_diff": stat.count_diff,
+            }
+            for stat in stats[:limit]
+        ]
+
+    def total_growth(self, start: str, end: str) -> int:
+        return sum(stat.size_diff for stat in self.snapshots[end].compare_to(self.snapshots[start], "filename"))
+
+
+def trace_game_growth(game: LexiGrid, turns: int, limit: int = 10) -> dict:
+    """Self-play `turns` bot turns from the game's position and report where memory grew."""
+    from game_play.position_corpus import play_bot_turn
+    from game_play.move_types import MoveResult
+
+    index = game.dictionary.index
+    tracer = GrowthTracer()
+    tracer.start()
+    try:
+        tracer.checkpoint("start")
+        played = 0
+        with suppress_output():
+            for _ in range(turns):
+                played += 1
+                if play_bot_turn(game, index) == MoveResult.END:
+                    break
+        tracer.checkpoint("end")
+        return {
+            "turns": played,
+            "total_growth": tracer.total_growth("start", "end"),
+            "top_growth": tracer.growth("start", "end", limit),
+        }
+    finally:
+        tracer.stop()
+
+
+def archive_memory(games: list[dict], num_games: int = 10_000, dictionary: Dictionary | None = None) -> dict:
+    """Load `num_games` games, cycling through `games`, and measure the memory they hold between them."""
+    dictionary = dictionary if dictionary is not None else Dictionary()
+    tracer = GrowthTracer()
+    tracer.start()
+    try:
+        tracer.checkpoint("empty")
+        loaded = [LexiGrid.from_dict(games[i % len(games)], dictionary=dictionary) for i in range(num_games)]
+        tracer.checkpoint("loaded")
+        total = tracer.total_growth("empty", "loaded")
+    finally:
+        tracer.stop()
+    histories = [turn_score for game in loaded for player in game.players for turn_score in player.score_history]
+    counts = {
+        "games": len(loaded),
+        "moves": sum(len(game.previous_moves) for game in loaded),
+        "turn_scores": len(histories),
+        "scored_words": sum(len(turn_score.scored_words) for turn_score in histories),
+        "tiles": sum(len(row) for game in loaded for row in game.board.grid),
+    }
+    # Deep sizes of the first loaded game, by component, as an example of where the bytes go
+    sample = game_memory_breakdown(loaded[0])
+    return {"counts": counts, "total": total, "per_game": total / max(1, len(loaded)), "sample_game": sample}
+
+
+def format_bytes(size: int) -> str:
+    for unit in ("B", "KiB", "MiB"):
+        if abs(size) < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GiB"
+
+
+def memory_report_cli(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="Lexigrid memory", description="Memory breakdown of a saved game")
+    parser.add_argument("path", help="saved game JSON file")
+    parser.add_argument("--dictionary", action="store_true", help="also load and size the lexicon")
+    parser.add_argument("--turns", type=int, default=0, help="self-play this many turns and trace memory growth")
+    parser.add_argument("--archive", type=int, default=0, help="load this many games from the file (a corpus or one game) and measure them")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args(argv)
+
+    if args.archive:
+        from game_play.analytics import iter_saved_games
+
+        with suppress_output():
+            report = archive_memory([game for _, game in iter_saved_games(args.path)], args.archive)
+        if args.json:
+            print(json.dumps(report, indent=2))
+            return 0
+        print(" ".join(f"{count} {name.replace('_', ' ')}" for name, count in report["counts"].items()))
+        print(f"Traced: {format_bytes(report['total'])} in all, {format_bytes(report['per_game'])} per game")
+        return 0
+
+    with open(args.path, "r", encoding="utf8") as in_file:
+        game = LexiGrid.from_dict(json.load(in_file))
+    report = {"components": game_memory_breakdown(game, include_dictionary=args.dictionary)}
+    if args.turns:
+        report["growth"] = trace_game_growth(game, args.turns)
+        report["components_after"] = game_memory_breakdown(game)
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return 0
+    for name, size in report["components"].items():
+        print(f"{name:<22} {format_bytes(size):>12}")
+    if "growth" in report:
+        growth = report["growth"]
+        print(f"\nAfter {growth['turns']} turns: {format_bytes(report['components_after']['total'])} "
+              f"(traced growth {format_bytes(growth['total_growth'])})")
+        for stat in growth["top_growth"]:
+            print(f"  {format_bytes(stat['size_diff']):>12} {stat['count_diff']:>+7} {stat['location']}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(memory_report_cli())
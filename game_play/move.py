@@ -2,15 +2,20 @@
 from pathlib import Path
 from game_play.player import Player
 from game_play.move_types import WordPlay, MoveOptions
+from game_play.move_parser import parse_command, parse_word_play
 
 class Move:
-    players: list[Player] = []
+    __slots__ = ("players", "player", "action", "word_play", "exchange_letters", "drawn_tiles",
+                 "challenged_player", "is_challenge_successful", "output_loc", "turn")
 
-    def __init__(self, user_input: str = "", default_player: Player | None = None):
+    def __init__(self, user_input: str = "", default_player: Player | None = None, players: list[Player] | None = None):
+        # Roster used to resolve "@name" prefixes; each game passes its own
+        self.players: list[Player] = players if players is not None else []
         self.player: Player = default_player
         self.action: MoveOptions = None
         self.word_play: WordPlay | None = None
         self.exchange_letters: list[str] = []
+        self.drawn_tiles: list[str] = []  # tiles drawn to refill the rack after this move
         self.challenged_player: Player | None = None
         self.is_challenge_successful: bool | None = None
         self.output_loc: Path | None = None
@@ -30,67 +35,28 @@ class Move:
     def set_word_play(self, tokens: list[str]) -> WordPlay | None:
         if self.action != MoveOptions.PLAY:
             return None
-        if len(tokens) == 3:
-            word , col_row, direction = tokens
-            col = col_row[0]
-            row = col_row[1]
-        elif len(tokens) == 4:
-            word, row, col, direction = tokens
-        row = int(row)
-        if direction in ["right", "r", "horizontal", "h"]:
-            direction = "H"
-        elif direction in ["down", "d", "vertical", "v"]:
-            direction = "V"
-        else:
-            raise ValueError(f"Invalid direction: {direction}, must be H or V")
-        self.word_play = WordPlay(word, row, col, direction)
+        self.word_play = parse_word_play(tokens)
+        return self.word_play
             
     def parse_move_input(self, user_input: str):
-        tokens = user_input.strip().lower().split()
+        parsed = parse_command(user_input)
 
-        if (tokens[0][0] == "@"):
-            player = self.get_player_from_str(tokens[0][1:])
+        if parsed.player_name is not None:
+            player = self.get_player_from_str(parsed.player_name)
             if player is None:
-                raise ValueError(f"Player not found: ")
-            tokens = tokens[1:]
+                raise ValueError(f"Player not found: {parsed.player_name}")
         else:
             player = self.player
         
         if player is None:
-            raise ValueError(f"Unknown player: {tokens[0]}")
-        
-        if not tokens:
-            raise ValueError("Empty input")
+            raise ValueError(f"Unknown player: {parsed.player_name}")
         
-        action_token = tokens[0]
-        if action_token in ["end", "exit", "quit", "q"]:
-            self.action = MoveOptions.END
-        # even though skip is different action, we treat it as pass here
-        # Skipping is something that happens to you, passing is something you choose to do
-        elif action_token in ["pass", "ps", "skip", "skipturn"]: 
-            self.action = MoveOptions.PASS
-        elif action_token in ["challenge", "ch", "chalenge"]:
-            self.action = MoveOptions.CHALLENGE
-        elif action_token in ["save", "s", "svae","saev"]:
-            if len(tokens) > 1:
-                self.output_loc = tokens[1]
-            self.action = MoveOptions.SAVE
-        elif action_token in ["exchange", "ex"]:
-            self.action = MoveOptions.EXCHANGE
-            if len(tokens) < 2:
-                raise ValueError("No letters provided for exchange")
-            else:
-                for token in tokens[1:]:
-                    for letter in token:
-                        if letter.isalpha() or token == '*':
-                            self.exchange_letters.append(letter.upper())
-                if not self.player.does_player_have_letters(self.exchange_letters):
-                    raise ValueError(f"Player does not have the letters to exchange this: {self.exchange_letters}")
-        elif action_token in ["play", "pl", "paly"]:
-            self.action = MoveOptions.PLAY
-            self.set_word_play(tokens[1:])
-        else:
-            raise ValueError(f"Program can not parse the input: {user_input} {action_token} {tokens}")
+        self.action = parsed.action
+        self.word_play = parsed.word_play
+        self.exchange_letters = parsed.exchange_letters
+        self.output_loc = parsed.output_loc
+        if self.action == MoveOptions.EXCHANGE and not self.player.does_player_have_letters(self.exchange_letters):
+            raise ValueError(f"Player does not have the letters to exchange this: {self.exchange_letters}")
         if self.action != MoveOptions.CHALLENGE and self.player != player:
             raise ValueError(f"Player mismatch: move player {player.name} does not match default player {self.player.name}")
 
@@ -123,7 +89,7 @@ class Move:
                     return p
             return None
 
-        move = Move()
+        move = Move(players=players)
         move.player = resolve_player(d.get("player_email", None))
         action = d.get("action", None)
         move.action = MoveOptions(action) if action else None
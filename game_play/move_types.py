@@ -1,7 +1,7 @@
 from enum import Enum, auto
 from dataclasses import dataclass
 
-@dataclass
+@dataclass(slots=True)
 class WordPlay:
     word: str
     row: int
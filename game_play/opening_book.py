@@ -0,0 +1,405 @@
+"""
+Opening book: the best first move for every full rack, computed offline.
+
+The first play only has to cover the centre square, so its best placement depends
+on nothing but the rack. The builder solves every distinct rack the tile
+distribution allows, across a process pool, and writes one fixed-size record per
+rack to a flat file. Racks are numbered by their rank as a multiset over the
+book's alphabet, so a lookup is a rank computation and one read from the
+memory-mapped file.
+
+Each record holds two plays: the highest scoring one, and the one with the best
+equity, which adds a value for the tiles left on the rack (LEAVE_VALUES).
+
+    python entry_script.py opening build opening_book.bin [--workers N]
+    python entry_script.py opening lookup opening_book.bin AEINRS*
+
+A build writes to <path>.partial and lists finished chunks in <path>.progress;
+running it again after an interruption only does the chunks that are missing.
+"""
+import argparse
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from math import comb
+import mmap
+import os
+from pathlib import Path
+import struct
+import time
+from typing import Iterable
+
+import config
+from game_play.scoring import TurnScore
+from game_play.tile import BLANK_TILE, join_blanks, tile_distribution
+from game_play.word_index import WordIndex, rack_subsets
+
+MAGIC = b"LXOB"
+VERSION = 1
+# magic, version, rack size, alphabet length, alphabet
+HEADER = struct.Struct("<4sHHH32s22x")
+# top word, start column, score; equity word, start column, score, equity in tenths.
+# Words are NUL padded with blanks in lower case, an empty word means no play.
+RECORD = struct.Struct("<7sBH7sBHh")
+CHUNK_SIZE = 20_000
+
+# Rough single tile leave values, in points
+LEAVE_VALUES = {
+    BLANK_TILE: 25.0, "S": 7.5, "E": 4.0, "X": 3.5, "Z": 3.0, "R": 1.5, "A": 1.0, "H": 1.0,
+    "N": 0.5, "D": 0.0, "C": -0.5, "I": -0.5, "L": -0.5, "M": -0.5, "T": -0.5, "P": -1.0,
+    "K": -1.5, "O": -1.5, "B": -2.0, "F": -2.0, "G": -2.5, "J": -2.5, "Y": -2.5, "W": -4.0,
+    "U": -4.5, "V": -6.5, "Q": -11.5,
+}
+DUPLICATE_PENALTY = -3.0  # for each tile that repeats one already in the leave
+
+
+def leave_value(leave: Iterable[str]) -> float:
+    leave = list(leave)
+    return sum(LEAVE_VALUES.get(tile, 0.0) for tile in leave) + DUPLICATE_PENALTY * (len(leave) - len(set(leave)))
+
+
+def rack_rank(indexes: list[int]) -> int:
+    """Colex rank of a sorted multiset of alphabet indexes."""
+    return sum(comb(index + i, i + 1) for i, index in enumerate(indexes))
+
+
+def rack_unrank(rank: int, alphabet_size: int, rack_size: int) -> list[int]:
+    indexes = [0] * rack_size
+    upper = alphabet_size + rack_size - 2
+    for i in range(rack_size - 1, -1, -1):
+        while comb(upper, i + 1) > rank:
+            upper -= 1
+        rank -= comb(upper, i + 1)
+        indexes[i] = upper - i
+        upper -= 1
+    return indexes
+
+
+def num_racks(alphabet_size: int, rack_size: int) -> int:
+    return comb(alphabet_size + rack_size - 1, rack_size)
+
+
+@dataclass
+class OpeningPlay:
+    word: str  # play notation, "C*AT"
+    row: int
+    col: int
+    is_horizontal: bool
+    score: int
+    equity: float | None  # only kept for the best equity play
+
+
+class OpeningSolver:
+    """Best first plays for a rack, along the centre row."""
+
+    def __init__(self, index: WordIndex):
+        self.index = index
+        self.row = config.BOARD_HEIGHT // 2
+        self.center = config.BOARD_WIDTH // 2
+        bonuses = [None] * config.BOARD_WIDTH
+        for bonus, positions in config.SPECIAL_SQUARES.items():
+            for row, col in positions:
+                if row == self.row:
+                    bonuses[col] = bonus
+        self.letter_multipliers = [{"DL": 2, "TL": 3}.get(bonus, 1) for bonus in bonuses]
+        self.word_multipliers = [{"DW": 2, "*": 2, "TW": 3}.get(bonus, 1) for bonus in bonuses]
+        self._by_signature: dict[str, tuple[int, str, int] | None] = {}
+        self._with_blanks: dict[tuple[str, int], tuple[int, str, int] | None] = {}
+
+    def place(self, word: str, letters: str | None = None) -> tuple[int, str, int] | None:
+        """Best (score, notation, start column) for `word`, made from `letters` plus blanks when given."""
+        length = len(word)
+        designated = Counter(word) - Counter(letters) if letters is not None else Counter()
+        best = None
+        for col in range(max(0, self.center - length + 1), min(self.center, config.BOARD_WIDTH - length) + 1):
+            is_blank = [False] * length
+            for letter, count in designated.items():
+                # Blanks go where the letter would have counted least
+                positions = sorted((self.letter_multipliers[col + i], i) for i, l in enumerate(word) if l == letter)
+                for _, i in positions[:count]:
+                    is_blank[i] = True
+            letter_sum = 0
+            word_multiplier = 1
+            for i, letter in enumerate(word):
+                if not is_blank[i]:
+                    letter_sum += config.LETTER_SCORES[letter] * self.letter_multipliers[col + i]
+                word_multiplier *= self.word_multipliers[col + i]
+            score = letter_sum * word_multiplier + (TurnScore.BINGO_BONUS if length == config.RACK_SIZE else 0)
+            if best is None or score > best[0]:
+                best = (score, join_blanks(word, is_blank), col)
+        return best
+
+    def best_word(self, letters: str, blanks: int) -> tuple[int, str, int] | None:
+        """Best play of a word using exactly these sorted letters and `blanks` blanks."""
+        if not blanks:
+            words = self.index.by_signature.get(letters)
+            if words is None:
+                return None
+            if letters not in self._by_signature:
+                best = None
+                for word in words:
+                    play = self.place(word)
+                    if play is not None and (best is None or play[0] > best[0]):
+                        best = play
+                self._by_signature[letters] = best
+            return self._by_signature[letters]
+        key = (letters, blanks)
+        if key not in self._with_blanks:
+            if len(self._with_blanks) > 500_000:
+                self._with_blanks.clear()
+            best = None
+            for signature in sorted(self.index.signatures_with_blanks(letters, blanks)):
+                for word in self.index.by_signature[signature]:
+                    play = self.place(word, letters)
+                    if play is not None and (best is None or play[0] > best[0]):
+                        best = play
+            self._with_blanks[key] = best
+        return self._with_blanks[key]
+
+    def best_plays(self, rack: str) -> tuple[OpeningPlay | None, OpeningPlay | None]:
+        """(highest scoring play, best equity play) for a rack."""
+        blanks = rack.count(BLANK_TILE)
+        fixed = [tile for tile in rack if tile != BLANK_TILE]
+        rack_counts = Counter(rack)
+        top = best_equity = None
+        for subset in rack_subsets(fixed) + [""]:
+            for num_blanks in range(blanks + 1):
+                if len(subset) + num_blanks < 2:
+                    continue
+                found = self.best_word(subset, num_blanks)
+                if found is None:
+                    continue
+                score, word, col = found
+                leave = rack_counts - Counter(subset) - Counter({BLANK_TILE: num_blanks})
+                equity = score + leave_value(leave.elements())
+                play = OpeningPlay(word, self.row, col, True, score, equity)
+                if top is None or score > top.score:
+                    top = play
+                if best_equity is None or equity > best_equity.equity:
+                    best_equity = play
+        return top, best_equity
+
+
+def _pack_word(word: str) -> bytes:
+    letters = []
+    pending_blank = False
+    for letter in word:
+        if letter == BLANK_TILE:
+            pending_blank = True
+            continue
+        letters.append(letter.lower() if pending_blank else letter)
+        pending_blank = False
+    return "".join(letters).encode("ascii")
+
+
+def _unpack_word(raw: bytes) -> str:
+    word = raw.rstrip(b"\0").decode("ascii")
+    return "".join(BLANK_TILE + letter.upper() if letter.islower() else letter for letter in word)
+
+
+def pack_record(top: OpeningPlay | None, best_equity: OpeningPlay | None) -> bytes:
+    if top is None:
+        return bytes(RECORD.size)
+    return RECORD.pack(
+        _pack_word(top.word), top.col, top.score,
+        _pack_word(best_equity.word), best_equity.col, best_equity.score, round(best_equity.equity * 10),
+    )
+
+
+def unpack_record(raw: bytes, row: int) -> tuple[OpeningPlay, OpeningPlay] | None:
+    top_word, top_col, top_score, equity_word, equity_col, equity_score, equity = RECORD.unpack(raw)
+    if not top_word.rstrip(b"\0"):
+        return None
+    return (
+        OpeningPlay(_unpack_word(top_word), row, top_col, True, top_score, None),
+        OpeningPlay(_unpack_word(equity_word), row, equity_col, True, equity_score, equity / 10),
+    )
+
+
+def make_header(alphabet: str) -> bytes:
+    return HEADER.pack(MAGIC, VERSION, config.RACK_SIZE, len(alphabet), alphabet.encode("ascii"))
+
+
+# --- Building -------------------------------------------------------------
+
+_solver: OpeningSolver | None = None
+_alphabet: str = ""
+_counts: list[int] = []
+
+
+def _init_worker(words: list[str], distribution: dict[str, int]):
+    global _solver, _alphabet, _counts
+    _solver = OpeningSolver(WordIndex(words))
+    _alphabet = "".join(sorted(distribution))
+    _counts = [distribution[tile] for tile in _alphabet]
+
+
+def _build_chunk(start: int, end: int) -> bytes:
+    records = bytearray()
+    empty = bytes(RECORD.size)
+    for rank in range(start, end):
+        indexes = rack_unrank(rank, len(_alphabet), config.RACK_SIZE)
+        counts = Counter(indexes)
+        if any(count > _counts[index] for index, count in counts.items()):
+            records += empty  # not a rack this distribution can deal
+            continue
+        records += pack_record(*_solver.best_plays("".join(_alphabet[index] for index in indexes)))
+    return bytes(records)
+
+
+def build_opening_book(
+    path: Path | str,
+    words: Iterable[str] | None = None,
+    distribution: dict[str, int] | None = None,
+    workers: int | None = None,
+    chunk_size: int = CHUNK_SIZE,
+    max_chunks: int | None = None,
+) -> bool:
+    """Build or resume the book at `path`. Returns True once every chunk is done."""
+    path = Path(path)
+    distribution = distribution if distribution is not None else tile_distribution()
+    if words is None:
+        from game_play.dictionary import Dictionary
+        words = Dictionary().all_words
+    words = sorted(words)
+    alphabet = "".join(sorted(distribution))
+    header = make_header(alphabet)
+    total = num_racks(len(alphabet), config.RACK_SIZE)
+    partial = path.with_name(path.name + ".partial")
+    progress = path.with_name(path.name + ".progress")
+
+    done = set()
+    if partial.exists() and progress.exists():
+        with open(partial, "rb") as in_file:
+            if in_file.read(HEADER.size) == header:
+                done = {int(line) for line in progress.read_text().split()}
+    if not done:
+        with open(partial, "wb") as out_file:
+            out_file.write(header)
+            out_file.truncate(HEADER.size + total * RECORD.size)
+        progress.write_text("")
+
+    num_chunks = -(-total // chunk_size)
+    pending = [chunk for chunk in range(num_chunks) if chunk not in done]
+    if max_chunks is not None:
+        pending = pending[:max_chunks]
+    print(f"{total} racks in {num_chunks} chunks, {len(done)} done, {len(pending)} to build")
+
+    start_time = time.perf_counter()
+    with open(partial, "r+b") as out_file, open(progress, "a") as progress_file:
+        def write_chunk(chunk: int, records: bytes):
+            out_file.seek(HEADER.size + chunk * chunk_size * RECORD.size)
+            out_file.write(records)
+            out_file.flush()
+            progress_file.write(f"{chunk}\n")
+            progress_file.flush()
+            done.add(chunk)
+            print(f"chunk {chunk} done, {len(done)}/{num_chunks} after {time.perf_counter() - start_time:.0f}s")
+
+        bounds = {chunk: (chunk * chunk_size, min(total, (chunk + 1) * chunk_size)) for chunk in pending}
+        if workers == 1:
+            _init_worker(words, distribution)
+            for chunk in pending:
+                write_chunk(chunk, _build_chunk(*bounds[chunk]))
+        elif pending:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(words, distribution)) as executor:
+                futures = {executor.submit(_build_chunk, *bounds[chunk]): chunk for chunk in pending}
+                for future in as_completed(futures):
+                    write_chunk(futures[future], future.result())
+
+    if len(done) < num_chunks:
+        return False
+    os.replace(partial, path)
+    progress.unlink()
+    return True
+
+
+# --- Lookup ---------------------------------------------------------------
+
+class OpeningBook:
+    def __init__(self, path: Path | str):
+        self._file = open(path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, rack_size, alphabet_size, alphabet = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"{path} is not a version {VERSION} opening book")
+        if rack_size != config.RACK_SIZE:
+            self.close()
+            raise ValueError(f"{path} was built for racks of {rack_size}, not {config.RACK_SIZE}")
+        self.alphabet = alphabet[:alphabet_size].decode("ascii")
+        self._positions = {tile: i for i, tile in enumerate(self.alphabet)}
+        self.row = config.BOARD_HEIGHT // 2
+
+    def close(self):
+        if not self._map.closed:
+            self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return num_racks(len(self.alphabet), config.RACK_SIZE)
+
+    def rank(self, rack: Iterable[str]) -> int | None:
+        indexes = []
+        for tile in rack:
+            index = self._positions.get(tile.upper())
+            if index is None:
+                return None
+            indexes.append(index)
+        if len(indexes) != config.RACK_SIZE:
+            return None
+        return rack_rank(sorted(indexes))
+
+    def lookup(self, rack: Iterable[str]) -> tuple[OpeningPlay, OpeningPlay] | None:
+        """(highest scoring play, best equity play), or None when the book has no play for the rack."""
+        rank = self.rank(rack)
+        if rank is None:
+            return None
+        offset = HEADER.size + rank * RECORD.size
+        return unpack_record(self._map[offset:offset + RECORD.size], self.row)
+
+    def best_play(self, rack: Iterable[str], by_equity: bool = True) -> OpeningPlay | None:
+        plays = self.lookup(rack)
+        if plays is None:
+            return None
+        return plays[1] if by_equity else plays[0]
+
+
+def opening_book_cli(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="Lexigrid opening", description="Build or query the opening book")
+    commands = parser.add_subparsers(dest="action", required=True)
+    build = commands.add_parser("build", help="build the book, or resume an interrupted build")
+    build.add_argument("path")
+    build.add_argument("--workers", type=int, default=None, help="worker processes (default: one per core)")
+    build.add_argument("--chunk-size", type=int, default=CHUNK_SIZE, help="racks per chunk of work")
+    build.add_argument("--max-chunks", type=int, default=None, help="stop after this many chunks, to build over several runs")
+    lookup = commands.add_parser("lookup", help="best openings for racks")
+    lookup.add_argument("path")
+    lookup.add_argument("racks", nargs="+", help=f"seven tiles each, {BLANK_TILE} for a blank")
+    args = parser.parse_args(argv)
+
+    if args.action == "build":
+        finished = build_opening_book(args.path, workers=args.workers, chunk_size=args.chunk_size, max_chunks=args.max_chunks)
+        print(f"Opening book written to {args.path}" if finished else "Build incomplete, run again to resume")
+        return 0
+    with OpeningBook(args.path) as book:
+        for rack in args.racks:
+            plays = book.lookup(rack)
+            if plays is None:
+                print(f"{rack.upper()}: no play")
+                continue
+            top, best_equity = plays
+            print(f"{rack.upper()}: top {top.word} at {top.row + 1}{chr(65 + top.col)} for {top.score}, "
+                  f"best equity {best_equity.word} at {best_equity.row + 1}{chr(65 + best_equity.col)} "
+                  f"for {best_equity.score} ({best_equity.equity:+.1f})")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(opening_book_cli())
@@ -1,7 +1,8 @@
 from collections import defaultdict
 
 import config
-from game_play.scoring import TurnScore
+from game_play.lazy_records import LazyRecords, records_to_dicts
+from game_play.scoring import ScoreTimeline, TurnScore
 from game_play.tile import TileBag
 from game_play.word import PlayedWord
 
@@ -14,6 +15,7 @@ class Player:
         self.score_history: list[TurnScore] = []
         self.current_score: int = 0
         self.is_skip_next_turn: bool = False
+        self._timeline: ScoreTimeline | None = ScoreTimeline()
     
     def is_player(self, identifier: str):
         id = identifier.lower()
@@ -44,17 +46,15 @@ class Player:
         word_letters = defaultdict(int)
         for letter in self.rack:
             rack_letters[letter] += 1
-        num_letters_played = 0
-        for _, _, letter, is_played_letter in played_word.iterate_word_positions_and_is_played():
-            if is_played_letter:
-                word_letters[letter] += 1
-                num_letters_played += 1
-        is_bingo = len(rack_letters) == config.RACK_SIZE and num_letters_played == config.RACK_SIZE
+        # A designated blank needs a blank on the rack, not the letter it stands for
+        for letter in played_word.needed_tiles_str_format():
+            word_letters[letter] += 1
         for letter, count in word_letters.items():
             if rack_letters[letter] < count:
                 return False, False
-            elif rack_letters[letter] > count:
-                is_bingo = False
+        # Bingo when every tile of a full rack is played, repeated letters and blanks included
+        num_letters_played = sum(word_letters.values())
+        is_bingo = len(self.rack) == config.RACK_SIZE and num_letters_played == config.RACK_SIZE
         return True, is_bingo
     
     def use_rack_letters(self, word):
@@ -68,27 +68,45 @@ class Player:
     def add_score(self, turn_score: TurnScore):
         self.score_history.append(turn_score)
         self.current_score += turn_score.total_score
+        if self._timeline is not None:
+            self._timeline.add(turn_score)
+
+    @property
+    def timeline(self) -> ScoreTimeline:
+        # Saves hold no running totals, so a loaded player builds them on first use
+        if self._timeline is None:
+            self._timeline = ScoreTimeline(self.score_history)
+        return self._timeline
+
+    def score_at_turn(self, turn: int) -> int:
+        return self.timeline.at_turn(turn)
 
     def to_dict(self):
         return {
             "name": self.name,
             "email": self.email,
             "rack": self.rack[:],
-            "score_history": [score.to_dict() for score in self.score_history],
+            "score_history": records_to_dicts(self.score_history),
             "current_score": self.current_score,
             "is_skip_next_turn": self.is_skip_next_turn
         }
 
     @classmethod
-    def from_dict(self, d: dict):
+    def from_dict(self, d: dict, lazy: bool = False):
         player = Player(d.get("email"), d.get("name"))
         player.rack = list(d.get("rack", []))
-        player.score_history = [TurnScore.from_dict(s) for s in d.get("score_history", [])]
+        history = d.get("score_history", [])
+        if lazy:
+            # Each TurnScore is built when first read
+            player.score_history = LazyRecords(history, TurnScore.from_dict)
+        else:
+            player.score_history = [TurnScore.from_dict(s) for s in history]
         if "current_score" in d:
             player.current_score = d.get("current_score", 0)
         else:
-            player.current_score = sum(score.total_score for score in player.score_history)
+            player.current_score = sum(s.get("total_score", 0) for s in history)
         player.is_skip_next_turn = d.get("is_skip_next_turn", False)
+        player._timeline = None
         return player
 
     def __str__(self):
@@ -0,0 +1,212 @@
+"""
+Reproducible game positions shared by benchmarks and regression tests.
+
+Positions come from self-play by a simple seeded bot, so the same corpus seed
+always yields the same boards, racks, bags and score histories. The bot only
+plays lexicon words that form no cross words, which keeps every position valid.
+Blanks on its rack are resolved through the word index, never by trying letters one by one.
+"""
+from collections import Counter
+import json
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import config
+from game_play.dictionary import Dictionary
+from game_play.lexi_grid import LexiGrid
+from game_play.move import Move
+from game_play.move_types import MoveOptions, MoveResult, WordPlay
+from game_play.player import Player
+from game_play.tile import BLANK_TILE, join_blanks
+from game_play.word_index import WordIndex, rack_subsets
+from helper.generic import num_to_char
+from helper.text_output import suppress_output
+
+if TYPE_CHECKING:
+    from game_play.opening_book import OpeningBook
+
+CORPUS_SEED = 20240601
+MIDGAME_TURNS = 8
+MAX_ENDGAME_TURNS = 80
+MAX_ANCHORS = 24
+
+def designate_blanks(word: str, letters: str, skip: int | None = None) -> str:
+    """Write `word` in play notation, with blanks for the letters that `letters` can not cover."""
+    available = Counter(letters)
+    is_blank = []
+    for i, letter in enumerate(word):
+        if i == skip:
+            is_blank.append(False)
+        elif available[letter] > 0:
+            available[letter] -= 1
+            is_blank.append(False)
+        else:
+            is_blank.append(True)
+    return join_blanks(word, is_blank)
+
+
+def _sub_racks(rack: list[str]) -> list[tuple[str, int]]:
+    # (sorted letters, blanks used), larger sub-racks first
+    blanks = rack.count(BLANK_TILE)
+    subsets = rack_subsets([letter for letter in rack if letter != BLANK_TILE])
+    if not blanks:
+        return [(subset, 0) for subset in subsets]
+    sub_racks = [(subset, num_blanks) for subset in subsets + [""] for num_blanks in range(blanks + 1)]
+    return sorted(sub_racks, key=lambda sub_rack: -len(sub_rack[0]) - sub_rack[1])
+
+
+def _is_empty(game: LexiGrid, row: int, col: int) -> bool:
+    if not (0 <= row < config.BOARD_HEIGHT and 0 <= col < config.BOARD_WIDTH):
+        return True
+    return game.board.get_letter(row, col) is None
+
+
+def _fits_cleanly(game: LexiGrid, word: str, row: int, col: int, is_horizontal: bool, anchor: tuple[int, int] | None) -> bool:
+    d_row, d_col = (0, 1) if is_horizontal else (1, 0)
+    end_row, end_col = row + d_row * (len(word) - 1), col + d_col * (len(word) - 1)
+    if not (0 <= row and 0 <= col and end_row < config.BOARD_HEIGHT and end_col < config.BOARD_WIDTH):
+        return False
+    if not _is_empty(game, row - d_row, col - d_col) or not _is_empty(game, end_row + d_row, end_col + d_col):
+        return False
+    for i in range(len(word)):
+        r, c = row + d_row * i, col + d_col * i
+        if (r, c) == anchor:
+            continue
+        if not _is_empty(game, r, c):
+            return False
+        # No neighbours across the word, so the play forms no cross words
+        if not _is_empty(game, r + d_col, c + d_row) or not _is_empty(game, r - d_col, c - d_row):
+            return False
+    return True
+
+
+def _words(index: WordIndex, letters: str, blanks: int) -> list[str]:
+    if not blanks:
+        return index.by_signature.get(letters, [])
+    return [word for signature in sorted(index.signatures_with_blanks(letters, blanks)) for word in index.by_signature[signature]]
+
+
+def iter_clean_plays(game: LexiGrid, index: WordIndex):
+    """
+    Yield (word, row, col, is_horizontal) placements for the player on turn, longer sub-racks first.
+    Words using blanks come in play notation ("C*AT").
+    """
+    player = game.players[game.current_player_idx]
+    sub_racks = _sub_racks(player.rack)
+    center = (config.BOARD_HEIGHT // 2, config.BOARD_WIDTH // 2)
+
+    if game.board.get_letter(*center) is None:
+        for subset, blanks in sub_racks:
+            for word in _words(index, subset, blanks):
+                offset = game.rng.randrange(len(word))
+                if _fits_cleanly(game, word, center[0], center[1] - offset, True, None):
+                    yield designate_blanks(word, subset) if blanks else word, center[0], center[1] - offset, True
+        return
+
+    anchors = [(r, c) for r in range(config.BOARD_HEIGHT) for c in range(config.BOARD_WIDTH)
+               if game.board.get_letter(r, c) is not None]
+    game.rng.shuffle(anchors)
+    for row, col in anchors[:MAX_ANCHORS]:
+        anchor_letter = game.board.get_letter(row, col)
+        for subset, blanks in sub_racks:
+            for word in _words(index, "".join(sorted(subset + anchor_letter)), blanks):
+                for i, letter in enumerate(word):
+                    if letter != anchor_letter:
+                        continue
+                    for is_horizontal in (True, False):
+                        start_row, start_col = (row, col - i) if is_horizontal else (row - i, col)
+                        if _fits_cleanly(game, word, start_row, start_col, is_horizontal, (row, col)):
+                            yield designate_blanks(word, subset, skip=i) if blanks else word, start_row, start_col, is_horizontal
+
+
+def make_play_move(game: LexiGrid, word: str, row: int, col: int, is_horizontal: bool) -> Move:
+    player = game.players[game.current_player_idx]
+    move = Move(default_player=player, players=game.players)
+    move.action = MoveOptions.PLAY
+    move.word_play = WordPlay(word.lower(), row + 1, num_to_char(col + 1).lower(), "H" if is_horizontal else "V")
+    move.set_turn(game.turn)
+    return move
+
+
+def find_and_play(game: LexiGrid, index: WordIndex, opening_book: "OpeningBook | None" = None) -> MoveResult | None:
+    """
+    Play the first clean placement the engine accepts. Returns None if nothing fits.
+    With an opening book, a first move on an empty board is the book's best equity play.
+    """
+    player = game.players[game.current_player_idx]
+    if opening_book is not None and game.board.get_letter(config.BOARD_HEIGHT // 2, config.BOARD_WIDTH // 2) is None:
+        play = opening_book.best_play(player.rack)
+        if play is not None:
+            move = make_play_move(game, play.word, play.row, play.col, play.is_horizontal)
+            if game.make_move(move) != MoveResult.RETRY:
+                return MoveResult.NEXT
+    for word, row, col, is_horizontal in iter_clean_plays(game, index):
+        if game.make_move(make_play_move(game, word, row, col, is_horizontal)) != MoveResult.RETRY:
+            return MoveResult.NEXT
+    return None
+
+
+def play_bot_turn(game: LexiGrid, index: WordIndex, opening_book: "OpeningBook | None" = None) -> MoveResult:
+    player = game.players[game.current_player_idx]
+    result = find_and_play(game, index, opening_book)
+    if result is not None:
+        if game.tile_bag.is_empty() and not player.rack:
+            return MoveResult.END
+        return result
+    if len(game.tile_bag) >= config.RACK_SIZE:
+        return game.make_move(game.parse_move("exchange " + "".join(player.rack)))
+    return game.make_move(game.parse_move("pass"))
+
+
+def generate_position(seed: int, num_turns: int | None = MIDGAME_TURNS, dictionary: Dictionary | None = None) -> LexiGrid:
+    """Self-play `num_turns` turns from `seed`, or until the bag is empty when `num_turns` is None."""
+    dictionary = dictionary if dictionary is not None else Dictionary()
+    index = dictionary.index
+    players = [Player("p1@corpus.lexigrid", "P1"), Player("p2@corpus.lexigrid", "P2")]
+    with suppress_output():
+        game = LexiGrid(players, shuffle_players=True, dictionary=dictionary, seed=seed)
+        consecutive_passes = 0
+        for _ in range(num_turns if num_turns is not None else MAX_ENDGAME_TURNS):
+            if num_turns is None and game.tile_bag.is_empty():
+                break
+            if play_bot_turn(game, index) == MoveResult.END:
+                break
+            passed = game.previous_moves and game.previous_moves[-1].action == MoveOptions.PASS
+            consecutive_passes = consecutive_passes + 1 if passed else 0
+            if consecutive_passes >= 2 * game.num_players:
+                break
+    return game
+
+
+def build_corpus(seed: int = CORPUS_SEED, num_midgame: int = 8, num_endgame: int = 4, dictionary: Dictionary | None = None) -> dict[str, dict]:
+    dictionary = dictionary if dictionary is not None else Dictionary()
+    corpus = {}
+    for i in range(num_midgame):
+        corpus[f"midgame-{i}"] = generate_position(seed + i, MIDGAME_TURNS, dictionary).to_dict()
+    for i in range(num_endgame):
+        corpus[f"endgame-{i}"] = generate_position(seed + 1000 + i, None, dictionary).to_dict()
+    return corpus
+
+
+def save_corpus(corpus: dict[str, dict], path: Path | str):
+    with open(path, "w", encoding="utf8") as out_file:
+        json.dump(corpus, out_file)
+
+
+def load_corpus(path: Path | str | None = None, seed: int = CORPUS_SEED) -> dict[str, dict]:
+    """Read a saved corpus, building (and saving) it first if `path` does not exist yet."""
+    if path is not None and Path(path).exists():
+        with open(path, "r", encoding="utf8") as in_file:
+            return json.load(in_file)
+    corpus = build_corpus(seed)
+    if path is not None:
+        save_corpus(corpus, path)
+    return corpus
+
+
+if __name__ == "__main__":
+    import sys
+
+    out_path = sys.argv[1] if len(sys.argv) > 1 else "position_corpus.json"
+    save_corpus(build_corpus(), out_path)
+    print(f"Corpus written to {out_path}")
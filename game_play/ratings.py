@@ -0,0 +1,326 @@
+"""
+Elo and Glicko-2 ratings over finished games, keyed by Player.email.
+
+A finished game counts as every pair of its players meeting once: the higher final
+score wins the pairing and equal scores draw. Recording a game only touches the
+players in it, so one more game never replays the archive. A rebuild replays the
+whole archive in batches. Every game in a batch is rated from the ratings before
+the batch (a Glicko-2 rating period), so a batch is a handful of NumPy operations
+over all its pairings. With a batch size of 1 a rebuild gives exactly the ratings
+of recording the games one at a time.
+
+Rating deviations only shrink as players play; an idle player's deviation is not
+grown per game, as the games are the rating periods here.
+
+    python entry_script.py ratings record ratings.json saved_games/
+    python entry_script.py ratings rebuild ratings.json saved_games/ [--batch-size 64]
+    python entry_script.py ratings top ratings.json [--system elo] [--limit 20]
+"""
+import argparse
+import json
+from pathlib import Path
+from typing import Iterable
+
+import numpy as np
+
+from game_play.analytics import find_game_files, iter_saved_games
+from game_play.lexi_grid import LexiGrid
+from game_play.move_types import MoveOptions
+
+SYSTEMS = ("glicko", "elo")
+ELO_START = 1500.0
+ELO_K = 32.0
+GLICKO_START = 1500.0
+GLICKO_RD = 350.0
+GLICKO_VOLATILITY = 0.06
+GLICKO_TAU = 0.5
+GLICKO_SCALE = 173.7178
+CONVERGENCE = 1e-6
+MAX_ITERATIONS = 100
+DEFAULT_BATCH_SIZE = 64
+
+
+def is_game_over(actions: list[str | None], bag_size: int, rack_sizes: list[int]) -> bool:
+    """Ended by a player, out of tiles with a rack played out, or every player passing twice in a row."""
+    if actions and actions[-1] == MoveOptions.END.value:
+        return True
+    if bag_size == 0 and any(size == 0 for size in rack_sizes):
+        return True
+    passes = 2 * len(rack_sizes)
+    return len(actions) >= passes > 0 and all(action == MoveOptions.PASS.value for action in actions[-passes:])
+
+
+class GameResult:
+    def __init__(self, key: str, emails: list[str], scores: list[int]):
+        self.key = key
+        self.emails = emails
+        self.scores = scores
+
+    def pairings(self) -> list[tuple[int, int, float]]:
+        """(player, opponent, result) for each ordered pair of seats: 1 a win, 0.5 a draw, 0 a loss."""
+        return [
+            (i, j, 1.0 if self.scores[i] > self.scores[j] else 0.5 if self.scores[i] == self.scores[j] else 0.0)
+            for i in range(len(self.emails)) for j in range(len(self.emails)) if i != j
+        ]
+
+    @classmethod
+    def from_game(cls, key: str, game: LexiGrid) -> "GameResult | None":
+        """The result of a finished game, or None while it is still going."""
+        actions = [move.action.value if move and move.action else None for move in game.previous_moves]
+        if not is_game_over(actions, len(game.tile_bag), [len(player.rack) for player in game.players]):
+            return None
+        return GameResult(key, [player.email for player in game.players], [player.current_score for player in game.players])
+
+    @classmethod
+    def from_dict(cls, key: str, d: dict) -> "GameResult | None":
+        """As from_game, straight from a saved game."""
+        players = d.get("players", [])
+        actions = [move.get("action") if move else None for move in d.get("previous_moves", [])]
+        bag_size = len(d.get("tile_bag", {}).get("letters", []))
+        if not is_game_over(actions, bag_size, [len(player.get("rack", [])) for player in players]):
+            return None
+        scores = [
+            player.get("current_score", sum(turn.get("total_score", 0) for turn in player.get("score_history", [])))
+            for player in players
+        ]
+        return GameResult(key, [player.get("email", "") for player in players], scores)
+
+
+def _glicko2_volatility(phi: np.ndarray, sigma: np.ndarray, v: np.ndarray, delta: np.ndarray, tau: float) -> np.ndarray:
+    # Step 5 of Glickman's Glicko-2 paper, the Illinois root search run on every player at once
+    a = np.log(sigma ** 2)
+
+    def f(x):
+        ex = np.exp(x)
+        return ex * (delta ** 2 - phi ** 2 - v - ex) / (2 * (phi ** 2 + v + ex) ** 2) - (x - a) / tau ** 2
+
+    big = delta ** 2 > phi ** 2 + v
+    low = np.where(big, delta ** 2 - phi ** 2 - v, 1.0)
+    k = np.ones_like(a)
+    while True:
+        step = ~big & (f(a - k * tau) < 0)
+        if not step.any():
+            break
+        k[step] += 1
+    A, B = a, np.where(big, np.log(low), a - k * tau)
+    fA, fB = f(A), f(B)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for _ in range(MAX_ITERATIONS):
+            active = np.abs(B - A) > CONVERGENCE
+            if not active.any():
+                break
+            C = A + (A - B) * fA / (fB - fA)
+            fC = f(C)
+            flip = fC * fB < 0
+            A, fA = np.where(active & flip, B, A), np.where(active, np.where(flip, fB, fA / 2), fA)
+            B, fB = np.where(active, C, B), np.where(active, fC, fB)
+    return np.exp(A / 2)
+
+
+def glicko2_period(rating: np.ndarray, rd: np.ndarray, volatility: np.ndarray,
+                   players: np.ndarray, opponents: np.ndarray, results: np.ndarray,
+                   tau: float = GLICKO_TAU) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """One rating period: players[k] got results[k] against opponents[k], all rated from the ratings before it.
+    Returns the new (rating, rd, volatility); players without a game keep theirs."""
+    mu = (rating - GLICKO_START) / GLICKO_SCALE
+    phi = rd / GLICKO_SCALE
+    g = 1 / np.sqrt(1 + 3 * phi[opponents] ** 2 / np.pi ** 2)
+    expected = 1 / (1 + np.exp(-g * (mu[players] - mu[opponents])))
+    v_inverse = np.bincount(players, g * g * expected * (1 - expected), minlength=len(rating))
+    improvement = np.bincount(players, g * (results - expected), minlength=len(rating))
+    rated = np.flatnonzero(v_inverse > 0)
+    v = 1 / v_inverse[rated]
+    sigma = _glicko2_volatility(phi[rated], volatility[rated], v, v * improvement[rated], tau)
+    new_phi = 1 / np.sqrt(1 / (phi[rated] ** 2 + sigma ** 2) + 1 / v)
+    new_rating, new_rd, new_volatility = rating.copy(), rd.copy(), volatility.copy()
+    new_rating[rated] = GLICKO_START + GLICKO_SCALE * (mu[rated] + new_phi ** 2 * improvement[rated])
+    new_rd[rated] = GLICKO_SCALE * new_phi
+    new_volatility[rated] = sigma
+    return new_rating, new_rd, new_volatility
+
+
+class RatingEngine:
+    COLUMNS = ("elo", "glicko", "rd", "volatility", "games", "wins", "losses", "draws")
+
+    def __init__(self, k_factor: float = ELO_K, tau: float = GLICKO_TAU):
+        self.k_factor = k_factor
+        self.tau = tau
+        self.reset()
+
+    def reset(self):
+        self.emails: list[str] = []
+        self._index: dict[str, int] = {}
+        self.recorded: set[str] = set()
+        self.elo = np.zeros(0)
+        self.glicko = np.zeros(0)
+        self.rd = np.zeros(0)
+        self.volatility = np.zeros(0)
+        self.games = np.zeros(0, dtype=np.int64)
+        self.wins = np.zeros(0, dtype=np.int64)
+        self.losses = np.zeros(0, dtype=np.int64)
+        self.draws = np.zeros(0, dtype=np.int64)
+
+    def __len__(self):
+        return len(self.emails)
+
+    def _seat_players(self, emails: Iterable[str]) -> list[int]:
+        seats = []
+        new = []
+        for email in emails:
+            if email not in self._index:
+                self._index[email] = len(self.emails)
+                self.emails.append(email)
+                new.append(email)
+            seats.append(self._index[email])
+        if new:
+            starts = {"elo": ELO_START, "glicko": GLICKO_START, "rd": GLICKO_RD, "volatility": GLICKO_VOLATILITY}
+            for column in self.COLUMNS:
+                current = getattr(self, column)
+                setattr(self, column, np.concatenate([current, np.full(len(new), starts.get(column, 0), dtype=current.dtype)]))
+        return seats
+
+    def rate_batch(self, results: list[GameResult]) -> int:
+        """Rate games together, each from the ratings before the batch. Skips games already recorded."""
+        players, opponents, outcomes, weights, seated = [], [], [], [], []
+        num_games = 0
+        for result in results:
+            if result.key in self.recorded or len(set(result.emails)) < 2:
+                continue
+            self.recorded.add(result.key)
+            num_games += 1
+            seats = self._seat_players(result.emails)
+            seated.extend(seats)
+            for i, j, outcome in result.pairings():
+                players.append(seats[i])
+                opponents.append(seats[j])
+                outcomes.append(outcome)
+                # The Elo K is shared between a player's opponents in the game
+                weights.append(1 / (len(seats) - 1))
+        if not players:
+            return 0
+        players, opponents = np.array(players), np.array(opponents)
+        outcomes, weights = np.array(outcomes), np.array(weights)
+        size = len(self.emails)
+
+        expected = 1 / (1 + 10 ** ((self.elo[opponents] - self.elo[players]) / 400))
+        self.elo = self.elo + np.bincount(players, self.k_factor * weights * (outcomes - expected), minlength=size)
+        self.glicko, self.rd, self.volatility = glicko2_period(self.glicko, self.rd, self.volatility, players, opponents, outcomes, self.tau)
+
+        self.games += np.bincount(np.array(seated), minlength=size)
+        self.wins += np.bincount(players, outcomes == 1.0, minlength=size).astype(np.int64)
+        self.losses += np.bincount(players, outcomes == 0.0, minlength=size).astype(np.int64)
+        self.draws += np.bincount(players, outcomes == 0.5, minlength=size).astype(np.int64)
+        return num_games
+
+    def record(self, result: GameResult) -> bool:
+        """Rate one more game. False if it was recorded already."""
+        return bool(self.rate_batch([result]))
+
+    def record_game(self, key: str, game: LexiGrid) -> bool:
+        result = GameResult.from_game(key, game)
+        if result is None:
+            raise ValueError(f"Game {key} is not finished")
+        return self.record(result)
+
+    def rebuild(self, results: Iterable[GameResult], batch_size: int = DEFAULT_BATCH_SIZE) -> int:
+        """Forget every rating and rate `results` again in order, `batch_size` games at a time."""
+        self.reset()
+        results = list(results)
+        for start in range(0, len(results), batch_size):
+            self.rate_batch(results[start:start + batch_size])
+        return len(self.recorded)
+
+    def record_files(self, paths: Iterable[Path | str]) -> int:
+        """Rate the finished games in saved game files not seen before, one at a time. Returns how many."""
+        before = len(self.recorded)
+        for result in iter_results(paths):
+            self.record(result)
+        return len(self.recorded) - before
+
+    def rating(self, email: str) -> dict | None:
+        idx = self._index.get(email)
+        if idx is None:
+            return None
+        return {"email": email} | {column: getattr(self, column)[idx].item() for column in self.COLUMNS}
+
+    def leaderboard(self, system: str = "glicko", limit: int | None = 10, min_games: int = 1) -> list[dict]:
+        if system not in SYSTEMS:
+            raise ValueError(f"Unknown rating system {system!r}, expected one of {SYSTEMS}")
+        ratings = self.glicko if system == "glicko" else self.elo
+        eligible = np.flatnonzero(self.games >= min_games)
+        order = eligible[np.argsort(-ratings[eligible], kind="stable")][:limit]
+        return [self.rating(self.emails[idx]) | {"rank": rank} for rank, idx in enumerate(order, start=1)]
+
+    def to_dict(self):
+        return {
+            "k_factor": self.k_factor,
+            "tau": self.tau,
+            "players": [self.rating(email) for email in self.emails],
+            "recorded": sorted(self.recorded),
+        }
+
+    @classmethod
+    def from_dict(self, d: dict):
+        engine = RatingEngine(d.get("k_factor", ELO_K), d.get("tau", GLICKO_TAU))
+        players = d.get("players", [])
+        engine._seat_players(player["email"] for player in players)
+        for column in RatingEngine.COLUMNS:
+            current = getattr(engine, column)
+            setattr(engine, column, np.array([player[column] for player in players], dtype=current.dtype))
+        engine.recorded = set(d.get("recorded", []))
+        return engine
+
+    def save(self, path: Path | str):
+        with open(path, "w", encoding="utf8") as out_file:
+            json.dump(self.to_dict(), out_file)
+
+    @classmethod
+    def load(self, path: Path | str) -> "RatingEngine":
+        """The saved ratings, or a fresh engine when there are none yet."""
+        if not Path(path).exists():
+            return RatingEngine()
+        with open(path, "r", encoding="utf8") as in_file:
+            return RatingEngine.from_dict(json.load(in_file))
+
+
+def iter_results(paths: Iterable[Path | str]) -> Iterable[GameResult]:
+    for path in find_game_files(paths):
+        for key, game in iter_saved_games(path):
+            result = GameResult.from_dict(key, game)
+            if result is not None:
+                yield result
+
+
+def ratings_cli(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="Lexigrid ratings", description="Elo and Glicko-2 ratings over saved games")
+    commands = parser.add_subparsers(dest="action", required=True)
+    record = commands.add_parser("record", help="rate finished games not rated yet")
+    record.add_argument("state", help="ratings JSON, created if missing")
+    record.add_argument("paths", nargs="+", help="saved game files or directories of them")
+    rebuild = commands.add_parser("rebuild", help="rate every finished game again from scratch")
+    rebuild.add_argument("state")
+    rebuild.add_argument("paths", nargs="+")
+    rebuild.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help="games rated together per batch")
+    top = commands.add_parser("top", help="print the leaderboard")
+    top.add_argument("state")
+    top.add_argument("--system", choices=SYSTEMS, default="glicko")
+    top.add_argument("--limit", type=int, default=20)
+    top.add_argument("--min-games", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    engine = RatingEngine.load(args.state)
+    if args.action == "record":
+        print(f"Rated {engine.record_files(args.paths)} new games")
+        engine.save(args.state)
+    elif args.action == "rebuild":
+        print(f"Rated {engine.rebuild(iter_results(args.paths), args.batch_size)} games")
+        engine.save(args.state)
+    else:
+        for row in engine.leaderboard(args.system, args.limit, args.min_games):
+            rating = f"{row['glicko']:7.1f} ±{2 * row['rd']:5.1f}" if args.system == "glicko" else f"{row['elo']:7.1f}"
+            print(f"{row['rank']:>3}. {row['email']:<30} {rating}  {row['games']} games ({row['wins']}-{row['losses']}-{row['draws']})")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(ratings_cli())
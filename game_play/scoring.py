@@ -1,10 +1,14 @@
+from typing import Iterable
+
 from game_play.word import ScoredWord
 from game_play.move_types import MoveOptions
 
 
 class TurnScore:
     """Stores all scored words for a turn and applies bonuses."""
-    
+    __slots__ = ("total_score", "move_action", "turn", "scored_words", "is_bingo",
+                 "is_challenger", "is_challenge_successful", "invalid_words")
+
     BINGO_BONUS = 50  # Standard Scrabble Bingo bonus
     SUCCESSFUL_CHALLENGE_BONUS = 10
     UNSUCCESSFUL_CHALLENGE_COST = 0
@@ -22,6 +26,7 @@ class TurnScore:
         self.is_bingo: bool = False
         self.is_challenger: bool | None = is_challenger
         self.is_challenge_successful = is_challenge_successful
+        self.invalid_words: list[str] | None = None  # lexicon verdict, filled in on the first challenge
         if self.move_action == MoveOptions.CHALLENGE:
             if self.is_challenger:
                 self.apply_challenger_score()
@@ -78,6 +83,7 @@ class TurnScore:
         self.is_bingo = False
         self.total_score = 0
         self.scored_words = {}
+        self.invalid_words = None
 
     def to_dict(self):
         return {
@@ -107,7 +113,47 @@ class TurnScore:
         score.total_score = d.get("total_score", 0)
         score.is_bingo = d.get("is_bingo", False)
         score.scored_words = {}
+        bonuses = None
         for item in d.get("scored_words", []):
             scored_word = ScoredWord.from_dict(item.get("word", {}))
+            # The words of a turn were scored with one bonus dict; share it again rather than one per word
+            if scored_word.bonuses == bonuses:
+                scored_word.bonuses = bonuses
+            bonuses = scored_word.bonuses
             score.scored_words[item.get("pos", scored_word.get_set_value())] = scored_word
         return score
+
+
+class ScoreTimeline:
+    """Running totals of one player's score, after each scored move and at the end of each game turn."""
+
+    def __init__(self, turn_scores: Iterable[TurnScore] = ()):
+        self.after_move: list[int] = [0]
+        self.after_turn: list[int] = []
+        for turn_score in turn_scores:
+            self.add(turn_score)
+
+    def add(self, turn_score: TurnScore):
+        score = turn_score.total_score
+        turn = max(turn_score.turn, 0)
+        self.after_move.append(self.after_move[-1] + score)
+        if turn >= len(self.after_turn):
+            last = self.after_turn[-1] if self.after_turn else 0
+            self.after_turn.extend([last] * (turn + 1 - len(self.after_turn)))
+        # Scores land on the latest turn, bar the odd adjustment to an earlier one that carries through
+        for later_turn in range(turn, len(self.after_turn)):
+            self.after_turn[later_turn] += score
+
+    @property
+    def num_turns(self) -> int:
+        return len(self.after_turn)
+
+    def at_turn(self, turn: int) -> int:
+        """Score once `turn` is over: every move of that turn and earlier ones."""
+        if turn < 0 or not self.after_turn:
+            return 0
+        return self.after_turn[min(turn, len(self.after_turn) - 1)]
+
+    def after_moves(self, count: int) -> int:
+        """Score after the first `count` entries of the score history."""
+        return self.after_move[max(0, min(count, len(self.after_move) - 1))]
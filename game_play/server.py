@@ -0,0 +1,239 @@
+"""
+Asyncio server hosting many LexiGrid games over a local line protocol.
+
+Every request is one line and gets exactly one reply line starting with OK or ERR:
+
+    NEW <player> [<player> ...]     -> OK <game_id>
+    LOAD <saved_game.json>          -> OK <game_id>
+    <game_id> <move>                -> OK <result> <name>=<score> ...
+    BOARD <game_id>                 -> OK <row>/<row>/...
+    STATE <game_id>                 -> OK <json>
+    GAMES                           -> OK <game_id> ...
+    STATS                           -> OK <json session cache statistics>
+    TIMINGS [<game_id>]             -> OK <json phase timing histograms>
+    QUIT                            -> OK bye
+
+Moves use the same syntax as the console game (see Move.parse_move_input),
+including "@name challenge" for a challenge by a player who is not on turn.
+Idle games are spilled to disk by a SessionCache and paged back in on demand.
+
+With a metrics port, `GET /metrics` over HTTP on that port returns the process
+wide phase timings as Prometheus text for a scraper.
+"""
+import argparse
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import itertools
+import json
+from pathlib import Path
+import sys
+import tempfile
+
+from game_play.dictionary import Dictionary
+from game_play.lexi_grid import LexiGrid
+from game_play.move_types import MoveOptions
+from game_play.player import Player
+from game_play.session_cache import SessionCache
+from game_play.timing import PROCESS_TIMINGS, enable_timing
+from helper.text_output import suppress_output
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+
+class LexiGridServer:
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        dictionary: Dictionary | None = None,
+        spill_dir: Path | str | None = None,
+        max_games: int | None = 256,
+        max_bytes: int | None = None,
+        auto_validate: bool = False,
+    ):
+        self.auto_validate = auto_validate
+        self.locks: dict[str, asyncio.Lock] = {}
+        # One lexicon shared by every hosted game instead of one per game
+        self.dictionary = dictionary if dictionary is not None else Dictionary()
+        self.sessions = SessionCache(
+            spill_dir if spill_dir is not None else tempfile.mkdtemp(prefix="lexigrid_sessions_"),
+            max_games=max_games,
+            max_bytes=max_bytes,
+            dictionary=self.dictionary,
+            can_evict=lambda game_id: not self.locks[game_id].locked(),
+        )
+        self.executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._game_ids = itertools.count(1)
+
+    def add_game(self, game: LexiGrid) -> str:
+        game_id = f"g{next(self._game_ids)}"
+        self.locks[game_id] = asyncio.Lock()
+        self.sessions.put(game_id, game)
+        return game_id
+
+    def get_lock(self, game_id: str) -> asyncio.Lock:
+        lock = self.locks.get(game_id)
+        if lock is None:
+            raise KeyError(f"Unknown game: {game_id}")
+        return lock
+
+    async def get_game(self, game_id: str) -> LexiGrid:
+        # May page the game in from disk, so it runs on the pool like any other blocking work
+        return await self.run_blocking(self.sessions.get, game_id)
+
+    async def run_blocking(self, func, *args):
+        return await asyncio.get_running_loop().run_in_executor(self.executor, func, *args)
+
+    @staticmethod
+    def format_scores(game: LexiGrid) -> str:
+        return " ".join(f"{p.name}={p.current_score}" for p in game.players)
+
+    @staticmethod
+    def apply_move(game: LexiGrid, user_input: str) -> str:
+        player = game.players[game.current_player_idx]
+        if player.is_skip_next_turn:
+            skip = game.parse_move("pass", player)
+            skip.action = MoveOptions.SKIP
+            game.make_move(skip)
+        move = game.parse_move(user_input)
+        result = game.make_move(move)
+        return result.value if result is not None else "next"
+
+    async def handle_move(self, game_id: str, user_input: str) -> str:
+        async with self.get_lock(game_id):
+            game = await self.get_game(game_id)
+            # Parsing, placement checks, scoring and lexicon lookups run off the event loop
+            result = await self.run_blocking(self.apply_move, game, user_input)
+            await self.run_blocking(self.sessions.resize, game_id)
+            # Read while the lock is held, so a move queued behind this one can not change the scores first
+            return f"{result} {self.format_scores(game)}"
+
+    async def new_game(self, names: list[str]) -> str:
+        if not names:
+            raise ValueError("NEW needs at least one player")
+        game = await self.run_blocking(
+            lambda: LexiGrid([Player(name) for name in names], dictionary=self.dictionary, auto_validate=self.auto_validate)
+        )
+        return self.add_game(game)
+
+    async def load_game(self, path: str) -> str:
+        def load():
+            with open(Path(path), "r", encoding="utf8") as in_file:
+                return LexiGrid.from_dict(json.load(in_file), dictionary=self.dictionary, lazy=True)
+        return self.add_game(await self.run_blocking(load))
+
+    async def handle_line(self, line: str) -> str:
+        tokens = line.strip().split()
+        if not tokens:
+            raise ValueError("Empty request")
+        command = tokens[0].upper()
+        if command == "NEW":
+            return await self.new_game(tokens[1:])
+        if command == "LOAD":
+            if len(tokens) != 2:
+                raise ValueError("LOAD needs a file path")
+            return await self.load_game(tokens[1])
+        if command == "GAMES":
+            return " ".join(self.sessions.game_ids())
+        if command == "STATS":
+            return json.dumps(self.sessions.stats())
+        if command == "TIMINGS":
+            if len(tokens) == 1:
+                return json.dumps(PROCESS_TIMINGS.to_dict())
+            async with self.get_lock(tokens[1]):
+                game = await self.get_game(tokens[1])
+                return json.dumps(game.timings.to_dict() if game.timings is not None else {})
+        if command == "BOARD" and len(tokens) == 2:
+            async with self.get_lock(tokens[1]):
+                game = await self.get_game(tokens[1])
+                return "/".join(game.export_board_state())
+        if command == "STATE" and len(tokens) == 2:
+            async with self.get_lock(tokens[1]):
+                game = await self.get_game(tokens[1])
+                return json.dumps(game.to_dict())
+        if len(tokens) < 2:
+            raise ValueError(f"Unknown request: {line.strip()}")
+        return await self.handle_move(tokens[0], " ".join(tokens[1:]))
+
+    async def handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while line := await reader.readline():
+                request = line.decode("utf8").strip()
+                if not request:
+                    continue
+                if request.upper() == "QUIT":
+                    writer.write(b"OK bye\n")
+                    break
+                try:
+                    reply = "OK " + await self.handle_line(request)
+                except (ValueError, KeyError, IndexError) as err:
+                    reply = f"ERR {err}"
+                except Exception as err:
+                    # An engine failure on one request is reported, the connection stays open for the next
+                    reply = f"ERR {type(err).__name__}: {err}"
+                writer.write(reply.encode("utf8") + b"\n")
+                await writer.drain()
+        finally:
+            writer.close()
+            await writer.wait_closed()
+
+    async def handle_metrics(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        # Just enough HTTP/1.0 for a Prometheus scrape; the request headers are read and ignored
+        try:
+            request_line = await reader.readline()
+            while (header := await reader.readline()) not in (b"", b"\r\n", b"\n"):
+                pass
+            if request_line.split()[:2] == [b"GET", b"/metrics"]:
+                status, body = "200 OK", PROCESS_TIMINGS.to_prometheus()
+            else:
+                status, body = "404 Not Found", "Not found\n"
+            writer.write(
+                f"HTTP/1.0 {status}\r\nContent-Type: text/plain; version=0.0.4\r\n"
+                f"Content-Length: {len(body.encode('utf8'))}\r\n\r\n{body}".encode("utf8")
+            )
+            await writer.drain()
+        finally:
+            writer.close()
+            await writer.wait_closed()
+
+    async def serve(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, metrics_port: int | None = None):
+        server = await asyncio.start_server(self.handle_client, host, port)
+        print(f"LexiGrid server listening on {host}:{port}", file=sys.stderr)
+        metrics = None
+        if metrics_port is not None:
+            # Serves alongside the game server for as long as the loop runs
+            metrics = await asyncio.start_server(self.handle_metrics, host, metrics_port)
+            print(f"Prometheus metrics on http://{host}:{metrics_port}/metrics", file=sys.stderr)
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            if metrics is not None:
+                metrics.close()
+                await metrics.wait_closed()
+
+
+def run_server(host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, auto_validate: bool = False, metrics_port: int | None = None):
+    # The engine reports every step through print(); the server keeps that off the console
+    enable_timing()
+    with suppress_output():
+        server = LexiGridServer(auto_validate=auto_validate)
+        try:
+            asyncio.run(server.serve(host, port, metrics_port))
+        except KeyboardInterrupt:
+            server.sessions.flush()
+
+
+def run_server_cli(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="Lexigrid serve", description="Host LexiGrid games over TCP")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--auto-validate", action="store_true", help="reject plays that form invalid words")
+    parser.add_argument("--metrics-port", type=int, default=None, help="serve Prometheus phase timings over HTTP on this port")
+    args = parser.parse_args(argv)
+    run_server(args.host, args.port, args.auto_validate, args.metrics_port)
+    return 0
+
+
+if __name__ == "__main__":
+    run_server()
@@ -0,0 +1,238 @@
+"""
+LRU cache of live LexiGrid sessions that spills idle games to disk.
+
+Hot games stay in memory up to a game count and/or a byte budget, checked
+against each game's estimated in-memory size (see `estimate_size`).
+The least recently used games beyond that are written out as gzipped
+`to_dict` JSON and read back in transparently on their next `get`.
+
+Evicted games are snapshotted under the cache lock, but compressed and written
+after it is released, and paged in games are read and parsed outside it too,
+so other sessions are not held up by the disk.
+"""
+from collections import OrderedDict
+import gzip
+import json
+import os
+from pathlib import Path
+import threading
+import time
+from typing import Callable
+
+from game_play.dictionary import Dictionary
+from game_play.lexi_grid import LexiGrid
+
+# Deep in-memory size of a live game (memory.game_memory_breakdown, lexicon excluded),
+# fitted on self-played games: a fixed part (mostly the 225 board tiles and the bag),
+# the player with their rack and unseen-tile view, and each move with its turn score
+GAME_BYTES = 28_000
+PLAYER_BYTES = 1_550
+MOVE_BYTES = 1_200
+
+
+class SessionCache:
+    def __init__(
+        self,
+        spill_dir: Path | str,
+        max_games: int | None = 256,
+        max_bytes: int | None = None,
+        dictionary: Dictionary | None = None,
+        can_evict: Callable[[str], bool] | None = None,
+    ):
+        self.spill_dir = Path(spill_dir)
+        self.spill_dir.mkdir(parents=True, exist_ok=True)
+        self.max_games = max_games
+        self.max_bytes = max_bytes
+        self.dictionary = dictionary
+        self.can_evict = can_evict if can_evict is not None else (lambda game_id: True)
+
+        self._games: OrderedDict[str, LexiGrid] = OrderedDict()
+        self._sizes: dict[str, int] = {}
+        self._spilled: set[str] = set()
+        self._spilling: dict[str, LexiGrid] = {}  # evicted, with the spill file still being written
+        self._paging: dict[str, threading.Event] = {}  # being read back in, set once the read is over
+        self._lock = threading.RLock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.page_ins = 0
+        self.page_in_seconds = 0.0
+        self.max_page_in_seconds = 0.0
+
+    def spill_path(self, game_id: str) -> Path:
+        return self.spill_dir / f"{game_id}.json.gz"
+
+    @staticmethod
+    def estimate_size(game: LexiGrid) -> int:
+        # Approximates the game's deep memory size in O(1), so it can be refreshed after every move
+        return GAME_BYTES + PLAYER_BYTES * len(game.players) + MOVE_BYTES * len(game.previous_moves)
+
+    @property
+    def resident_bytes(self) -> int:
+        return sum(self._sizes.values())
+
+    def __contains__(self, game_id: str) -> bool:
+        with self._lock:
+            return game_id in self._games or game_id in self._spilling or game_id in self._spilled or game_id in self._paging
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._games) + len(self._spilling) + len(self._spilled) + len(self._paging)
+
+    def game_ids(self) -> list[str]:
+        with self._lock:
+            return list(self._games) + sorted(self._spilled | self._spilling.keys() | self._paging.keys())
+
+    def put(self, game_id: str, game: LexiGrid):
+        with self._lock:
+            self._insert(game_id, game)
+            victims = self._evict_over_budget(keep=game_id)
+        self._write_spills(victims)
+
+    def get(self, game_id: str) -> LexiGrid:
+        with self._lock:
+            game = self._games.get(game_id)
+            if game is not None:
+                self.hits += 1
+                self._games.move_to_end(game_id)
+                return game
+            paging = self._paging.get(game_id)
+            game = self._spilling.pop(game_id, None)
+            if paging is not None:
+                pass
+            elif game is not None:
+                # Still in memory while its spill is written; taking it back makes that write stale
+                self.hits += 1
+                self._insert(game_id, game)
+                victims = self._evict_over_budget(keep=game_id)
+            elif game_id not in self._spilled:
+                raise KeyError(f"Unknown game: {game_id}")
+            else:
+                # Reserve the id, so other callers wait for this read instead of starting their own
+                self.misses += 1
+                self._spilled.discard(game_id)
+                self._paging[game_id] = threading.Event()
+        if paging is not None:
+            paging.wait()
+            return self.get(game_id)
+        if game is not None:
+            self._write_spills(victims)
+            return game
+        return self._page_in(game_id)
+
+    def resize(self, game_id: str):
+        """Re-estimate a resident game after it changed, e.g. after a move, and evict others if now over budget."""
+        with self._lock:
+            game = self._games.get(game_id)
+            if game is None or self.max_bytes is None:
+                return
+            self._sizes[game_id] = self.estimate_size(game)
+            victims = self._evict_over_budget(keep=game_id)
+        self._write_spills(victims)
+
+    def remove(self, game_id: str):
+        with self._lock:
+            self._games.pop(game_id, None)
+            self._sizes.pop(game_id, None)
+            self._spilling.pop(game_id, None)
+            self._paging.pop(game_id, None)
+            if game_id in self._spilled:
+                self._spilled.discard(game_id)
+                self.spill_path(game_id).unlink(missing_ok=True)
+
+    def flush(self):
+        """Write every resident game to disk, e.g. before shutting down."""
+        with self._lock:
+            victims = [self._detach(game_id) for game_id in list(self._games)]
+        self._write_spills(victims)
+
+    def _insert(self, game_id: str, game: LexiGrid):
+        self._games[game_id] = game
+        self._games.move_to_end(game_id)
+        self._spilled.discard(game_id)
+        if self.max_bytes is not None:
+            self._sizes[game_id] = self.estimate_size(game)
+
+    def _over_budget(self) -> bool:
+        if self.max_games is not None and len(self._games) > self.max_games:
+            return True
+        return self.max_bytes is not None and self.resident_bytes > self.max_bytes
+
+    def _evict_over_budget(self, keep: str | None = None) -> list[tuple[str, LexiGrid, dict]]:
+        # Oldest first; games that are mid-move (can_evict is False) are skipped rather than spilled
+        victims = []
+        for game_id in list(self._games):
+            if not self._over_budget():
+                break
+            if game_id != keep and self.can_evict(game_id):
+                victims.append(self._detach(game_id))
+                self.evictions += 1
+        return victims
+
+    def _detach(self, game_id: str) -> tuple[str, LexiGrid, dict]:
+        # Called with the lock held: the snapshot is what gets written, whatever happens to the game later
+        game = self._games.pop(game_id)
+        self._sizes.pop(game_id, None)
+        self._spilling[game_id] = game
+        return game_id, game, game.to_dict()
+
+    def _write_spills(self, victims: list[tuple[str, LexiGrid, dict]]):
+        # Called without the lock; each spill lands under its final name only if the game was not taken back
+        for game_id, game, snapshot in victims:
+            tmp_path = self.spill_path(game_id).with_name(f"{game_id}.{threading.get_ident()}.tmp")
+            with gzip.open(tmp_path, "wt", encoding="utf8") as spill_file:
+                json.dump(snapshot, spill_file, separators=(",", ":"))
+            with self._lock:
+                if self._spilling.get(game_id) is game:
+                    del self._spilling[game_id]
+                    os.replace(tmp_path, self.spill_path(game_id))
+                    self._spilled.add(game_id)
+                    continue
+            tmp_path.unlink(missing_ok=True)
+
+    def _page_in(self, game_id: str) -> LexiGrid:
+        # Called without the lock, for an id that get() reserved in _paging
+        paging = self._paging[game_id]
+        start = time.perf_counter()
+        try:
+            with gzip.open(self.spill_path(game_id), "rt", encoding="utf8") as spill_file:
+                game = LexiGrid.from_dict(json.load(spill_file), dictionary=self.dictionary, lazy=True)
+        except BaseException:
+            with self._lock:
+                if self._paging.get(game_id) is paging:
+                    del self._paging[game_id]
+                    self._spilled.add(game_id)
+            paging.set()
+            raise
+        elapsed = time.perf_counter() - start
+        with self._lock:
+            self.page_ins += 1
+            self.page_in_seconds += elapsed
+            self.max_page_in_seconds = max(self.max_page_in_seconds, elapsed)
+            self.spill_path(game_id).unlink(missing_ok=True)
+            if self._paging.get(game_id) is not paging:
+                paging.set()
+                raise KeyError(f"Game removed while being paged in: {game_id}")
+            del self._paging[game_id]
+            self._insert(game_id, game)
+            victims = self._evict_over_budget(keep=game_id)
+        paging.set()
+        self._write_spills(victims)
+        return game
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "resident_games": len(self._games),
+                "spilled_games": len(self._spilled) + len(self._spilling),
+                "resident_bytes_estimate": self.resident_bytes if self.max_bytes is not None else None,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "page_ins": self.page_ins,
+                "avg_page_in_ms": 1000 * self.page_in_seconds / self.page_ins if self.page_ins else 0.0,
+                "max_page_in_ms": 1000 * self.max_page_in_seconds,
+            }
@@ -0,0 +1,73 @@
+"""
+Standings and lead statistics from the players' score timelines (Player.timeline).
+
+A score at a turn is a list index, so the spread at any turn costs O(1) per player
+and the lead statistics of a whole game are a single pass over its turns.
+"""
+from game_play.player import Player
+
+
+class LeadStats:
+    def __init__(self, name: str):
+        self.name = name
+        self.turns_led: int = 0
+        self.longest_lead: int = 0  # most turns in a row in the lead
+        self.largest_lead: int = 0  # most points ahead at the end of a turn
+
+    def to_dict(self):
+        return {
+            "name": self.name,
+            "turns_led": self.turns_led,
+            "longest_lead": self.longest_lead,
+            "largest_lead": self.largest_lead
+        }
+
+
+def num_turns(players: list[Player]) -> int:
+    return max((player.timeline.num_turns for player in players), default=0)
+
+
+def standings(players: list[Player], turn: int | None = None) -> list[tuple[Player, int]]:
+    """Players with their scores once `turn` is over (now if None), best first."""
+    scores = [(player, player.current_score if turn is None else player.score_at_turn(turn)) for player in players]
+    return sorted(scores, key=lambda item: -item[1])
+
+
+def spread_at_turn(player: Player, opponent: Player, turn: int) -> int:
+    return player.score_at_turn(turn) - opponent.score_at_turn(turn)
+
+
+def leader_at_turn(players: list[Player], turn: int) -> Player | None:
+    """The one player ahead once `turn` is over, None when the lead is shared."""
+    ranked = standings(players, turn)
+    if len(ranked) < 2:
+        return ranked[0][0] if ranked else None
+    (leader, best), (_, second) = ranked[:2]
+    return leader if best > second else None
+
+
+def lead_stats(players: list[Player]) -> tuple[list[LeadStats], int]:
+    """Lead statistics per player, in seat order, and how many times the lead changed hands."""
+    stats = [LeadStats(player.name) for player in players]
+    timelines = [player.timeline for player in players]
+    lead_changes = 0
+    last_leader = None
+    streak = 0
+    for turn in range(num_turns(players)):
+        scores = [timeline.at_turn(turn) for timeline in timelines]
+        best = max(scores)
+        leaders = [idx for idx, score in enumerate(scores) if score == best]
+        if len(leaders) > 1:
+            streak = 0
+            continue
+        leader = leaders[0]
+        streak = streak + 1 if leader == last_leader and streak else 1
+        if last_leader is not None and leader != last_leader:
+            lead_changes += 1
+        last_leader = leader
+        margin = best - max((score for idx, score in enumerate(scores) if idx != leader), default=best)
+        leader_stats = stats[leader]
+        leader_stats.turns_led += 1
+        leader_stats.longest_lead = max(leader_stats.longest_lead, streak)
+        leader_stats.largest_lead = max(leader_stats.largest_lead, margin)
+    return stats, lead_changes
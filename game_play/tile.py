@@ -1,55 +1,107 @@
 import random
+from collections import Counter
+import sys
 from typing import TYPE_CHECKING
 
-from colorama import Fore, Style, init
-
 import config
+from helper.text_output import terminal_colors
 
 if TYPE_CHECKING:
     from game_play.player import Player
 
-init(autoreset=True)
+# A blank on the rack; in a played word it is written before the letter it stands for ("C*AT")
+BLANK_TILE = "*"
+
+
+def split_blanks(word: str) -> tuple[str, list[bool]]:
+    """C*AT -> ("CAT", [False, True, False]), the flags marking the blanks."""
+    letters = []
+    is_blank = []
+    pending_blank = False
+    for letter in word.upper():
+        if letter == BLANK_TILE:
+            if pending_blank:
+                raise ValueError(f"Blank in {word} is not followed by a letter")
+            pending_blank = True
+            continue
+        letters.append(letter)
+        is_blank.append(pending_blank)
+        pending_blank = False
+    if pending_blank:
+        raise ValueError(f"Blank in {word} is not followed by a letter")
+    return "".join(letters), is_blank
+
+
+def join_blanks(letters: str, is_blank: list[bool]) -> str:
+    return "".join(BLANK_TILE + letter if blank else letter for letter, blank in zip(letters, is_blank))
+
 
 class LexiGridTile:
-    COLOR_MAP = {
-        "TW": Fore.RED,       # Triple Word (Red)
-        "DW": Fore.LIGHTRED_EX,  # Double Word (Light Red)
-        "TL": Fore.BLUE,      # Triple Letter (Blue)
-        "DL": Fore.CYAN,      # Double Letter (Cyan)
-        "*": Fore.YELLOW,     # Center Star (Yellow)
+    # A board holds 225 of these and an archive holds thousands of boards, so no per-tile __dict__
+    __slots__ = ("bonus", "letter", "placed_by", "turn_placed", "is_blank")
+
+    # colorama Fore colour names; the escape codes are looked up on first render
+    COLOR_NAMES = {
+        "TW": "RED",          # Triple Word (Red)
+        "DW": "LIGHTRED_EX",  # Double Word (Light Red)
+        "TL": "BLUE",         # Triple Letter (Blue)
+        "DL": "CYAN",         # Double Letter (Cyan)
+        "*": "YELLOW",        # Center Star (Yellow)
     }
+    _color_map: dict[str, str] | None = None
+
+    @classmethod
+    def color_map(cls) -> dict[str, str]:
+        if cls._color_map is None:
+            fore, _ = terminal_colors()
+            cls._color_map = {bonus: getattr(fore, name) for bonus, name in cls.COLOR_NAMES.items()}
+        return cls._color_map
 
     def __init__(self, bonus: str | None = None):
-        self.bonus: str | None = bonus  # 'DL', 'TL', 'DW', 'TW', "*" (starting tile) or None
+        self.bonus: str | None = sys.intern(bonus) if bonus else bonus  # 'DL', 'TL', 'DW', 'TW', "*" (starting tile) or None
         self.letter: str = None  # The letter placed here
         self.placed_by: str = None  # Player name
         self.turn_placed: int = None  # Turn number
+        self.is_blank: bool = False  # A blank standing in for the letter, worth no points
     
     def is_placeable(self) -> bool:
         return self.letter is None
 
-    def place_tile(self, letter: str | None, player: str | None, turn: int) -> bool:
+    def place_tile(self, letter: str | None, player: str | None, turn: int, is_blank: bool = False) -> bool:
         if self.letter is not None:
             return False  # Tile already occupied
         self.letter = letter
-        self.placed_by = player
+        self.placed_by = sys.intern(player) if isinstance(player, str) else player
         self.turn_placed = turn
+        self.is_blank = is_blank
         return True  # Successfully placed
 
     def clear(self):
         self.letter = None
         self.placed_by = None
         self.turn_placed = None
+        self.is_blank = False
 
-    def to_dict(self):
+    @property
+    def rack_letter(self) -> str | None:
+        # The tile as it was on the rack
+        return BLANK_TILE if self.is_blank else self.letter
+
+    @property
+    def placed_by_id(self) -> str | None:
+        # Loaded games hold Player objects, fresh placements hold the player's name
         placed_by = self.placed_by
         if placed_by is not None and hasattr(placed_by, "email"):
-            placed_by = placed_by.email
+            return placed_by.email
+        return placed_by
+
+    def to_dict(self):
         return {
             "bonus": self.bonus,
             "letter": self.letter,
-            "placed_by": placed_by,
-            "turn_placed": self.turn_placed
+            "placed_by": self.placed_by_id,
+            "turn_placed": self.turn_placed,
+            "is_blank": self.is_blank
         }
 
     @classmethod
@@ -59,37 +111,123 @@ class LexiGridTile:
         placed_by = d.get("placed_by", None)
         if player_lookup and placed_by in player_lookup:
             placed_by = player_lookup[placed_by]
+        elif isinstance(placed_by, str):
+            placed_by = sys.intern(placed_by)
         tile.placed_by = placed_by
         tile.turn_placed = d.get("turn_placed", None)
+        tile.is_blank = d.get("is_blank", False)
         return tile
 
     def __str__(self):
+        fore, style = terminal_colors()
         if self.letter:
-            return Style.BRIGHT + Fore.WHITE + self.letter
-        return self.COLOR_MAP.get(self.bonus, Fore.WHITE) + (self.bonus if self.bonus else "_") + Style.RESET_ALL
+            return style.BRIGHT + fore.WHITE + (self.letter.lower() if self.is_blank else self.letter)
+        return self.color_map().get(self.bonus, fore.WHITE) + (self.bonus if self.bonus else "_") + style.RESET_ALL
+
+def tile_distribution() -> dict[str, int]:
+    return dict(config.TILE_DISTRIBUTION)
+
+
+# splitmix64 constants: the n-th draw of a bag depends only on its seed and n
+_MASK64 = (1 << 64) - 1
+_GOLDEN_GAMMA = 0x9E3779B97F4A7C15
+
+
+def _splitmix64(seed: int, n: int) -> int:
+    z = (seed + (n + 1) * _GOLDEN_GAMMA) & _MASK64
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return z ^ (z >> 31)
+
 
 class TileBag:
-    def __init__(self):
-        self.letters: list[str] = []
-        for letter, count in config.TILE_DISTRIBUTION.items():
-            self.letters.extend([letter] * count)
-        random.shuffle(self.letters)
-    
-    def is_empty(self) -> None:
-        return len(self.letters) <= 0
+    """
+    Unseen tiles kept as per-letter counts. Each draw picks a tile uniformly from
+    the remaining ones with a counter-based generator, so a seed fixes a game's draws
+    and the whole random state is the seed plus the number of draws so far.
+    """
+
+    def __init__(self, seed: int | None = None, counts: dict[str, int] | None = None):
+        self.seed: int = seed if seed is not None else random.randrange(2**32)
+        self.num_draws: int = 0
+        self.counts: dict[str, int] = dict(counts) if counts is not None else tile_distribution()
+        self.num_tiles: int = sum(self.counts.values())
+
+    @property
+    def letters(self) -> list[str]:
+        return [letter for letter in sorted(self.counts) for _ in range(self.counts[letter])]
+
+    def __len__(self) -> int:
+        return self.num_tiles
+
+    def is_empty(self) -> bool:
+        return self.num_tiles <= 0
+
+    def _draw_one(self) -> str:
+        # Walk at most one entry per letter, so a draw costs the same however full the bag is
+        target = (_splitmix64(self.seed, self.num_draws) * self.num_tiles) >> 64
+        self.num_draws += 1
+        for letter, count in self.counts.items():
+            if target < count:
+                self.counts[letter] -= 1
+                self.num_tiles -= 1
+                return letter
+            target -= count
+        raise RuntimeError("Tile counts out of sync with num_tiles")
 
     def draw_tiles(self, count=7) -> list[str]:
-        drawn = self.letters[:count]
-        self.letters = self.letters[count:]
+        return [self._draw_one() for _ in range(min(count, self.num_tiles))]
+
+    def return_tiles(self, letters: list[str]):
+        for letter in letters:
+            self.counts[letter] = self.counts.get(letter, 0) + 1
+        self.num_tiles += len(letters)
+
+    def take_tiles(self, letters: list[str]):
+        """Remove these particular tiles, e.g. for a rack set by hand; nothing is taken if one is missing."""
+        missing = Counter(letters) - Counter({letter: count for letter, count in self.counts.items() if count > 0})
+        if missing:
+            raise ValueError(f"Not in the bag: {''.join(sorted(missing.elements()))}")
+        for letter in letters:
+            self.counts[letter] -= 1
+        self.num_tiles -= len(letters)
+
+    def exchange(self, letters: list[str], return_first: bool = False) -> list[str]:
+        """
+        Swap rack tiles for new ones. By default the replacements are drawn first, so the
+        exchanged tiles can not be redrawn; return_first puts them back before drawing.
+        """
+        if self.num_tiles < config.RACK_SIZE:
+            raise ValueError(f"Can not exchange with {self.num_tiles} tiles left in the bag, {config.RACK_SIZE} are needed")
+        if len(letters) > self.num_tiles:
+            raise ValueError(f"Can not exchange {len(letters)} tiles with {self.num_tiles} left in the bag")
+        if return_first:
+            self.return_tiles(letters)
+            return self.draw_tiles(len(letters))
+        drawn = self.draw_tiles(len(letters))
+        self.return_tiles(letters)
         return drawn
 
+    def clone(self) -> "TileBag":
+        bag = TileBag.__new__(TileBag)
+        bag.seed = self.seed
+        bag.num_draws = self.num_draws
+        bag.counts = dict(self.counts)
+        bag.num_tiles = self.num_tiles
+        return bag
+
     def to_dict(self):
         return {
-            "letters": self.letters[:]
+            "letters": self.letters,
+            "seed": self.seed,
+            "num_draws": self.num_draws,
         }
 
     @classmethod
     def from_dict(self, d: dict):
-        bag = TileBag()
-        bag.letters = list(d.get("letters", []))
+        counts = {letter: 0 for letter in tile_distribution()}
+        for letter in d.get("letters", []):
+            counts[letter] = counts.get(letter, 0) + 1
+        bag = TileBag(seed=d.get("seed", None), counts=counts)
+        bag.num_draws = d.get("num_draws", 0)
         return bag
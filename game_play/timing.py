@@ -0,0 +1,143 @@
+"""
+Per-phase timing of the engine, aggregated into histograms.
+
+Timing is off by default. `enable_timing()` turns it on for games created
+afterwards (or call `LexiGrid.enable_timing()` on one game). Every observation
+goes into the game's own PhaseTimings and into the process wide PROCESS_TIMINGS.
+While disabled, LexiGrid.phase() hands out one shared no-op context manager, so
+the only cost is a method call.
+
+Both rollups export as JSON (`to_dict`) or Prometheus text (`to_prometheus`).
+"""
+from bisect import bisect_left
+import threading
+import time
+
+# Histogram upper bounds in microseconds; the last bucket is +Inf
+BUCKET_BOUNDS_US = (10, 25, 50, 100, 250, 500, 1_000, 2_500, 5_000, 10_000, 25_000, 50_000, 100_000, 250_000, 1_000_000)
+
+_enabled = False
+
+
+def enable_timing(enabled: bool = True):
+    global _enabled
+    _enabled = enabled
+
+
+def is_timing_enabled() -> bool:
+    return _enabled
+
+
+class PhaseHistogram:
+    def __init__(self):
+        self.counts = [0] * (len(BUCKET_BOUNDS_US) + 1)
+        self.count = 0
+        self.total_ns = 0
+        self.max_ns = 0
+
+    def observe(self, elapsed_ns: int):
+        self.counts[bisect_left(BUCKET_BOUNDS_US, elapsed_ns / 1000)] += 1
+        self.count += 1
+        self.total_ns += elapsed_ns
+        if elapsed_ns > self.max_ns:
+            self.max_ns = elapsed_ns
+
+    def merge(self, other: "PhaseHistogram"):
+        self.counts = [a + b for a, b in zip(self.counts, other.counts)]
+        self.count += other.count
+        self.total_ns += other.total_ns
+        self.max_ns = max(self.max_ns, other.max_ns)
+
+    def cumulative(self) -> list[int]:
+        running, cumulative = 0, []
+        for count in self.counts:
+            running += count
+            cumulative.append(running)
+        return cumulative
+
+    def to_dict(self):
+        return {
+            "count": self.count,
+            "sum_us": self.total_ns / 1000,
+            "mean_us": self.total_ns / 1000 / self.count if self.count else 0.0,
+            "max_us": self.max_ns / 1000,
+            "buckets": [
+                [bound, count] for bound, count in zip(list(BUCKET_BOUNDS_US) + ["+Inf"], self.cumulative())
+            ],
+        }
+
+
+class PhaseTimings:
+    """Histograms keyed by phase name, e.g. "place_word.score"."""
+    def __init__(self):
+        self.phases: dict[str, PhaseHistogram] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, phase: str, elapsed_ns: int):
+        # Games in the server run on worker threads and share the process rollup
+        with self._lock:
+            histogram = self.phases.get(phase)
+            if histogram is None:
+                histogram = self.phases[phase] = PhaseHistogram()
+            histogram.observe(elapsed_ns)
+
+    def merge(self, other: "PhaseTimings"):
+        with self._lock:
+            for phase, histogram in other.phases.items():
+                self.phases.setdefault(phase, PhaseHistogram()).merge(histogram)
+
+    def reset(self):
+        with self._lock:
+            self.phases = {}
+
+    def to_dict(self):
+        return {phase: self.phases[phase].to_dict() for phase in sorted(self.phases)}
+
+    def to_prometheus(self, metric: str = "lexigrid_phase_seconds", labels: dict[str, str] | None = None) -> str:
+        extra = "".join(f',{key}="{value}"' for key, value in (labels or {}).items())
+        lines = [
+            f"# HELP {metric} Time spent in each LexiGrid engine phase.",
+            f"# TYPE {metric} histogram",
+        ]
+        for phase in sorted(self.phases):
+            histogram = self.phases[phase]
+            for bound, count in zip(BUCKET_BOUNDS_US, histogram.cumulative()):
+                lines.append(f'{metric}_bucket{{phase="{phase}"{extra},le="{bound / 1e6:g}"}} {count}')
+            lines.append(f'{metric}_bucket{{phase="{phase}"{extra},le="+Inf"}} {histogram.count}')
+            lines.append(f'{metric}_sum{{phase="{phase}"{extra}}} {histogram.total_ns / 1e9:.9f}')
+            lines.append(f'{metric}_count{{phase="{phase}"{extra}}} {histogram.count}')
+        return "\n".join(lines) + "\n"
+
+
+PROCESS_TIMINGS = PhaseTimings()
+
+
+class PhaseTimer:
+    __slots__ = ("timings", "phase", "start")
+
+    def __init__(self, timings: PhaseTimings, phase: str):
+        self.timings = timings
+        self.phase = phase
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        elapsed = time.perf_counter_ns() - self.start
+        self.timings.observe(self.phase, elapsed)
+        PROCESS_TIMINGS.observe(self.phase, elapsed)
+        return False
+
+
+class _NullPhase:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+NULL_PHASE = _NullPhase()
@@ -0,0 +1,125 @@
+"""
+Tracks the tiles each player has not seen and answers draw probability queries.
+
+A player's unseen tiles are the full distribution minus the board and their own
+rack; opponents' racks count as unseen because the player can not see them.
+LexiGrid updates the tracker as tiles are placed, drawn, exchanged and lifted
+by a challenge, so queries never rescan the board.
+"""
+from collections import Counter
+from functools import lru_cache
+from math import comb
+from typing import TYPE_CHECKING
+
+from game_play.tile import tile_distribution
+
+if TYPE_CHECKING:
+    from game_play.board import Board
+    from game_play.player import Player
+
+
+@lru_cache(maxsize=None)
+def _total_draws(pool: int, draws: int) -> int:
+    return comb(pool, draws)
+
+
+@lru_cache(maxsize=None)
+def hypergeometric_at_least(successes: int, pool: int, draws: int, wanted: int) -> float:
+    """P(at least `wanted` of the `successes` matching tiles in `draws` draws from `pool` tiles)."""
+    draws = min(draws, pool)
+    if wanted <= 0:
+        return 1.0
+    if wanted > min(successes, draws):
+        return 0.0
+    total = _total_draws(pool, draws)
+    hits = sum(
+        comb(successes, i) * comb(pool - successes, draws - i)
+        for i in range(wanted, min(successes, draws) + 1)
+    )
+    return hits / total
+
+
+@lru_cache(maxsize=None)
+def multivariate_at_least(requirements: tuple[tuple[int, int], ...], pool: int, draws: int) -> float:
+    """
+    P(drawing at least `wanted` of every letter in `requirements` at once.
+    `requirements` is a sorted tuple of (available, wanted) pairs, one per distinct letter.
+    """
+    draws = min(draws, pool)
+    if sum(wanted for _, wanted in requirements) > draws:
+        return 0.0
+    others = pool - sum(available for available, _ in requirements)
+
+    def ways(idx: int, draws_left: int) -> int:
+        if idx == len(requirements):
+            return comb(others, draws_left)
+        available, wanted = requirements[idx]
+        return sum(
+            comb(available, taken) * ways(idx + 1, draws_left - taken)
+            for taken in range(wanted, min(available, draws_left) + 1)
+        )
+
+    return ways(0, draws) / _total_draws(pool, draws)
+
+
+def draw_probability(unseen: dict[str, int], letters: str | list[str], draws: int) -> float:
+    """Chance that `draws` random tiles from `unseen` include all of `letters` (with repeats)."""
+    wanted = Counter(letter.upper() for letter in letters)
+    pool = sum(unseen.values())
+    if len(wanted) == 1:
+        letter, count = next(iter(wanted.items()))
+        return hypergeometric_at_least(unseen.get(letter, 0), pool, draws, count)
+    requirements = tuple(sorted((unseen.get(letter, 0), count) for letter, count in wanted.items()))
+    return multivariate_at_least(requirements, pool, draws)
+
+
+class UnseenTracker:
+    def __init__(self, players: list["Player"]):
+        self.players = players
+        self.unseen: list[Counter] = []
+        self.rebuild()
+
+    def rebuild(self, board: "Board | None" = None):
+        """Recompute every player's view from scratch, e.g. after loading a saved game."""
+        on_board = Counter()
+        if board is not None:
+            on_board.update(tile.rack_letter for row in board.grid for tile in row if tile.letter is not None)
+        distribution = Counter(tile_distribution())
+        self.unseen = []
+        for player in self.players:
+            view = distribution - on_board
+            view.subtract(player.rack)
+            self.unseen.append(view)
+
+    def _index(self, player: "Player") -> int:
+        return self.players.index(player)
+
+    def tiles_placed(self, player: "Player", letters: list[str]):
+        # The placing player already accounted for these tiles when they were drawn
+        idx = self._index(player)
+        for other_idx, view in enumerate(self.unseen):
+            if other_idx != idx:
+                view.subtract(letters)
+
+    def tiles_lifted(self, player: "Player", letters: list[str]):
+        """Tiles taken off the board by a successful challenge and back on the player's rack."""
+        idx = self._index(player)
+        for other_idx, view in enumerate(self.unseen):
+            if other_idx != idx:
+                view.update(letters)
+
+    def tiles_drawn(self, player: "Player", letters: list[str]):
+        self.unseen[self._index(player)].subtract(letters)
+
+    def tiles_returned(self, player: "Player", letters: list[str]):
+        """Tiles going from the player's rack back into the bag, by exchange or challenge."""
+        self.unseen[self._index(player)].update(letters)
+
+    def unseen_for(self, player: "Player") -> dict[str, int]:
+        return {letter: count for letter, count in self.unseen[self._index(player)].items() if count > 0}
+
+    def num_unseen(self, player: "Player") -> int:
+        return sum(count for count in self.unseen[self._index(player)].values() if count > 0)
+
+    def probability(self, player: "Player", letters: str | list[str], draws: int) -> float:
+        return draw_probability(self.unseen_for(player), letters, draws)
@@ -1,12 +1,17 @@
+import sys
+
 import config
 from game_play.board import Board
-from game_play.tile import LexiGridTile
+from game_play.tile import BLANK_TILE, LexiGridTile, split_blanks
 from helper.generic import num_to_char, two_d_to_one_d_coordinate
 
 
 class Word:
+    __slots__ = ("word", "start_row", "start_col", "is_horizontal")
+
     def __init__(self, word: str, start_row: int, start_col: int, is_horizontal: bool):
-        self.word = word.upper()
+        # Interned: the same few thousand words recur across every game of an archive
+        self.word = sys.intern(word.upper())
         self.start_row = start_row
         self.start_col = start_col
         self.is_horizontal = is_horizontal
@@ -61,7 +66,9 @@ class Word:
 
 
 class ScoredWord(Word):
-    def __init__(self, word: str | Word, start_row: int | None = None, start_col: int | None = None, is_horizontal: bool | None = None, bonuses=None):
+    __slots__ = ("bonuses", "blanks", "total_score")
+
+    def __init__(self, word: str | Word, start_row: int | None = None, start_col: int | None = None, is_horizontal: bool | None = None, bonuses=None, blanks: list[int] | None = None):
         if isinstance(word, Word):
             bonuses = bonuses if bonuses is not None else {}
             super().__init__(word.word, word.start_row, word.start_col, word.is_horizontal)
@@ -70,11 +77,26 @@ class ScoredWord(Word):
                 raise ValueError("start_row, start_col, and is_horizontal are required when word is a string")
             bonuses = bonuses if bonuses is not None else {}
             super().__init__(word, start_row, start_col, is_horizontal)
-        self.bonuses: dict[str, int] = bonuses
-        self.tile_scores_no_bonus: list[int] = [config.LETTER_SCORES.get(letter) for letter in self.word]
-        self.tile_score_with_bonus, self.word_multipliers = self._apply_bonuses()
+        self.bonuses: dict[int, str | None] = bonuses  # one_d square -> bonus, shared by the words of a turn
+        self.blanks: list[int] = blanks if blanks is not None else []  # Indexes of blanks, which score nothing
         self.total_score: int = self._calculate_total_score()
-    
+
+    # The per-tile breakdowns are only printed, so they are worked out when asked for rather than kept
+    @property
+    def tile_scores_no_bonus(self) -> list[int]:
+        tile_scores = [config.LETTER_SCORES.get(letter) for letter in self.word]
+        for i in self.blanks:
+            tile_scores[i] = 0
+        return tile_scores
+
+    @property
+    def tile_score_with_bonus(self) -> list[int]:
+        return self._apply_bonuses()[0]
+
+    @property
+    def word_multipliers(self) -> list[int]:
+        return self._apply_bonuses()[1]
+
     def _apply_bonuses(self) -> tuple[list[int], list[int]]:
         tile_scores = self.tile_scores_no_bonus[:]
         word_multipliers = []
@@ -92,8 +114,9 @@ class ScoredWord(Word):
         return tile_scores, word_multipliers
 
     def _calculate_total_score(self) -> int:
-        score = sum(self.tile_score_with_bonus)
-        for multiplier in self.word_multipliers:
+        tile_scores, word_multipliers = self._apply_bonuses()
+        score = sum(tile_scores)
+        for multiplier in word_multipliers:
             score *= multiplier
         return score
 
@@ -101,44 +124,57 @@ class ScoredWord(Word):
     def get_detailed_score_breakdown(self):
         print(f"Played '{self.word}' starting at: {num_to_char(self.start_col + 1)}{self.start_row + 1} going {'right' if self.is_horizontal else 'down'}")
         print(f"Each letter in the row scored the following points")
-        print("{:<25}: {}".format("Letters", " ".join([f"{letter:>3}" for letter in self.word])))
+        print("{:<25}: {}".format("Letters", " ".join([f"{letter.lower() if i in self.blanks else letter:>3}" for i, letter in enumerate(self.word)])))
+        tile_scores, word_multipliers = self._apply_bonuses()
         print("{:<25}: {}".format("Letter Score No Bonus", " ".join([f"{score:>3}" for score in self.tile_scores_no_bonus])))
-        print("{:<25}: {}".format("Letter Score With Bonus", " ".join([f"{score:>3}" for score in self.tile_score_with_bonus])))
-        print(f"Letter with bonus sum: {sum(self.tile_score_with_bonus)}")
-        if self.word_multipliers:
-            print(f"Multipliers: " + " ".join([f"* {mult}" for mult in self.word_multipliers]))
+        print("{:<25}: {}".format("Letter Score With Bonus", " ".join([f"{score:>3}" for score in tile_scores])))
+        print(f"Letter with bonus sum: {sum(tile_scores)}")
+        if word_multipliers:
+            print(f"Multipliers: " + " ".join([f"* {mult}" for mult in word_multipliers]))
         print(f"Total Word Score: {self.total_score}")
     
     def to_dict(self):
         base_dict = super().base_to_dict()
         score_dict = {
-            "bonuses": self.bonuses
+            "bonuses": self.bonuses,
+            "blanks": self.blanks
         }
         return base_dict | score_dict
     
     @classmethod 
     def from_dict(self, d: dict):
         w = Word.base_from_dict(d)
-        return ScoredWord(w, d.get("bonuses"))
+        # JSON turns the square keys into strings
+        bonuses = {int(square): bonus for square, bonus in d.get("bonuses", {}).items()} if d.get("bonuses") else None
+        return ScoredWord(w, bonuses=bonuses, blanks=d.get("blanks"))
 
 class PlayedWord(Word):
-    def __init__(self, word: str | Word, start_row: int | None = None, start_col: int | None = None, is_horizontal: bool | None = None, is_played_tile: list[bool] | None = None):
+    __slots__ = ("is_played_tile", "is_blank")
+
+    def __init__(self, word: str | Word, start_row: int | None = None, start_col: int | None = None, is_horizontal: bool | None = None, is_played_tile: list[bool] | None = None, is_blank: list[bool] | None = None):
         if isinstance(word, Word):
             super().__init__(word.word, word.start_row, word.start_col, word.is_horizontal)
         else:
             if start_row is None or start_col is None or is_horizontal is None:
                 raise ValueError("start_row, start_col, and is_horizontal are required when word is a string")
+            # Blanks are written before the letter they stand for: "C*AT"
+            word, blanks = split_blanks(word)
+            is_blank = is_blank if is_blank is not None else blanks
             super().__init__(word, start_row, start_col, is_horizontal)
         self.is_played_tile: list[bool] = [True] * len(self.word)  # True if this tile was played this turn
         if is_played_tile:
             self.is_played_tile = is_played_tile
+        self.is_blank: list[bool] = is_blank if is_blank else [False] * len(self.word)
     
     def display_played_word_info(self):
         print(f"Word: {self.word}")
-        print(f"Played tiles from word: {' '.join([letter if self.is_played_tile[i] else '#' for i, letter in enumerate(self.word)])}")
+        print(f"Played tiles from word: {' '.join([self._shown_letter(i) if self.is_played_tile[i] else '#' for i in range(len(self.word))])}")
         print(f"Starting Point: {num_to_char(self.start_col + 1)}{self.start_row + 1}")
         print(f"Going {'Right' if self.is_horizontal else 'Down'}")
 
+    def _shown_letter(self, i: int) -> str:
+        return self.word[i].lower() if self.is_blank[i] else self.word[i]
+
     # If extending or straddling a word, the player can input the another players tiles in their word
     # ie. If 'MEND' is on the board
     # A player can play AMEDNMENT placed like so: A - MEND - MENT
@@ -155,13 +191,15 @@ class PlayedWord(Word):
                 print(f"Played letter {letter} not equal to letter already on board ({board.get_letter(row,col)}) at {chr(65+col)}{row}")
                 return False
             else:
+                # A letter already on the board is played through, whatever the notation said
                 self.is_played_tile[i] = False
+                self.is_blank[i] = False
         return True
     
     def needed_tiles_str_format(self):
         if len(self.is_played_tile) != len(self.word):
             raise Exception(f"{len(self.is_played_tile)=} != {len(self.word)=}")
-        return "".join([letter for i, letter in enumerate(self.word) if self.is_played_tile[i]])
+        return "".join([BLANK_TILE if self.is_blank[i] else letter for i, letter in enumerate(self.word) if self.is_played_tile[i]])
 
 
     def iterate_word_positions_and_is_played(self):
@@ -175,14 +213,15 @@ class PlayedWord(Word):
     
     def to_dict(self):
         return super().base_to_dict() | {
-            "is_played_tile" : self.is_played_tile
+            "is_played_tile" : self.is_played_tile,
+            "is_blank": self.is_blank
         }
     
     @classmethod
-    def from_dict(self, d: dict) -> PlayedWord:
+    def from_dict(self, d: dict) -> "PlayedWord":
         w = Word.base_from_dict(d)
-        return PlayedWord(w, is_played_tile=d.get("is_played_tile", None))
+        return PlayedWord(w, is_played_tile=d.get("is_played_tile", None), is_blank=d.get("is_blank", None))
 
     @classmethod
-    def from_dcit(self, d: dict) -> PlayedWord:
+    def from_dcit(self, d: dict) -> "PlayedWord":
         return PlayedWord.from_dict(d)
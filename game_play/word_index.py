@@ -0,0 +1,261 @@
+"""
+Precomputed indexes over the lexicon for anagram and pattern queries.
+
+    by_signature    sorted letters -> words ("AEINRST" -> RETAINS, NASTIER, ...)
+    by_length       length -> words, with a parallel list of 26-bit letter masks
+    length_index    per length: 26-bit letter masks, (position, letter) -> word
+                    indexes and letter -> indexes of the words containing it
+    drop_one        signature less one letter -> the signatures it came from, for
+                    words of up to MAX_BLANK_LENGTH letters
+
+A rack with blanks is answered through drop_one: one blank is a single lookup and
+two blanks are 26, where trying every letter for every blank would take 351.
+
+Queries start from the most selective index and filter what is left, so none of
+them scans the whole word list. "?" (or ".") is a blank in racks and patterns.
+
+    python entry_script.py find --rack AEINRST?
+    python entry_script.py find --pattern ?A?E
+    python entry_script.py find --length 7 --contains Q --excludes U
+    python entry_script.py find --hooks CAT
+"""
+import argparse
+from array import array
+from itertools import combinations, combinations_with_replacement
+import string
+import time
+from typing import Iterable
+
+BLANKS = "?."
+# A full rack plus one letter on the board
+MAX_BLANK_LENGTH = 8
+ALPHABET = string.ascii_uppercase
+LETTER_BITS = {letter: 1 << i for i, letter in enumerate(ALPHABET)}
+
+
+def letter_mask(letters: str) -> int:
+    mask = 0
+    for letter in letters:
+        mask |= LETTER_BITS.get(letter, 0)
+    return mask
+
+
+def rack_subsets(rack: Iterable[str]) -> list[str]:
+    """Distinct sorted sub-racks, longest first."""
+    letters = sorted(rack)
+    seen = set()
+    subsets = []
+    for size in range(len(letters), 0, -1):
+        for combo in combinations(letters, size):
+            key = "".join(combo)
+            if key not in seen:
+                seen.add(key)
+                subsets.append(key)
+    return subsets
+
+
+class LengthIndex:
+    """Masks and position/letter lookups for the words of one length."""
+    def __init__(self, words: list[str]):
+        self.masks: list[int] = []
+        self.positions: dict[tuple[int, str], array] = {}
+        self.containing: dict[str, array] = {letter: array("I") for letter in ALPHABET}
+        for idx, word in enumerate(words):
+            mask = 0
+            for position, letter in enumerate(word):
+                key = (position, letter)
+                indexes = self.positions.get(key)
+                if indexes is None:
+                    indexes = self.positions[key] = array("I")
+                indexes.append(idx)
+                bit = LETTER_BITS[letter]
+                if not mask & bit:
+                    mask |= bit
+                    self.containing[letter].append(idx)
+            self.masks.append(mask)
+
+
+class WordIndex:
+    def __init__(self, words: Iterable[str]):
+        self.words: list[str] = sorted({word.upper() for word in words})
+        self.by_signature: dict[str, list[str]] = {}
+        self.by_length: dict[int, list[str]] = {}
+        for word in self.words:
+            self.by_signature.setdefault("".join(sorted(word)), []).append(word)
+            self.by_length.setdefault(len(word), []).append(word)
+        # Built per length on the first pattern or letter query of that length
+        self._length_indexes: dict[int, LengthIndex] = {}
+        # Built on the first query with a blank
+        self._drop_one: dict[str, list[str]] | None = None
+
+    def length_index(self, length: int) -> LengthIndex:
+        length_index = self._length_indexes.get(length)
+        if length_index is None:
+            length_index = self._length_indexes[length] = LengthIndex(self.by_length.get(length, []))
+        return length_index
+
+    def __len__(self):
+        return len(self.words)
+
+    @property
+    def drop_one(self) -> dict[str, list[str]]:
+        if self._drop_one is None:
+            self._drop_one = {}
+            for signature in self.by_signature:
+                if len(signature) > MAX_BLANK_LENGTH:
+                    continue
+                previous = None
+                for i, letter in enumerate(signature):
+                    # Dropping either of two equal letters leaves the same key
+                    if letter != previous:
+                        self._drop_one.setdefault(signature[:i] + signature[i + 1:], []).append(signature)
+                    previous = letter
+        return self._drop_one
+
+    def signatures_with_blanks(self, letters: str, blanks: int) -> set[str]:
+        """Signatures of the words made of exactly these letters and `blanks` more."""
+        letters = "".join(sorted(letters))
+        if not blanks:
+            return {letters} if letters in self.by_signature else set()
+        if len(letters) + blanks > MAX_BLANK_LENGTH:
+            extras, lookup = combinations_with_replacement(ALPHABET, blanks), self.by_signature
+        else:
+            # The last blank is resolved by drop_one, the others by trying each letter
+            extras, lookup = combinations_with_replacement(ALPHABET, blanks - 1), self.drop_one
+        found = set()
+        for extra in extras:
+            key = "".join(sorted(letters + "".join(extra))) if extra else letters
+            if lookup is self.by_signature:
+                if key in lookup:
+                    found.add(key)
+            else:
+                found.update(lookup.get(key, ()))
+        return found
+
+    def anagrams(self, letters: str) -> list[str]:
+        """Words using exactly these letters; blanks stand for any letter."""
+        letters = letters.upper()
+        blanks = sum(letters.count(blank) for blank in BLANKS)
+        fixed = "".join(letter for letter in letters if letter not in BLANKS)
+        if not blanks:
+            return list(self.by_signature.get("".join(sorted(fixed)), []))
+        return sorted(word for signature in self.signatures_with_blanks(fixed, blanks) for word in self.by_signature[signature])
+
+    def words_from_rack(self, rack: str, min_length: int = 2) -> list[str]:
+        """Every word that can be made from some of the rack's tiles, longest first."""
+        rack = rack.upper()
+        blanks = sum(rack.count(blank) for blank in BLANKS)
+        fixed = [letter for letter in rack if letter not in BLANKS]
+        signatures = set()
+        for subset in rack_subsets(fixed) + [""]:
+            for num_blanks in range(blanks + 1):
+                if len(subset) + num_blanks >= min_length:
+                    signatures.update(self.signatures_with_blanks(subset, num_blanks))
+        found = [word for signature in signatures for word in self.by_signature[signature]]
+        return sorted(found, key=lambda word: (-len(word), word))
+
+    def match(self, pattern: str) -> list[str]:
+        """Words of the pattern's length with its letters in place, e.g. "?A?E"."""
+        pattern = pattern.upper()
+        words = self.by_length.get(len(pattern), [])
+        fixed = [(position, letter) for position, letter in enumerate(pattern) if letter not in BLANKS]
+        if not fixed:
+            return list(words)
+        # Start from the rarest letter in place and check the others on the words themselves
+        positions = self.length_index(len(pattern)).positions
+        candidates = min((positions.get(key, ()) for key in fixed), key=len)
+        return [
+            words[idx] for idx in candidates
+            if all(words[idx][position] == letter for position, letter in fixed)
+        ]
+
+    def find(
+        self,
+        rack: str | None = None,
+        anagram: str | None = None,
+        pattern: str | None = None,
+        length: int | None = None,
+        contains: str = "",
+        excludes: str = "",
+    ) -> list[str]:
+        """Combined query; every given condition must hold."""
+        contains, excludes = contains.upper(), excludes.upper()
+        if anagram is not None:
+            words = self.anagrams(anagram)
+        elif rack is not None:
+            words = self.words_from_rack(rack)
+        elif pattern is not None:
+            words = self.match(pattern)
+        else:
+            lengths = [length] if length is not None else sorted(self.by_length)
+            return [word for word_length in lengths for word in self.filter_masks(word_length, contains, excludes)]
+        if pattern is not None:
+            pattern = pattern.upper()
+            words = [word for word in words if len(word) == len(pattern) and all(
+                letter in BLANKS or letter == word_letter for letter, word_letter in zip(pattern, word)
+            )]
+        if length is not None:
+            words = [word for word in words if len(word) == length]
+        if contains or excludes:
+            words = [word for word in words if self.has_letters(word, letter_mask(word), contains, excludes)]
+        return words
+
+    @staticmethod
+    def has_letters(word: str, mask: int, contains: str, excludes: str) -> bool:
+        required = letter_mask(contains)
+        if mask & required != required or mask & letter_mask(excludes):
+            return False
+        # The mask only says a letter is present; repeated letters need a count
+        return len(contains) == len(set(contains)) or all(word.count(letter) >= contains.count(letter) for letter in contains)
+
+    def filter_masks(self, length: int, contains: str, excludes: str) -> list[str]:
+        """Words of one length through the precomputed letter masks, without looking at the words."""
+        words = self.by_length.get(length, [])
+        length_index = self.length_index(length)
+        required, banned = letter_mask(contains), letter_mask(excludes)
+        masks = length_index.masks
+        if contains:
+            candidates = min((length_index.containing[letter] for letter in set(contains)), key=len)
+        else:
+            candidates = range(len(words))
+        selected = [words[idx] for idx in candidates if masks[idx] & required == required and not masks[idx] & banned]
+        if len(contains) != len(set(contains)):
+            selected = [word for word in selected if all(word.count(letter) >= contains.count(letter) for letter in contains)]
+        return selected
+
+
+def find_words_cli(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="Lexigrid find", description="Search the lexicon")
+    parser.add_argument("--rack", help="words playable from these tiles, ? for a blank")
+    parser.add_argument("--anagram", help="words using exactly these tiles, ? for a blank")
+    parser.add_argument("--pattern", help="letters in place and ? for any letter, e.g. ?A?E")
+    parser.add_argument("--length", type=int)
+    parser.add_argument("--contains", default="", help="letters every word must have")
+    parser.add_argument("--excludes", default="", help="letters no word may have")
+    parser.add_argument("--limit", type=int, default=200, help="print at most this many words")
+    parser.add_argument("--hooks", metavar="WORD", help="show the front and back hooks of WORD instead")
+    args = parser.parse_args(argv)
+
+    from game_play.dictionary import Dictionary
+    from helper.text_output import suppress_output
+
+    dictionary = Dictionary()
+    if args.hooks:
+        with suppress_output():
+            front, back = dictionary.front_hooks(args.hooks), dictionary.back_hooks(args.hooks)
+        print(f"{front.lower() or '-'} {args.hooks.upper()} {back.lower() or '-'}")
+        return 0
+    with suppress_output():
+        index = dictionary.index
+    start = time.perf_counter()
+    words = index.find(args.rack, args.anagram, args.pattern, args.length, args.contains, args.excludes)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    for word in words[:args.limit]:
+        print(word)
+    more = f" (showing {args.limit})" if len(words) > args.limit else ""
+    print(f"{len(words)} words{more} in {elapsed_ms:.2f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(find_words_cli())
@@ -13,3 +13,19 @@ def num_to_char(num: int):
 
 def char_to_num(char):
     return ord(char.upper()) - ord('A') + 1
+
+RACK_LETTER_BITS = 5
+
+# Sorted letters, 5 bits each with the first letter in the lowest bits; a 7 or 8 letter rack fits in 64 bits
+def pack_rack(letters: str) -> int:
+    packed = 0
+    for i, letter in enumerate(sorted(letters.upper())):
+        packed |= char_to_num(letter) << (RACK_LETTER_BITS * i)
+    return packed
+
+def unpack_rack(packed: int) -> str:
+    letters = []
+    while packed:
+        letters.append(num_to_char(packed & ((1 << RACK_LETTER_BITS) - 1)))
+        packed >>= RACK_LETTER_BITS
+    return "".join(letters)
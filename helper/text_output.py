@@ -1,18 +1,42 @@
+from contextlib import contextmanager, redirect_stdout
+import os
 import re
 
-from colorama import init, Fore, Style
+ANSI_ESCAPE = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')  # Regex for ANSI codes
+
+_colorama = None
+
+
+def terminal_colors():
+    """colorama's Fore and Style, importing colorama and wrapping stdout only on first use."""
+    global _colorama
+    if _colorama is None:
+        import colorama
+        colorama.init(autoreset=True)
+        _colorama = colorama
+    return _colorama.Fore, _colorama.Style
+
+
+def plain_output_default() -> bool:
+    # https://no-color.org: any non-empty NO_COLOR turns colours off
+    return bool(os.environ.get("NO_COLOR"))
 
 def center_colored_text(text, width):
-    ansi_escape = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')  # Regex for ANSI codes
-    visible_text = ansi_escape.sub('', text) 
+    visible_text = ANSI_ESCAPE.sub('', text) if "\x1b" in text else text
     padding = max(0, width - len(visible_text))  # Calculate required padding
     left_pad = padding // 2
     right_pad = padding - left_pad
     return " " * left_pad + text + " " * right_pad  # Apply padding around the text
 
+@contextmanager
+def suppress_output():
+    # The engine reports through print(); batch tools run it silently
+    with open(os.devnull, "w", encoding="utf8") as devnull, redirect_stdout(devnull):
+        yield
+
 if __name__ == "__main__":
+    Fore, Style = terminal_colors()
     print("1234|")
     letter = Style.BRIGHT + Fore.WHITE + 'a'
     print(center_colored_text(letter, 4) + '|')
-    init(autoreset=True)
     
\ No newline at end of file
@@ -0,0 +1,101 @@
+from collections import Counter
+import json
+from pathlib import Path
+import tempfile
+import unittest
+
+from game_play.analytics import GameArchive, stats_cli
+from game_play.lexi_grid import LexiGrid
+from game_play.player import Player
+from game_play.position_corpus import load_corpus
+from helper.text_output import suppress_output
+
+TURN_ACTIONS = ("play", "pass", "exchange", "skip")
+
+
+def naive_stats(games: list[dict]) -> dict:
+    turns = turn_score = plays = bingos = challenges = successes = 0
+    words = Counter()
+    for game in games:
+        for player in game["players"]:
+            for turn in player["score_history"]:
+                if turn["move_action"] in TURN_ACTIONS:
+                    turns += 1
+                    turn_score += turn["total_score"]
+                if turn["move_action"] == "play":
+                    plays += 1
+                    bingos += turn["is_bingo"]
+                if turn["move_action"] == "challenge" and turn["is_challenger"]:
+                    challenges += 1
+                    successes += bool(turn["is_challenge_successful"])
+                words.update(item["word"]["word"] for item in turn["scored_words"])
+    return {
+        "average_score_per_turn": turn_score / turns,
+        "bingo_rate": bingos / plays if plays else 0.0,
+        "challenge_success_rate": successes / challenges if challenges else 0.0,
+        "words": words,
+    }
+
+
+class TestGameArchive(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.corpus = load_corpus()
+
+    def challenged_game(self) -> dict:
+        alice, bob = Player("alice"), Player("bob")
+        with suppress_output():
+            game = LexiGrid([alice, bob], seed=3)
+            alice.rack = list("CTXEEEE")
+            game.unseen.rebuild(game.board)
+            game.make_move(game.parse_move("play cxt h8 h"))
+            game.make_move(game.parse_move("challenge"))
+        return game.to_dict()
+
+    def test_matches_a_plain_loop(self):
+        games = list(self.corpus.values()) + [self.challenged_game()]
+        archive = GameArchive()
+        archive.add_games((str(i), game) for i, game in enumerate(games))
+        expected = naive_stats(games)
+        self.assertAlmostEqual(archive.average_score_per_turn(), expected["average_score_per_turn"])
+        self.assertAlmostEqual(archive.bingo_rate(), expected["bingo_rate"])
+        self.assertEqual(archive.challenge_success_rate(), 1.0)
+        self.assertEqual(archive.totals["challenges"], 1)
+        top = archive.top_words(5)
+        self.assertEqual([count for _, count in top], [count for _, count in expected["words"].most_common(5)])
+        self.assertEqual(dict(archive.top_words(len(expected["words"]))), dict(expected["words"]))
+
+    def test_heatmap_counts_tiles_on_each_square(self):
+        archive = GameArchive()
+        archive.add_games(self.corpus.items())
+        heatmap = archive.square_heatmap()
+        letters = next(iter(self.corpus.values()))["board"]["grid"]["letteres"]
+        self.assertEqual(heatmap.shape, (len(letters), len(letters[0])))
+        tiles = sum(letter is not None for game in self.corpus.values() for row in game["board"]["grid"]["letteres"] for letter in row)
+        self.assertEqual(int(heatmap.sum()), tiles)
+        self.assertEqual(heatmap[7, 7], len(self.corpus))  # every game opens through the centre
+
+    def test_adding_games_in_batches_gives_the_same_numbers(self):
+        items = list(self.corpus.items())
+        whole, batched = GameArchive(), GameArchive()
+        whole.add_games(items)
+        for item in items:
+            batched.add_game(*item)
+        self.assertEqual(whole.summary(20), batched.summary(20))
+        self.assertEqual(whole.square_heatmap().tolist(), batched.square_heatmap().tolist())
+        self.assertEqual(whole.average_score_per_turn_by_game().tolist(), batched.average_score_per_turn_by_game().tolist())
+        self.assertEqual(len(batched.moves), len(whole.moves))
+
+    def test_reads_saved_games_and_corpora(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            Path(tmp, "corpus.json").write_text(json.dumps(self.corpus))
+            Path(tmp, "games").mkdir()
+            Path(tmp, "games", "one.json").write_text(json.dumps(self.challenged_game()))
+            archive = GameArchive()
+            self.assertEqual(archive.add_files([tmp]), len(self.corpus) + 1)
+            with suppress_output():
+                self.assertEqual(stats_cli([tmp, "--json"]), 0)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,87 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+import config
+from game_play.batch import run_script, run_scripts, set_rack
+from game_play.lexi_grid import LexiGrid
+from game_play.player import Player
+from game_play.tile import tile_distribution
+from helper.text_output import suppress_output
+
+
+SCRIPT = """#players alice bob
+#rack alice HELLOAB
+play hello h8 h
+#rack bob YEABCDF
+play yeh h6 v
+not a move
+"""
+
+
+class TestBatchScripts(unittest.TestCase):
+    def setUp(self):
+        self.script_dir = tempfile.TemporaryDirectory()
+        self.script_path = Path(self.script_dir.name) / "game.txt"
+        self.script_path.write_text(SCRIPT, encoding="utf8")
+
+    def tearDown(self):
+        self.script_dir.cleanup()
+
+    def test_script_runs_moves_and_reports_bad_lines(self):
+        result = run_script(self.script_path)
+        self.assertEqual(result.moves, 2)
+        self.assertEqual(result.rejected, 0)
+        self.assertGreater(result.scores["alice"], 0)
+        self.assertGreater(result.scores["bob"], 0)
+        self.assertEqual(len(result.errors), 1)
+        self.assertTrue(result.errors[0].startswith("line 6"))
+
+    def test_rack_directive_takes_the_tiles_from_the_bag(self):
+        with suppress_output():
+            game = LexiGrid([Player("alice"), Player("bob")], seed=1)
+        alice, bob = game.players
+        set_rack(game, "#rack alice EEE")
+        self.assertEqual(alice.rack, ["E", "E", "E"])
+        self.assertEqual(len(game.tile_bag) + len(alice.rack) + len(bob.rack), sum(tile_distribution().values()))
+        self.assertEqual(game.tile_bag.counts["E"] + bob.rack.count("E"), tile_distribution()["E"] - 3)
+        self.assertEqual(game.unseen.unseen_for(alice).get("E", 0), tile_distribution()["E"] - 3)
+
+        too_many = "E" * (tile_distribution()["E"] + 1)
+        with self.assertRaises(ValueError):
+            set_rack(game, f"#rack alice {too_many}")
+        self.assertEqual(alice.rack, ["E", "E", "E"])
+        self.assertEqual(len(game.tile_bag) + len(alice.rack) + len(bob.rack), sum(tile_distribution().values()))
+
+    def test_rack_directive_takes_tiles_another_rack_holds(self):
+        with suppress_output():
+            game = LexiGrid([Player("alice"), Player("bob")], seed=1)
+        alice, bob = game.players
+        rarest = min(tile_distribution(), key=tile_distribution().get)
+        every_tile = rarest * tile_distribution()[rarest]
+        set_rack(game, f"#rack bob {every_tile}")
+        set_rack(game, f"#rack alice {every_tile}")
+        self.assertEqual("".join(alice.rack), every_tile)
+        self.assertNotIn(rarest, bob.rack)
+        self.assertEqual(len(bob.rack), config.RACK_SIZE)
+        self.assertEqual(len(game.tile_bag) + len(alice.rack) + len(bob.rack), sum(tile_distribution().values()))
+
+    def test_engine_failure_is_reported_for_that_script_only(self):
+        script_dir = Path(self.script_dir.name)
+        (script_dir / "not_a_game.json").write_text("[]", encoding="utf8")
+        (script_dir / "broken.txt").write_text("#load not_a_game.json\npass\n", encoding="utf8")
+        results, _ = run_scripts([self.script_dir.name], max_workers=1)
+        by_name = {Path(result.path).name: result for result in results}
+        self.assertTrue(by_name["broken.txt"].errors[0].startswith("AttributeError"))
+        self.assertEqual(by_name["game.txt"].moves, 2)
+
+    def test_directory_of_scripts(self):
+        (Path(self.script_dir.name) / "second.txt").write_text(SCRIPT, encoding="utf8")
+        results, seconds = run_scripts([self.script_dir.name], max_workers=1)
+        self.assertEqual(len(results), 2)
+        self.assertEqual(results[0].scores, results[1].scores)
+        self.assertGreater(seconds, 0)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,31 @@
+import json
+import unittest
+
+from benchmarks.suite import compare_to_baseline, percentile
+from game_play.lexi_grid import LexiGrid
+from game_play.position_corpus import generate_position
+
+
+class TestBenchmarkStats(unittest.TestCase):
+    def test_percentile(self):
+        values = [float(v) for v in range(1, 101)]
+        self.assertEqual(percentile(values, 50), 51.0)
+        self.assertEqual(percentile(values, 99), 99.0)
+        self.assertEqual(percentile([], 50), 0.0)
+
+    def test_compare_flags_only_slow_benchmarks(self):
+        baseline = {"results": {"fast": {"p50": 10.0}, "slow": {"p50": 10.0}}}
+        current = {"results": {"fast": {"p50": 11.0}, "slow": {"p50": 20.0}, "new": {"p50": 1.0}}}
+        comparison = {c["name"]: c for c in compare_to_baseline(current, baseline, threshold=0.25)}
+        self.assertFalse(comparison["fast"]["regression"])
+        self.assertTrue(comparison["slow"]["regression"])
+        self.assertNotIn("new", comparison)
+
+
+class TestResave(unittest.TestCase):
+    def test_loaded_game_saves_again(self):
+        game = generate_position(5, num_turns=4)
+        loaded = LexiGrid.from_dict(json.loads(json.dumps(game.to_dict())))
+        resaved = json.loads(json.dumps(loaded.to_dict()))
+        self.assertEqual(resaved["board"]["grid"]["letteres"], game.board.to_dict()["grid"]["letteres"])
+        self.assertIn("p1@corpus.lexigrid", {email for row in resaved["board"]["grid"]["placed_by"] for email in row})
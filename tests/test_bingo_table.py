@@ -0,0 +1,53 @@
+from pathlib import Path
+import tempfile
+import unittest
+
+from game_play.bingo_table import BingoTable, bingo_postings, build_bingo_table
+
+WORDS = ["RETAINS", "NASTIER", "STAINER", "RETINAS", "CANISTER", "SCANTIER", "TRAINERS",
+         "RESTRAIN", "NOTARIES", "SENORITA", "QUIXOTIC", "CAT", "RETAINERS", "SALTIER"]
+
+
+class TestBingoTable(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp = tempfile.TemporaryDirectory()
+        cls.path = Path(cls.tmp.name) / "bingos.bin"
+        cls.stats = build_bingo_table(cls.path, WORDS)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmp.cleanup()
+
+    def test_sevens_and_eights_through_a_board_letter(self):
+        with BingoTable(self.path) as table:
+            sevens, eights = table.find("aeinrst")
+            self.assertEqual(sevens, ["NASTIER", "RETAINS", "RETINAS", "STAINER"])
+            self.assertEqual(eights, {"C": ["CANISTER", "SCANTIER"], "O": ["NOTARIES", "SENORITA"], "R": ["RESTRAIN", "TRAINERS"]})
+            self.assertEqual(table.find("QZXJKVW"), ([], {}))
+
+    def test_blanks_try_every_letter(self):
+        with BingoTable(self.path) as table:
+            sevens, eights = table.find("RETAI?S")
+            self.assertEqual(sevens, ["NASTIER", "RETAINS", "RETINAS", "SALTIER", "STAINER"])
+            self.assertIn("QUIXOTIC", [word for words in table.find("QUIXO*C")[1].values() for word in words])
+
+    def test_two_blanks_look_up_each_letter_pair_once(self):
+        with BingoTable(self.path) as table:
+            self.assertEqual(len(table._racks("RETA??S")), 351)
+            self.assertEqual(table.find("RETA??S")[0], ["NASTIER", "RETAINS", "RETINAS", "SALTIER", "STAINER"])
+
+    def test_only_bingo_lengths_are_stored(self):
+        words, postings = bingo_postings(WORDS)
+        self.assertNotIn("CAT", words)
+        self.assertNotIn("RETAINERS", words)
+        self.assertEqual(self.stats["words"], len(words))
+        self.assertLessEqual(2 * self.stats["racks"], self.stats["slots"])
+
+    def test_rack_must_be_full(self):
+        with BingoTable(self.path) as table, self.assertRaises(ValueError):
+            table.find("CAT")
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
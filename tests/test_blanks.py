@@ -0,0 +1,115 @@
+import io
+from itertools import combinations_with_replacement
+import unittest
+
+from game_play.dictionary import Dictionary
+from game_play.gcg import game_to_gcg, read_gcg, replay_gcg, write_gcg
+from game_play.lexi_grid import LexiGrid
+from game_play.move_parser import MoveParseError, parse_command
+from game_play.player import Player
+from game_play.position_corpus import designate_blanks, find_and_play
+from game_play.tile import TileBag, join_blanks, split_blanks, tile_distribution
+from game_play.word_index import ALPHABET
+from helper.text_output import suppress_output
+
+
+class TestBlankNotation(unittest.TestCase):
+    def test_split_and_join(self):
+        self.assertEqual(split_blanks("c*at"), ("CAT", [False, True, False]))
+        self.assertEqual(join_blanks("CAT", [False, True, False]), "C*AT")
+        self.assertEqual(designate_blanks("CATS", "ST"), "*C*ATS")
+
+    def test_blank_must_precede_a_letter(self):
+        self.assertEqual(parse_command("play c*at h8 h").word_play.word, "c*at")
+        for word in ("cat*", "c**at"):
+            with self.assertRaises(MoveParseError):
+                parse_command(f"play {word} h8 h")
+
+
+class TestBlankPlay(unittest.TestCase):
+    def setUp(self):
+        self.alice, self.bob = Player("alice"), Player("bob")
+        with suppress_output():
+            self.game = LexiGrid([self.alice, self.bob], seed=3)
+
+    def play(self, rack: str, command: str):
+        player = self.game.players[self.game.current_player_idx]
+        player.rack = list(rack)
+        self.game.unseen.rebuild(self.game.board)
+        with suppress_output():
+            return self.game.make_move(self.game.parse_move(command))
+
+    def test_blank_scores_nothing(self):
+        self.assertEqual(self.play("CT*EEEE", "play c*at h8 h").value, "next")
+        # (C 3 + blank 0 + T 1) on the centre star
+        self.assertEqual(self.alice.current_score, 8)
+        tile = self.game.board.get_tile(7, 8)
+        self.assertEqual((tile.letter, tile.is_blank, tile.rack_letter), ("A", True, "*"))
+        self.assertEqual(self.alice.score_history[-1].scored_words.popitem()[1].tile_scores_no_bonus, [3, 0, 1])
+        self.assertIn(" a ", self.game.board.renderer(plain=True).render(self.game.board))
+
+    def test_designated_blank_needs_a_blank_on_the_rack(self):
+        self.assertEqual(self.play("CATEEEE", "play c*at h8 h").value, "retry")
+        self.assertEqual(self.play("CT*EEEE", "play cat h8 h").value, "retry")
+
+    def test_bingo_with_repeated_letters_and_blanks(self):
+        # RETIREE from RETIE plus two blanks: (4 + 0 + 0 + 1) doubled, and the 50 point bonus
+        self.assertEqual(self.play("RETIE**", "play reti*r*ee h8 h").value, "next")
+        self.assertTrue(self.alice.score_history[-1].is_bingo)
+        self.assertEqual(self.alice.current_score, 60)
+
+    def test_challenge_returns_the_blank(self):
+        self.play("CT*EEEE", "play c*xt h8 h")
+        with suppress_output():
+            self.game.make_move(self.game.parse_move("challenge"))
+        self.assertEqual(sorted(self.alice.rack)[:3], ["*", "C", "E"])
+        self.assertFalse(self.game.board.get_tile(7, 8).is_blank)
+
+    def test_blanks_survive_save_and_load(self):
+        self.play("CT*EEEE", "play c*at h8 h")
+        loaded = LexiGrid.from_dict(self.game.to_dict(), dictionary=self.game.dictionary)
+        self.assertTrue(loaded.board.get_tile(7, 8).is_blank)
+        self.assertFalse(loaded.board.get_tile(7, 7).is_blank)
+        scored_word = next(iter(loaded.players[0].score_history[-1].scored_words.values()))
+        self.assertEqual(scored_word.blanks, [1])
+        self.assertEqual(scored_word.tile_scores_no_bonus, [3, 0, 1])
+
+    def test_gcg_round_trip_keeps_blanks(self):
+        self.play("CT*EEEE", "play c*at h8 h")
+        out = io.StringIO()
+        write_gcg(game_to_gcg(self.game), out)
+        self.assertIn("CaT", out.getvalue())
+        self.assertIn(">alice: C?T 8H CaT", out.getvalue())
+        game, mismatches = replay_gcg(read_gcg(io.StringIO(out.getvalue())))
+        self.assertEqual(mismatches, [])
+        self.assertTrue(game.board.get_tile(7, 8).is_blank)
+
+
+class TestBlankMoveGeneration(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.dictionary = Dictionary()
+        with suppress_output():
+            cls.index = cls.dictionary.index
+
+    def test_two_blanks_match_trying_every_letter(self):
+        naive = set()
+        for extra in combinations_with_replacement(ALPHABET, 2):
+            naive.update(self.index.by_signature.get("".join(sorted("QAT" + "".join(extra))), []))
+        self.assertEqual(sorted(naive), self.index.anagrams("QAT??"))
+        self.assertIn("QUAT", self.index.words_from_rack("QAT??"))
+
+    def test_bot_plays_blanks(self):
+        with suppress_output():
+            game = LexiGrid([Player("p1"), Player("p2")], dictionary=self.dictionary, seed=5)
+            game.tile_bag = TileBag(seed=5, counts=tile_distribution() | {"*": 2})
+            game.players[0].rack = list("QZ**XJV")
+            self.assertIsNotNone(find_and_play(game, self.index))
+        blanks = [tile for row in game.board.grid for tile in row if tile.is_blank]
+        self.assertTrue(blanks)
+        kept = game.players[0].rack.count("*") - game.previous_moves[-1].drawn_tiles.count("*")
+        self.assertEqual(kept + len(blanks), 2)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,36 @@
+import unittest
+
+from game_play.board import Board
+from game_play.board_renderer import BoardRenderer
+from helper.text_output import ANSI_ESCAPE
+
+
+class TestBoardRenderer(unittest.TestCase):
+    def test_only_changed_rows_are_rerendered(self):
+        board = Board()
+        renderer = BoardRenderer(plain=True)
+        self.assertEqual(len(renderer.update(board)), len(board.grid))
+        self.assertEqual(renderer.update(board), [])
+        board.place_tile(7, 7, "A", "alice", 0)
+        board.place_tile(7, 8, "T", "alice", 0)
+        self.assertEqual(renderer.update(board), [7])
+
+    def test_plain_frame_has_no_escape_codes(self):
+        board = Board()
+        board.place_tile(7, 7, "Q", "alice", 0)
+        plain = board.renderer(plain=True).render(board)
+        coloured = board.renderer(plain=False).render(board)
+        self.assertNotIn("\x1b", plain)
+        self.assertIn("\x1b", coloured)
+        self.assertEqual(ANSI_ESCAPE.sub("", coloured), plain)
+        self.assertIn(" 8 | ", plain)
+
+    def test_redraw_rewrites_changed_rows_only(self):
+        board = Board()
+        renderer = BoardRenderer()
+        self.assertIn(renderer.header, renderer.redraw(board))
+        board.place_tile(0, 0, "Z", "alice", 0)
+        update = renderer.redraw(board)
+        self.assertEqual(update.count("\x1b[K"), 1)
+        self.assertIn(f"\x1b[{2 * len(board.grid)}A", update)
+        self.assertEqual(renderer.redraw(board), "")
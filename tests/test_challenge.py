@@ -0,0 +1,77 @@
+import unittest
+
+from game_play.dictionary import Dictionary
+from game_play.lexi_grid import LexiGrid
+from game_play.player import Player
+from helper.text_output import suppress_output
+
+
+class CountingDictionary(Dictionary):
+    def __init__(self):
+        super().__init__()
+        self.batch_calls = 0
+
+    def check_words(self, words) -> list[str]:
+        self.batch_calls += 1
+        return super().check_words(words)
+
+
+class TestChallengeValidation(unittest.TestCase):
+    def setUp(self):
+        self.alice, self.bob = Player("alice"), Player("bob")
+        self.dictionary = CountingDictionary()
+        with suppress_output():
+            self.game = LexiGrid([self.alice, self.bob], dictionary=self.dictionary, seed=1)
+            self.game.load_board_state({(7, 7): "A", (7, 8): "T"})
+
+    def play(self, rack: str, command: str):
+        self.alice.rack = list(rack)
+        self.game.unseen.rebuild(self.game.board)
+        with suppress_output():
+            return self.game.make_move(self.game.parse_move(command))
+
+    def test_check_words_reports_failures_once(self):
+        self.assertEqual(Dictionary().check_words(["CAT", "ATX", "QZX", "ATX"]), ["ATX", "QZX"])
+
+    def test_invalid_cross_word_fails_the_challenge(self):
+        # OX is a word, but the X also extends AT into ATX
+        self.assertEqual(self.play("OXEEEEE", "play ox 7 j v").value, "next")
+        with suppress_output():
+            self.game.make_move(self.game.parse_move("challenge"))
+        self.assertIsNone(self.game.board.get_letter(7, 9))
+        self.assertEqual(self.alice.current_score, 0)
+
+    def test_verdict_is_cached_on_the_turn(self):
+        self.play("OXEEEEE", "play ox 7 j v")
+        prev_move = self.game.previous_moves[-1]
+        self.assertEqual(self.game.get_invalid_words(prev_move), ["ATX"])
+        self.assertEqual(self.game.get_invalid_words(prev_move), ["ATX"])
+        self.assertEqual(self.dictionary.batch_calls, 1)
+        self.assertEqual(self.alice.score_history[-1].invalid_words, ["ATX"])
+
+
+class TestAutoValidate(TestChallengeValidation):
+    def setUp(self):
+        super().setUp()
+        self.game.auto_validate = True
+
+    def test_invalid_cross_word_fails_the_challenge(self):
+        # Never reaches a challenge: the play itself is rejected and the board left as it was
+        self.assertEqual(self.play("OXEEEEE", "play ox 7 j v").value, "retry")
+        self.assertIsNone(self.game.board.get_letter(6, 9))
+        self.assertIsNone(self.game.board.get_letter(7, 9))
+        self.assertEqual(self.alice.rack, list("OXEEEEE"))
+        self.assertEqual((self.alice.current_score, self.game.previous_moves), (0, []))
+
+    def test_verdict_is_cached_on_the_turn(self):
+        self.assertEqual(self.play("OXEEEEE", "play ax 8 h v").value, "next")
+        self.assertEqual(self.alice.score_history[-1].invalid_words, [])
+        self.assertEqual(self.game.get_invalid_words(self.game.previous_moves[-1]), [])
+        self.assertEqual(self.dictionary.batch_calls, 1)
+
+    def test_mode_is_saved(self):
+        self.assertTrue(LexiGrid.from_dict(self.game.to_dict(), dictionary=self.dictionary).auto_validate)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,109 @@
+import io
+from pathlib import Path
+import tempfile
+import unittest
+
+from game_play.gcg import (
+    GcgEventType,
+    GcgPlayer,
+    game_to_gcg,
+    gcg_position_to_word_play,
+    import_gcg_file,
+    iter_gcg,
+    read_gcg,
+    replay_gcg,
+    word_play_to_gcg_position,
+    write_gcg,
+)
+from game_play.lexi_grid import LexiGrid
+from game_play.move import Move
+from game_play.player import Player
+from helper.text_output import suppress_output
+
+
+SAMPLE_GCG = """#character-encoding UTF-8
+#player1 alice Alice Smith
+#player2 bob Bob Jones
+#title Sample
+>alice: DEHLLOX 8D HELLO +24 24
+>bob: AEIORST -AEI +0 0
+>alice: ADLOX? H8 .X +9 33
+>bob: AEIORST -  +0 0
+>alice: ADLO? -- -9 24
+#note a continuation note
+>bob: (ADLO) +10 10
+"""
+
+
+class TestGcgParsing(unittest.TestCase):
+    def test_positions_map_to_word_play(self):
+        horizontal = gcg_position_to_word_play("8D", "HELLO")
+        self.assertEqual((horizontal.row, horizontal.col, horizontal.direction), (8, "d", "H"))
+        vertical = gcg_position_to_word_play("H10", "WORD")
+        self.assertEqual((vertical.row, vertical.col, vertical.direction), (10, "h", "V"))
+        self.assertEqual(word_play_to_gcg_position(horizontal), "8D")
+        self.assertEqual(word_play_to_gcg_position(vertical), "H10")
+
+    def test_streaming_parse_yields_events_in_order(self):
+        items = list(iter_gcg(io.StringIO(SAMPLE_GCG)))
+        players = [item for item in items if isinstance(item, GcgPlayer)]
+        self.assertEqual([p.nick for p in players], ["alice", "bob"])
+        self.assertEqual(players[0].name, "Alice Smith")
+
+        record = read_gcg(io.StringIO(SAMPLE_GCG))
+        self.assertEqual(
+            [event.event_type for event in record.events],
+            [GcgEventType.PLAY, GcgEventType.EXCHANGE, GcgEventType.PLAY,
+             GcgEventType.PASS, GcgEventType.WITHDRAWN, GcgEventType.END_RACK],
+        )
+        self.assertEqual(record.events[1].exchanged, "AEI")
+        self.assertEqual(record.events[4].score, -9)
+        self.assertEqual(record.events[5].exchanged, "ADLO")
+        self.assertIn(("title", "Sample"), record.pragmas)
+
+    def test_write_then_read_round_trip(self):
+        record = read_gcg(io.StringIO(SAMPLE_GCG))
+        out = io.StringIO()
+        write_gcg(record, out)
+        again = read_gcg(io.StringIO(out.getvalue()))
+        self.assertEqual(again.players, record.players)
+        self.assertEqual(
+            [(e.nick, e.event_type, e.score, e.cumulative) for e in again.events],
+            [(e.nick, e.event_type, e.score, e.cumulative) for e in record.events],
+        )
+
+
+class TestGcgReplay(unittest.TestCase):
+    def test_exported_game_replays_with_matching_scores(self):
+        alice = Player("alice", "Alice")
+        bob = Player("bob", "Bob")
+        with suppress_output():
+            game = LexiGrid([alice, bob])
+            alice.rack = list("HELLOXY")
+            game.make_move(Move("play hello d8 h", alice))
+            bob.rack = list("YEABCDF")
+            game.make_move(Move("play yeh d6 v", bob))
+
+        out = io.StringIO()
+        write_gcg(game_to_gcg(game), out)
+        # The H of HELLO is played through, so it is not part of bob's rack
+        self.assertIn(">bob: YE D6 YEH", out.getvalue())
+        replayed, mismatches = replay_gcg(read_gcg(io.StringIO(out.getvalue())))
+
+        self.assertEqual(mismatches, [])
+        self.assertEqual([p.current_score for p in replayed.players], [alice.current_score, bob.current_score])
+        self.assertEqual(replayed.board.export_state(), game.board.export_state())
+
+
+    def test_imports_a_game_with_a_blank(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp, "blank.gcg")
+            path.write_text("#player1 alice Alice\n#player2 bob Bob\n>alice: C?T 8H CaT +8 8\n", encoding="utf8")
+            result = import_gcg_file(path)
+        self.assertIsNone(result.error)
+        self.assertEqual(result.mismatches, [])
+        self.assertEqual(result.final_scores, [8, 0])
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
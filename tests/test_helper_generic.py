@@ -6,6 +6,8 @@ from helper.generic import (
     one_d_to_two_d_coordinate,
     num_to_char,
     char_to_num,
+    pack_rack,
+    unpack_rack,
 )
 
 
@@ -50,8 +52,14 @@ class TestHelperGeneric(unittest.TestCase):
             self.assertEqual(char_to_num(ch), i)
             self.assertEqual(char_to_num(ch.upper()), i)
 
-def run_tests():
-    unittest.main()
+    def test_pack_rack_sorts_and_round_trips(self):
+        self.assertEqual(pack_rack("ba"), pack_rack("AB"))
+        self.assertEqual(unpack_rack(pack_rack("RETAINS")), "AEINRST")
+        self.assertLess(pack_rack("ZZZZZZZZ"), 1 << 64)
+
+def run_tests(argv: list[str] | None = None):
+    # Run through entry_script, __main__ is not this module
+    unittest.main(module=__name__, argv=["test_generic", *(argv or [])])
 
 if __name__ == "__main__":
     run_tests()
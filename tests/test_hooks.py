@@ -0,0 +1,28 @@
+import unittest
+
+from game_play.hooks import HookTable
+
+WORDS = ["cat", "cats", "scat", "at", "ta", "tat", "oat", "boat", "boats", "q"]
+
+
+class TestHookTable(unittest.TestCase):
+    def setUp(self):
+        self.hooks = HookTable(WORDS)
+
+    def test_front_and_back_hooks(self):
+        self.assertEqual(self.hooks.front_hooks("cat"), "S")
+        self.assertEqual(self.hooks.back_hooks("CAT"), "S")
+        self.assertEqual(self.hooks.front_hooks("at"), "COT")
+        self.assertEqual(self.hooks.back_hooks("ta"), "T")
+        self.assertEqual(self.hooks.front_hooks("oat"), "B")
+        self.assertEqual(self.hooks.back_hooks("boat"), "S")
+
+    def test_words_without_hooks(self):
+        self.assertEqual(self.hooks.front_hooks("boats"), "")
+        self.assertEqual(self.hooks.back_hooks("notaword"), "")
+        self.assertFalse(self.hooks.takes_back_hook("cat", "Z"))
+        self.assertTrue(self.hooks.takes_front_hook("at", "t"))
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,83 @@
+import json
+import unittest
+
+from game_play.dictionary import Dictionary
+from game_play.lazy_records import LazyRecords
+from game_play.lexi_grid import LexiGrid
+from game_play.move_types import MoveOptions
+from game_play.player import Player
+from game_play.position_corpus import load_corpus, play_bot_turn
+from helper.text_output import suppress_output
+
+
+class TestLazyRecords(unittest.TestCase):
+    def test_entries_are_decoded_once_on_first_read(self):
+        decoded = []
+        records = LazyRecords([{"n": 1}, None, {"n": 2}], lambda d: decoded.append(d["n"]) or d["n"] * 10)
+        self.assertEqual(records.num_raw, 2)
+        self.assertEqual(records[-1], 20)
+        self.assertEqual(records[-1], 20)
+        self.assertEqual(decoded, [2])
+        records.append(30)
+        self.assertEqual(list(records), [10, None, 20, 30])
+        self.assertEqual(records.num_raw, 0)
+        del records[0]
+        self.assertEqual(records[:2], [None, 20])
+
+    def test_inserted_dicts_count_as_raw_until_read(self):
+        records = LazyRecords([7], lambda d: d["n"] * 10)
+        records.insert(0, {"n": 4})
+        records.append({"n": 5})
+        self.assertEqual(records.num_raw, 2)
+        self.assertEqual(list(records), [40, 7, 50])
+        self.assertEqual(records.num_raw, 0)
+
+
+class TestLazyLoading(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.dictionary = Dictionary()
+        with suppress_output():
+            cls.corpus = load_corpus()
+            cls.index = cls.dictionary.index
+
+    def load(self, key: str, lazy: bool) -> LexiGrid:
+        with suppress_output():
+            return LexiGrid.from_dict(json.loads(json.dumps(self.corpus[key])), dictionary=self.dictionary, lazy=lazy)
+
+    def test_resuming_builds_only_board_and_racks(self):
+        lazy, eager = self.load("endgame-0", True), self.load("endgame-0", False)
+        self.assertEqual(lazy.previous_moves.num_raw, len(eager.previous_moves))
+        for lazy_player, eager_player in zip(lazy.players, eager.players):
+            self.assertEqual(lazy_player.score_history.num_raw, len(eager_player.score_history))
+            self.assertEqual((lazy_player.rack, lazy_player.current_score), (eager_player.rack, eager_player.current_score))
+        self.assertEqual(lazy.board.to_dict(), eager.board.to_dict())
+        self.assertEqual(json.dumps(lazy.to_dict()), json.dumps(eager.to_dict()))
+        self.assertEqual(lazy.previous_moves.num_raw, len(eager.previous_moves))
+
+    def test_play_on_from_a_lazy_load(self):
+        lazy, eager = self.load("midgame-0", True), self.load("midgame-0", False)
+        with suppress_output():
+            for game in (lazy, eager):
+                for _ in range(3):
+                    play_bot_turn(game, self.index)
+        self.assertEqual(json.dumps(lazy.to_dict()), json.dumps(eager.to_dict()))
+        self.assertGreater(lazy.previous_moves.num_raw, 0)
+        self.assertEqual([move.action for move in lazy.previous_moves], [move.action for move in eager.previous_moves])
+
+    def test_challenge_reads_back_the_saved_play(self):
+        alice, bob = Player("alice"), Player("bob")
+        with suppress_output():
+            game = LexiGrid([alice, bob], dictionary=self.dictionary, seed=3)
+            alice.rack = list("CTXEEEE")
+            game.unseen.rebuild(game.board)
+            game.make_move(game.parse_move("play cxt h8 h"))
+            resumed = LexiGrid.from_dict(json.loads(json.dumps(game.to_dict())), dictionary=self.dictionary, lazy=True)
+            resumed.make_move(resumed.parse_move("challenge"))
+        self.assertEqual(resumed.players[0].current_score, 0)
+        self.assertEqual(resumed.players[0].score_history[-1].move_action, MoveOptions.CHALLENGE)
+        self.assertEqual(resumed.players[0].score_at_turn(resumed.turn), 0)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,91 @@
+import json
+import sys
+import unittest
+
+from game_play.dictionary import Dictionary
+from game_play.lexi_grid import LexiGrid
+from game_play.memory import archive_memory, deep_sizeof, game_memory_breakdown, trace_game_growth
+from game_play.position_corpus import generate_position, load_corpus
+from helper.text_output import suppress_output
+
+_corpus: dict[str, dict] | None = None
+
+
+def shared_corpus() -> dict[str, dict]:
+    """The seeded corpus, built once for every test in this module."""
+    global _corpus
+    if _corpus is None:
+        with suppress_output():
+            _corpus = load_corpus()
+    return _corpus
+
+
+class TestDeepSizeof(unittest.TestCase):
+    def test_shared_objects_are_counted_once(self):
+        shared = ["x" * 100]
+        seen = set()
+        first = deep_sizeof({"a": shared}, seen)
+        second = deep_sizeof({"b": shared}, seen)
+        self.assertGreater(first, second)
+        self.assertGreaterEqual(first, sys.getsizeof(shared[0]))
+
+
+class TestGameMemory(unittest.TestCase):
+    def test_breakdown_adds_up_and_grows(self):
+        game = generate_position(11, num_turns=4)
+        before = game_memory_breakdown(game)
+        self.assertEqual(before["total"], sum(size for name, size in before.items() if name != "total"))
+        self.assertGreater(before["board"], 0)
+        self.assertNotIn("dictionary", before)
+
+        growth = trace_game_growth(game, turns=4)
+        self.assertGreater(growth["turns"], 0)
+        self.assertTrue(growth["top_growth"])
+        self.assertGreater(game_memory_breakdown(game)["score_history"], before["score_history"])
+
+
+class TestCompactRecords(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.corpus = shared_corpus()
+        cls.dictionary = Dictionary()
+
+    def load(self, key: str) -> LexiGrid:
+        return LexiGrid.from_dict(self.corpus[key], dictionary=self.dictionary)
+
+    def test_records_have_no_instance_dict(self):
+        game = self.load("endgame-0")
+        turn_score = game.players[0].score_history[0]
+        scored_word = next(iter(turn_score.scored_words.values()))
+        move = next(move for move in game.previous_moves if move.word_play)
+        for record in (turn_score, scored_word, move, move.word_play, game.board.get_tile(7, 7)):
+            self.assertFalse(hasattr(record, "__dict__"), type(record).__name__)
+
+    def test_saved_games_are_unchanged(self):
+        def keys(value):
+            if isinstance(value, dict):
+                return {key: keys(item) for key, item in value.items() if key != "bonuses"}
+            return [keys(item) for item in value] if isinstance(value, list) else type(value).__name__
+        for key, saved in self.corpus.items():
+            resaved = json.dumps(self.load(key).to_dict())
+            self.assertEqual(keys(json.loads(resaved)), keys(json.loads(json.dumps(saved))), key)
+            reloaded = LexiGrid.from_dict(json.loads(resaved), dictionary=self.dictionary)
+            self.assertEqual(json.dumps(reloaded.to_dict()), resaved, key)
+
+    def test_loaded_words_keep_their_bonuses_and_share_strings(self):
+        first, second = self.load("endgame-0"), self.load("endgame-0")
+        for player in first.players:
+            for turn_score in player.score_history:
+                if turn_score.scored_words:
+                    # The saved turn total is the sum of its rescored words, bonuses included
+                    words = sum(word.total_score for word in turn_score.scored_words.values())
+                    self.assertEqual(words + 50 * turn_score.is_bingo, turn_score.total_score)
+        word = next(iter(first.players[0].score_history[0].scored_words.values())).word
+        self.assertIs(word, next(iter(second.players[0].score_history[0].scored_words.values())).word)
+
+    def test_archive_memory(self):
+        report = archive_memory(list(self.corpus.values()), num_games=24, dictionary=self.dictionary)
+        self.assertEqual(report["counts"]["games"], 24)
+        self.assertEqual(report["counts"]["tiles"], 24 * 225)
+        self.assertGreater(report["per_game"], 0)
+
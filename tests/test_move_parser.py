@@ -0,0 +1,57 @@
+import unittest
+
+from game_play.move import Move
+from game_play.move_parser import MoveParseError, parse_command, parse_commands, parse_coordinate
+from game_play.move_types import MoveOptions
+from game_play.player import Player
+
+
+class TestMoveParser(unittest.TestCase):
+    def test_aliases_map_to_actions(self):
+        self.assertEqual(parse_command("Q").action, MoveOptions.END)
+        self.assertEqual(parse_command("skipturn").action, MoveOptions.PASS)
+        self.assertEqual(parse_command("chalenge").action, MoveOptions.CHALLENGE)
+        self.assertEqual(parse_command("paly cat h8 h").action, MoveOptions.PLAY)
+
+    def test_coordinates_of_any_width(self):
+        self.assertEqual(parse_coordinate("H8"), (8, "h"))
+        self.assertEqual(parse_coordinate("h10"), (10, "h"))
+        self.assertEqual(parse_coordinate("15A"), (15, "a"))
+
+        word_play = parse_command("play quiz H10 down").word_play
+        self.assertEqual((word_play.word, word_play.row, word_play.col, word_play.direction), ("quiz", 10, "h", "V"))
+        word_play = parse_command("play quiz 12 c right").word_play
+        self.assertEqual((word_play.row, word_play.col, word_play.direction), (12, "c", "H"))
+
+    def test_errors_point_at_the_bad_token(self):
+        with self.assertRaises(MoveParseError) as ctx:
+            parse_command("@bob play cat H99 h")
+        self.assertEqual(ctx.exception.position, 3)
+        self.assertEqual(ctx.exception.token, "H99")
+
+        with self.assertRaises(MoveParseError) as ctx:
+            parse_command("play cat h8 sideways")
+        self.assertEqual(ctx.exception.token, "sideways")
+
+        with self.assertRaises(MoveParseError) as ctx:
+            parse_command("dance")
+        self.assertEqual(ctx.exception.position, 0)
+
+    def test_batch_parse_keeps_going_after_errors(self):
+        results = parse_commands(["pass", "", "ex ae*", "play cat"])
+        self.assertEqual(results[0].action, MoveOptions.PASS)
+        self.assertIsInstance(results[1], MoveParseError)
+        self.assertEqual(results[2].exchange_letters, ["A", "E", "*"])
+        self.assertIsInstance(results[3], MoveParseError)
+
+    def test_move_resolves_player_prefix(self):
+        alice = Player("alice")
+        bob = Player("bob")
+        move = Move("@bob challenge", default_player=alice, players=[alice, bob])
+        self.assertEqual(move.action, MoveOptions.CHALLENGE)
+        with self.assertRaises(ValueError):
+            Move("@carol challenge", default_player=alice, players=[alice, bob])
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,98 @@
+from collections import Counter
+from itertools import combinations_with_replacement
+from pathlib import Path
+import tempfile
+import unittest
+
+from game_play.lexi_grid import LexiGrid
+from game_play.opening_book import (
+    OpeningBook,
+    build_opening_book,
+    num_racks,
+    rack_rank,
+    rack_unrank,
+)
+from game_play.player import Player
+from game_play.position_corpus import find_and_play
+from game_play.word_index import WordIndex
+from helper.text_output import suppress_output
+
+WORDS = ["AT", "TA", "EAT", "TEA", "ATE", "SEAT", "EATS", "EAST", "RATES", "STARE", "TEARS", "ASTER",
+         "TREATS", "STATER", "RESEAT", "SEATER", "TEASER", "EATERS", "ARETES", "ESTATE", "RETREATS"]
+DISTRIBUTION = {"A": 2, "E": 3, "R": 1, "S": 2, "T": 2, "*": 1}
+
+
+class TestRackRank(unittest.TestCase):
+    def test_rank_numbers_every_rack_once(self):
+        racks = list(combinations_with_replacement(range(6), 7))
+        self.assertEqual(len(racks), num_racks(6, 7))
+        self.assertEqual(sorted(rack_rank(list(rack)) for rack in racks), list(range(len(racks))))
+        for rack in racks[::17]:
+            self.assertEqual(rack_unrank(rack_rank(list(rack)), 6, 7), list(rack))
+
+
+class TestOpeningBook(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp = tempfile.TemporaryDirectory()
+        cls.path = Path(cls.tmp.name) / "book.bin"
+        with suppress_output():
+            cls.finished = build_opening_book(cls.path, WORDS, DISTRIBUTION, workers=1, chunk_size=100)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmp.cleanup()
+
+    def engine_score(self, rack: str, word: str, row: int, col: int) -> int:
+        alice = Player("alice")
+        with suppress_output():
+            game = LexiGrid([alice, Player("bob")])
+            alice.rack = list(rack)
+            game.make_move(game.parse_move(f"play {word} {row + 1} {chr(97 + col)} h"))
+        return alice.current_score
+
+    def test_plays_score_as_the_engine_does(self):
+        self.assertTrue(self.finished)
+        self.assertFalse(self.path.with_name("book.bin.progress").exists())
+        with OpeningBook(self.path) as book:
+            self.assertEqual(book.alphabet, "*AERST")
+            for rack in ("AEERSTT", "AE*RSTT", "AAEESST"):
+                top, best_equity = book.lookup(rack)
+                self.assertEqual(self.engine_score(rack, top.word, top.row, top.col), top.score)
+                self.assertEqual(self.engine_score(rack, best_equity.word, best_equity.row, best_equity.col), best_equity.score)
+                self.assertGreaterEqual(top.score, best_equity.score)
+            self.assertIsNone(book.lookup("AAAAAAA"))  # more A tiles than the distribution has
+            self.assertIsNone(book.lookup("AEIRSTT"))  # I is not in the alphabet
+
+    def test_top_play_is_the_best_placement(self):
+        rack = "AEERSTT"
+        best = 0
+        for word in WORDS:
+            if Counter(word) - Counter(rack):
+                continue
+            for col in range(max(0, 8 - len(word)), 8):
+                best = max(best, self.engine_score(rack, word, 7, col))
+        with OpeningBook(self.path) as book:
+            self.assertEqual(book.lookup(rack)[0].score, best)
+
+    def test_interrupted_build_resumes(self):
+        path = Path(self.tmp.name) / "resumed.bin"
+        with suppress_output():
+            self.assertFalse(build_opening_book(path, WORDS, DISTRIBUTION, workers=1, chunk_size=100, max_chunks=3))
+            self.assertEqual(len(path.with_name("resumed.bin.progress").read_text().split()), 3)
+            self.assertTrue(build_opening_book(path, WORDS, DISTRIBUTION, workers=2, chunk_size=100))
+        self.assertEqual(path.read_bytes(), self.path.read_bytes())
+
+    def test_bot_opens_from_the_book(self):
+        players = [Player("p1"), Player("p2")]
+        with suppress_output(), OpeningBook(self.path) as book:
+            game = LexiGrid(players, seed=1)
+            players[0].rack = list("AE*RSTT")
+            find_and_play(game, WordIndex(WORDS), book)
+            play = book.best_play("AE*RSTT")
+        self.assertEqual(players[0].current_score, play.score)
+        self.assertEqual(game.previous_moves[-1].word_play.word, play.word.lower())
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,44 @@
+import json
+import unittest
+
+from game_play.lexi_grid import LexiGrid
+from game_play.player import Player
+from game_play.position_corpus import build_corpus, generate_position
+from helper.text_output import suppress_output
+
+
+class TestSeededGames(unittest.TestCase):
+    def _new_game(self, seed):
+        players = [Player(name) for name in ("alice", "bob", "carol", "dave")]
+        with suppress_output():
+            return LexiGrid(players, shuffle_players=True, seed=seed)
+
+    def test_seed_fixes_player_order_and_racks(self):
+        first, second = self._new_game(99), self._new_game(99)
+        self.assertEqual([p.name for p in first.players], [p.name for p in second.players])
+        self.assertEqual([p.rack for p in first.players], [p.rack for p in second.players])
+        self.assertEqual(first.to_dict()["seed"], 99)
+
+    def test_seed_survives_save_and_load(self):
+        game = self._new_game(1234)
+        loaded = LexiGrid.from_dict(json.loads(json.dumps(game.to_dict())))
+        self.assertEqual(loaded.seed, 1234)
+        self.assertEqual(loaded.tile_bag.draw_tiles(7), game.tile_bag.draw_tiles(7))
+
+
+class TestPositionCorpus(unittest.TestCase):
+    def test_corpus_is_reproducible(self):
+        first = build_corpus(seed=5, num_midgame=1, num_endgame=1)
+        second = build_corpus(seed=5, num_midgame=1, num_endgame=1)
+        self.assertEqual(json.dumps(first), json.dumps(second))
+        self.assertEqual(sorted(first), ["endgame-0", "midgame-0"])
+        self.assertEqual(first["endgame-0"]["tile_bag"]["letters"], [])
+
+    def test_midgame_positions_have_moves_on_the_board(self):
+        game = generate_position(seed=17, num_turns=4)
+        self.assertEqual(len(game.previous_moves), 4)
+        self.assertTrue(any(row.strip(".") for row in game.export_board_state()))
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,113 @@
+import json
+from pathlib import Path
+import tempfile
+import unittest
+
+import numpy as np
+
+from game_play.lexi_grid import LexiGrid
+from game_play.player import Player
+from game_play.ratings import GameResult, RatingEngine, glicko2_period, ratings_cli
+from helper.text_output import suppress_output
+
+LEAGUE = ["ann@league", "ben@league", "cat@league", "dan@league"]
+
+
+def league_results(num_games: int = 60) -> list[GameResult]:
+    rng = np.random.default_rng(7)
+    strength = {email: 300 + 40 * i for i, email in enumerate(LEAGUE)}
+    results = []
+    for key in range(num_games):
+        emails = list(rng.choice(LEAGUE, size=2 + key % 2, replace=False))
+        scores = [int(rng.normal(strength[email], 60)) for email in emails]
+        results.append(GameResult(f"game-{key}", emails, scores))
+    return results
+
+
+class TestGlicko2(unittest.TestCase):
+    def test_glickman_worked_example(self):
+        # Glickman's Glicko-2 paper: 1500/200 beats 1400/30, loses to 1550/100 and 1700/300
+        rating, rd, volatility = glicko2_period(
+            np.array([1500.0, 1400.0, 1550.0, 1700.0]),
+            np.array([200.0, 30.0, 100.0, 300.0]),
+            np.full(4, 0.06),
+            players=np.array([0, 0, 0]), opponents=np.array([1, 2, 3]), results=np.array([1.0, 0.0, 0.0]),
+        )
+        self.assertAlmostEqual(rating[0], 1464.06, delta=0.01)
+        self.assertAlmostEqual(rd[0], 151.52, delta=0.01)
+        self.assertAlmostEqual(volatility[0], 0.05999, delta=1e-5)
+        self.assertEqual(rating[1:].tolist(), [1400.0, 1550.0, 1700.0])
+
+
+class TestRatingEngine(unittest.TestCase):
+    def test_elo_for_an_even_game(self):
+        engine = RatingEngine()
+        self.assertTrue(engine.record(GameResult("g", ["a", "b"], [300, 250])))
+        self.assertFalse(engine.record(GameResult("g", ["a", "b"], [300, 250])))
+        self.assertEqual((engine.rating("a")["elo"], engine.rating("b")["elo"]), (1516.0, 1484.0))
+        self.assertEqual((engine.rating("a")["wins"], engine.rating("b")["losses"]), (1, 1))
+
+    def test_rebuild_in_single_game_batches_matches_recording(self):
+        results = league_results()
+        incremental = RatingEngine()
+        for result in results:
+            incremental.record(result)
+        rebuilt = RatingEngine()
+        self.assertEqual(rebuilt.rebuild(results, batch_size=1), len(results))
+        for email in LEAGUE:
+            self.assertEqual(rebuilt.rating(email), incremental.rating(email))
+        batched = RatingEngine()
+        batched.rebuild(results, batch_size=16)
+        self.assertEqual(batched.rating(LEAGUE[0])["games"], incremental.rating(LEAGUE[0])["games"])
+        self.assertEqual([row["email"] for row in batched.leaderboard(limit=1)], [LEAGUE[-1]])
+
+    def test_leaderboard_and_persistence(self):
+        engine = RatingEngine()
+        engine.rebuild(league_results())
+        board = engine.leaderboard("elo", limit=None)
+        self.assertEqual([row["rank"] for row in board], [1, 2, 3, 4])
+        self.assertEqual(board, sorted(board, key=lambda row: -row["elo"]))
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp, "ratings.json")
+            engine.save(path)
+            loaded = RatingEngine.load(path)
+        self.assertEqual(loaded.leaderboard("glicko", limit=None), engine.leaderboard("glicko", limit=None))
+        self.assertFalse(loaded.record(GameResult("game-0", LEAGUE[:2], [1, 0])))
+        with self.assertRaises(ValueError):
+            engine.leaderboard("trueskill")
+
+
+class TestFinishedGames(unittest.TestCase):
+    def game(self, end: bool) -> LexiGrid:
+        alice, bob = Player("alice@league"), Player("bob@league")
+        with suppress_output():
+            game = LexiGrid([alice, bob], seed=3)
+            alice.rack = list("CATEEEE")
+            game.unseen.rebuild(game.board)
+            game.make_move(game.parse_move("play cat h8 h"))
+            if end:
+                game.make_move(game.parse_move("end"))
+        return game
+
+    def test_only_finished_games_are_rated(self):
+        engine = RatingEngine()
+        with self.assertRaises(ValueError):
+            engine.record_game("open", self.game(end=False))
+        self.assertTrue(engine.record_game("done", self.game(end=True)))
+        self.assertGreater(engine.rating("alice@league")["glicko"], engine.rating("bob@league")["glicko"])
+
+    def test_records_new_games_from_saved_files(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            Path(tmp, "done.json").write_text(json.dumps(self.game(end=True).to_dict()))
+            Path(tmp, "open.json").write_text(json.dumps(self.game(end=False).to_dict()))
+            state = Path(tmp, "state", "ratings.json")
+            state.parent.mkdir()
+            with suppress_output():
+                self.assertEqual(ratings_cli(["record", str(state), tmp]), 0)
+            engine = RatingEngine.load(state)
+            self.assertEqual(len(engine.recorded), 1)
+            self.assertEqual(engine.record_files([tmp]), 0)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
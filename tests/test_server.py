@@ -0,0 +1,106 @@
+import asyncio
+import tempfile
+import unittest
+from unittest import mock
+
+from game_play.server import LexiGridServer
+from game_play.timing import PROCESS_TIMINGS
+
+
+class AlwaysValidDictionary:
+    def check_word(self, word: str) -> bool:
+        return True
+
+    def check_words(self, words) -> list[str]:
+        return []
+
+
+class TestLexiGridServer(unittest.TestCase):
+    def setUp(self):
+        self.spill_dir = tempfile.TemporaryDirectory()
+        self.server = LexiGridServer(max_workers=2, dictionary=AlwaysValidDictionary(), spill_dir=self.spill_dir.name)
+
+    def tearDown(self):
+        self.server.executor.shutdown()
+        self.spill_dir.cleanup()
+
+    def test_player_prefixes_resolve_against_their_own_game(self):
+        async def scenario():
+            first = await self.server.new_game(["alice", "bob"])
+            second = await self.server.new_game(["carol", "dave"])
+            self.server.sessions.get(first).players[0].rack = list("HELLOXY")
+            self.server.sessions.get(second).players[0].rack = list("WORLDXY")
+            await asyncio.gather(
+                self.server.handle_line(f"{first} play hello h8 h"),
+                self.server.handle_line(f"{second} play world h8 h"),
+            )
+            with self.assertRaises(ValueError):
+                await self.server.handle_line(f"{first} @carol challenge")
+            return first, second
+
+        first, second = asyncio.run(scenario())
+        self.assertTrue(self.server.sessions.get(first).export_board_state()[7].startswith(".......HELLO"))
+        self.assertTrue(self.server.sessions.get(second).export_board_state()[7].startswith(".......WORLD"))
+        self.assertEqual(self.server.sessions.get(first).current_player_idx, 1)
+
+    def test_idle_games_are_paged_back_in(self):
+        self.server.sessions.max_games = 1
+
+        async def scenario():
+            first = await self.server.new_game(["alice", "bob"])
+            await self.server.new_game(["carol", "dave"])
+            reply = await self.server.handle_line(f"{first} pass")
+            return reply
+
+        self.assertTrue(asyncio.run(scenario()).startswith("next"))
+        stats = self.server.sessions.stats()
+        self.assertEqual(stats["page_ins"], 1)
+        self.assertGreaterEqual(stats["evictions"], 1)
+
+    def test_unexpected_errors_are_replied_to_and_keep_the_connection(self):
+        handle_line = self.server.handle_line
+
+        async def failing_handle_line(line: str) -> str:
+            if line == "BOOM":
+                raise TypeError("bad move")
+            return await handle_line(line)
+
+        async def session() -> list[str]:
+            listener = await asyncio.start_server(self.server.handle_client, "127.0.0.1", 0)
+            async with listener:
+                reader, writer = await asyncio.open_connection("127.0.0.1", listener.sockets[0].getsockname()[1])
+                writer.write(b"BOOM\nGAMES\nQUIT\n")
+                replies = [(await reader.readline()).decode().strip() for _ in range(3)]
+                writer.close()
+                await writer.wait_closed()
+            return replies
+
+        with mock.patch.object(self.server, "handle_line", side_effect=failing_handle_line):
+            replies = asyncio.run(session())
+        self.assertEqual(replies, ["ERR TypeError: bad move", "OK", "OK bye"])
+
+    def test_metrics_endpoint_serves_prometheus_text(self):
+        PROCESS_TIMINGS.observe("parse_move", 5_000)
+
+        async def scrape(path: str) -> str:
+            metrics = await asyncio.start_server(self.server.handle_metrics, "127.0.0.1", 0)
+            async with metrics:
+                reader, writer = await asyncio.open_connection("127.0.0.1", metrics.sockets[0].getsockname()[1])
+                writer.write(f"GET {path} HTTP/1.0\r\nHost: localhost\r\n\r\n".encode())
+                response = await reader.read()
+                writer.close()
+                await writer.wait_closed()
+            return response.decode()
+
+        response = asyncio.run(scrape("/metrics"))
+        self.assertTrue(response.startswith("HTTP/1.0 200 OK"))
+        self.assertIn('lexigrid_phase_seconds_count{phase="parse_move"}', response)
+        self.assertTrue(asyncio.run(scrape("/other")).startswith("HTTP/1.0 404"))
+
+    def test_unknown_game_is_reported(self):
+        with self.assertRaises(KeyError):
+            asyncio.run(self.server.handle_line("g99 pass"))
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,113 @@
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+from game_play.dictionary import Dictionary
+from game_play.lexi_grid import LexiGrid
+from game_play.memory import game_memory_breakdown
+from game_play.player import Player
+from game_play.position_corpus import generate_position
+from game_play.session_cache import MOVE_BYTES, SessionCache
+from helper.text_output import suppress_output
+
+
+class TestSessionCache(unittest.TestCase):
+    def setUp(self):
+        self.spill_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.spill_dir.cleanup()
+
+    def _game(self, *names):
+        return LexiGrid([Player(name) for name in names])
+
+    def test_least_recently_used_game_is_spilled_and_paged_in(self):
+        cache = SessionCache(self.spill_dir.name, max_games=2)
+        first = self._game("alice", "bob")
+        first.players[0].current_score = 42
+        cache.put("g1", first)
+        cache.put("g2", self._game("carol"))
+        cache.get("g1")
+        cache.put("g3", self._game("dave"))
+
+        self.assertTrue(cache.spill_path("g2").exists())
+        self.assertEqual(cache.evictions, 1)
+
+        paged_in = cache.get("g2")
+        self.assertEqual([p.name for p in paged_in.players], ["carol"])
+        self.assertTrue(cache.spill_path("g1").exists())
+        self.assertEqual(cache.get("g1").players[0].current_score, 42)
+
+        stats = cache.stats()
+        self.assertEqual(stats["hits"], 1)
+        self.assertEqual(stats["misses"], 2)
+        self.assertEqual(stats["page_ins"], 2)
+        self.assertEqual(stats["resident_games"], 2)
+
+    def test_games_that_can_not_be_evicted_stay_resident(self):
+        cache = SessionCache(self.spill_dir.name, max_games=1, can_evict=lambda game_id: game_id != "busy")
+        cache.put("busy", self._game("alice"))
+        cache.put("idle", self._game("bob"))
+        cache.put("new", self._game("carol"))
+
+        self.assertEqual(cache.game_ids(), ["busy", "new", "idle"])
+
+    def test_size_estimate_tracks_measured_memory(self):
+        dictionary = Dictionary()
+        with suppress_output():
+            dictionary.index
+        games = [LexiGrid([Player(f"p{i}") for i in range(n)], dictionary=dictionary) for n in (1, 2, 4)]
+        games += [generate_position(seed, turns, dictionary) for seed, turns in ((1, 8), (2, 16), (3, None))]
+        for game in games:
+            measured = game_memory_breakdown(game)["total"]
+            self.assertAlmostEqual(SessionCache.estimate_size(game) / measured, 1, delta=0.2)
+
+    def test_byte_budget_is_rechecked_after_moves(self):
+        busy, idle = self._game("alice", "bob"), self._game("carol", "dave")
+        cache = SessionCache(self.spill_dir.name, max_games=None, max_bytes=2 * SessionCache.estimate_size(idle) + MOVE_BYTES)
+        cache.put("idle", idle)
+        cache.put("busy", busy)
+        with suppress_output():
+            for _ in range(2):
+                busy.make_move(busy.parse_move("pass"))
+        self.assertEqual(cache.game_ids(), ["idle", "busy"])
+        cache.resize("busy")
+        self.assertEqual(cache.game_ids(), ["busy", "idle"])
+        self.assertTrue(cache.spill_path("idle").exists())
+        self.assertEqual(list(cache.spill_dir.glob("*.tmp")), [])
+
+    def test_paging_in_does_not_hold_up_other_games(self):
+        cache = SessionCache(self.spill_dir.name, max_games=1)
+        cache.put("cold", self._game("alice"))
+        cache.put("hot", self._game("bob"))
+        reading, release = threading.Event(), threading.Event()
+        from_dict = LexiGrid.from_dict
+
+        def slow_from_dict(*args, **kwargs):
+            reading.set()
+            release.wait(5)
+            return from_dict(*args, **kwargs)
+
+        with mock.patch.object(LexiGrid, "from_dict", side_effect=slow_from_dict):
+            cold_reader = threading.Thread(target=cache.get, args=("cold",))
+            cold_reader.start()
+            self.assertTrue(reading.wait(5))
+            hot_reader = threading.Thread(target=cache.get, args=("hot",))
+            hot_reader.start()
+            hot_reader.join(5)
+            self.assertFalse(hot_reader.is_alive())
+            self.assertIn("cold", cache)
+            release.set()
+            cold_reader.join(5)
+        self.assertEqual(cache.game_ids(), ["cold", "hot"])
+        self.assertEqual(cache.stats()["page_ins"], 1)
+
+    def test_unknown_game_raises(self):
+        cache = SessionCache(self.spill_dir.name)
+        with self.assertRaises(KeyError):
+            cache.get("missing")
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
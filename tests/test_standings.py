@@ -0,0 +1,83 @@
+import unittest
+
+from game_play.lexi_grid import LexiGrid
+from game_play.move_types import MoveOptions
+from game_play.player import Player
+from game_play.position_corpus import load_corpus
+from game_play.scoring import TurnScore
+from game_play.standings import leader_at_turn, lead_stats, spread_at_turn, standings
+from helper.text_output import suppress_output
+
+
+def naive_score_at_turn(player: Player, turn: int) -> int:
+    return sum(turn_score.total_score for turn_score in player.score_history if turn_score.turn <= turn)
+
+
+def adjustment(turn: int, score: int) -> TurnScore:
+    turn_score = TurnScore(MoveOptions.PASS, turn)
+    turn_score.total_score = score
+    return turn_score
+
+
+class TestScoreTimeline(unittest.TestCase):
+    def test_running_totals_include_challenge_penalties(self):
+        alice, bob = Player("alice"), Player("bob")
+        with suppress_output():
+            game = LexiGrid([alice, bob], seed=3)
+            alice.rack = list("CTXEEEE")
+            game.unseen.rebuild(game.board)
+            game.make_move(game.parse_move("play cxt h8 h"))
+            game.make_move(game.parse_move("challenge"))
+        self.assertEqual([turn_score.total_score for turn_score in alice.score_history], [alice.timeline.after_move[1], -alice.timeline.after_move[1]])
+        self.assertEqual(alice.timeline.after_moves(1), alice.score_history[0].total_score)
+        self.assertEqual(alice.timeline.after_moves(2), 0)
+        for turn in range(-1, game.turn + 2):
+            self.assertEqual(alice.score_at_turn(turn), naive_score_at_turn(alice, turn))
+            self.assertEqual(bob.score_at_turn(turn), naive_score_at_turn(bob, turn))
+
+    def test_adjustment_to_an_earlier_turn_carries_forward(self):
+        player = Player("p")
+        player.add_score(adjustment(0, 20))
+        player.add_score(adjustment(3, 10))
+        player.add_score(adjustment(1, -5))
+        self.assertEqual([player.score_at_turn(turn) for turn in range(5)], [20, 15, 15, 25, 25])
+        self.assertEqual(player.timeline.after_moves(3), player.current_score)
+
+    def test_loaded_players_rebuild_lazily(self):
+        for game in load_corpus().values():
+            players = [Player.from_dict(player) for player in game["players"]]
+            self.assertIsNone(players[0]._timeline)
+            last_turn = max(turn_score.turn for player in players for turn_score in player.score_history)
+            for turn in range(last_turn + 1):
+                for player in players:
+                    self.assertEqual(player.score_at_turn(turn), naive_score_at_turn(player, turn))
+            self.assertIsNotNone(players[0]._timeline)
+            players[0].add_score(adjustment(last_turn + 1, 7))
+            self.assertEqual(players[0].score_at_turn(last_turn + 1), naive_score_at_turn(players[0], last_turn + 1))
+
+
+class TestStandings(unittest.TestCase):
+    def setUp(self):
+        self.ann, self.ben = Player("ann"), Player("ben")
+        # ann leads turns 0-1, level at 2, ben leads 3-5
+        for turn, (ann, ben) in enumerate([(10, 0), (5, 8), (0, 7), (0, 9), (4, 4), (0, 1)]):
+            self.ann.add_score(adjustment(turn, ann))
+            self.ben.add_score(adjustment(turn, ben))
+        self.players = [self.ann, self.ben]
+
+    def test_standings_and_spread(self):
+        self.assertEqual([(player.name, score) for player, score in standings(self.players, 1)], [("ann", 15), ("ben", 8)])
+        self.assertEqual(spread_at_turn(self.ben, self.ann, 5), 10)
+        self.assertIsNone(leader_at_turn(self.players, 2))
+        self.assertIs(leader_at_turn(self.players, 3), self.ben)
+        self.assertIs(standings(self.players)[0][0], self.ben)
+
+    def test_lead_stats(self):
+        stats, lead_changes = lead_stats(self.players)
+        self.assertEqual(stats[0].to_dict(), {"name": "ann", "turns_led": 2, "longest_lead": 2, "largest_lead": 10})
+        self.assertEqual(stats[1].to_dict(), {"name": "ben", "turns_led": 3, "longest_lead": 3, "largest_lead": 10})
+        self.assertEqual(lead_changes, 1)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
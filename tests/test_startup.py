@@ -0,0 +1,64 @@
+import contextlib
+import io
+from pathlib import Path
+import subprocess
+import sys
+import unittest
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+# Generous enough for a slow machine; the eager imports the dispatcher replaced took ~180 ms on a fast one
+IMPORT_CEILING_US = 250_000
+# The dispatcher (~15 ms) against importing the engine (~60 ms), both measured on the same machine
+MAX_IMPORT_RATIO = 0.5
+# Loaded by subcommands only
+LAZY_MODULES = ("game_play", "tests", "benchmarks", "colorama", "config", "numpy", "asyncio", "concurrent")
+
+
+def loaded_modules(statement: str) -> list[str]:
+    """Everything in sys.modules after running `statement` in a fresh interpreter."""
+    completed = subprocess.run(
+        [sys.executable, "-c", f"{statement}\nimport sys\nprint('\\n'.join(sys.modules))"],
+        cwd=REPO_ROOT, capture_output=True, text=True, check=True,
+    )
+    return completed.stdout.split()
+
+
+def import_time(module: str) -> int:
+    """Cumulative import time of `module` in microseconds, best of three fresh interpreters."""
+    best = None
+    for _ in range(3):
+        completed = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            cwd=REPO_ROOT, capture_output=True, text=True, check=True,
+        )
+        for line in completed.stderr.splitlines():
+            if line.startswith("import time:") and line.rsplit("|", 1)[-1].strip() == module:
+                cumulative = int(line.split("|")[1])
+                best = cumulative if best is None else min(best, cumulative)
+    return best
+
+
+class TestDispatch(unittest.TestCase):
+    def test_help_after_a_command_goes_to_the_command(self):
+        from entry_script import main
+
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out), self.assertRaises(SystemExit) as exit_info:
+            main(["memory", "--help"])
+        self.assertEqual(exit_info.exception.code, 0)
+        self.assertIn("Lexigrid memory", out.getvalue())
+        self.assertIn("--archive", out.getvalue())
+
+
+class TestStartup(unittest.TestCase):
+    def test_entry_script_imports_only_the_dispatcher(self):
+        for module in loaded_modules("import entry_script"):
+            self.assertNotIn(module.split(".")[0], LAZY_MODULES, f"{module} imported at startup")
+
+    def test_entry_script_imports_quickly(self):
+        dispatcher = import_time("entry_script")
+        self.assertLess(dispatcher, IMPORT_CEILING_US)
+        self.assertLess(dispatcher, MAX_IMPORT_RATIO * import_time("game_play.lexi_grid"))
+
+    def test_engine_import_does_not_load_colorama(self):
+        self.assertNotIn("colorama", loaded_modules("import game_play.lexi_grid"))
@@ -0,0 +1,70 @@
+import json
+import unittest
+
+import config
+from game_play.tile import TileBag
+
+
+class TestTileBag(unittest.TestCase):
+    def test_same_seed_draws_same_tiles(self):
+        self.assertEqual(TileBag(seed=7).draw_tiles(20), TileBag(seed=7).draw_tiles(20))
+        self.assertNotEqual(TileBag(seed=7).draw_tiles(20), TileBag(seed=8).draw_tiles(20))
+
+    def test_draws_empty_the_bag_exactly(self):
+        bag = TileBag(seed=1)
+        total = sum(config.TILE_DISTRIBUTION.values())
+        drawn = []
+        while not bag.is_empty():
+            drawn.extend(bag.draw_tiles(7))
+        self.assertEqual(len(drawn), total)
+        self.assertEqual(sorted(drawn), sorted(TileBag(seed=1).letters))
+        self.assertEqual(bag.draw_tiles(7), [])
+
+    def test_exchange_returns_tiles_to_the_bag(self):
+        bag = TileBag(seed=3)
+        rack = bag.draw_tiles(7)
+        before = len(bag)
+        new_tiles = bag.exchange(rack[:3])
+        self.assertEqual(len(new_tiles), 3)
+        self.assertEqual(len(bag), before)
+        with self.assertRaises(ValueError):
+            TileBag(seed=3, counts={"A": 1}).exchange(["B", "C"])
+
+    def test_exchange_needs_a_full_rack_in_the_bag(self):
+        bag = TileBag(seed=3, counts={"A": config.RACK_SIZE - 1})
+        with self.assertRaises(ValueError):
+            bag.exchange(["B"])
+        self.assertEqual(len(bag), config.RACK_SIZE - 1)
+
+    def test_exchange_order_follows_the_rule(self):
+        # With only E in the bag, drawing first can never give back the exchanged Q
+        for _ in range(20):
+            self.assertEqual(TileBag(counts={"E": config.RACK_SIZE}).exchange(["Q"]), ["E"])
+        returned_first = [TileBag(seed=seed, counts={"E": config.RACK_SIZE}).exchange(["Q"], return_first=True) for seed in range(50)]
+        self.assertIn(["Q"], returned_first)
+
+    def test_clone_continues_the_same_stream_independently(self):
+        bag = TileBag(seed=11)
+        bag.draw_tiles(5)
+        clone = bag.clone()
+        self.assertEqual(clone.draw_tiles(10), bag.draw_tiles(10))
+        clone.draw_tiles(5)
+        self.assertNotEqual(len(clone), len(bag))
+
+    def test_serialization_round_trip_keeps_rng_stream(self):
+        bag = TileBag(seed=5)
+        bag.draw_tiles(9)
+        saved = bag.to_dict()
+        self.assertEqual((saved["seed"], saved["num_draws"]), (5, 9))
+        loaded = TileBag.from_dict(json.loads(json.dumps(saved)))
+        self.assertEqual(loaded.letters, bag.letters)
+        self.assertEqual(loaded.draw_tiles(7), bag.draw_tiles(7))
+
+    def test_loads_letters_only_saves(self):
+        loaded = TileBag.from_dict({"letters": ["Q", "A", "A"]})
+        self.assertEqual(loaded.letters, ["A", "A", "Q"])
+        self.assertEqual(sorted(loaded.draw_tiles(7)), ["A", "A", "Q"])
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,46 @@
+import unittest
+
+from game_play.lexi_grid import LexiGrid
+from game_play.player import Player
+from game_play.timing import NULL_PHASE, PROCESS_TIMINGS, PhaseTimings, enable_timing
+from helper.text_output import suppress_output
+
+
+class TestPhaseTimings(unittest.TestCase):
+    def test_histogram_buckets_and_prometheus(self):
+        timings = PhaseTimings()
+        timings.observe("place_word.score", 5_000)       # 5 us
+        timings.observe("place_word.score", 2_000_000)   # 2 ms
+        exported = timings.to_dict()["place_word.score"]
+        self.assertEqual(exported["count"], 2)
+        self.assertEqual(exported["buckets"][0], [10, 1])
+        self.assertEqual(exported["buckets"][-1], ["+Inf", 2])
+
+        text = timings.to_prometheus(labels={"game": "g1"})
+        self.assertIn('lexigrid_phase_seconds_bucket{phase="place_word.score",game="g1",le="1e-05"} 1', text)
+        self.assertIn('lexigrid_phase_seconds_count{phase="place_word.score",game="g1"} 2', text)
+
+    def test_disabled_game_uses_null_phase(self):
+        enable_timing(False)
+        with suppress_output():
+            game = LexiGrid([Player("alice"), Player("bob")], seed=3)
+        self.assertIsNone(game.timings)
+        self.assertIs(game.phase("make_move.pass"), NULL_PHASE)
+
+    def test_game_and_process_rollups(self):
+        enable_timing()
+        try:
+            with suppress_output():
+                game = LexiGrid([Player("alice"), Player("bob")], seed=3)
+                before = PROCESS_TIMINGS.to_dict().get("make_move.pass", {}).get("count", 0)
+                game.make_move(game.parse_move("pass"))
+                game.make_move(game.parse_move("play " + "".join(game.players[1].rack) + " h8 h"))
+        finally:
+            enable_timing(False)
+        self.assertEqual(game.timings.to_dict()["make_move.pass"]["count"], 1)
+        self.assertIn("parse_move", game.timings.phases)
+        self.assertIn("place_word.validate", game.timings.phases)
+        # One observation per phase and move; the turn change is not part of the print phase
+        for phase in ("place_word.score", "place_word.apply_score", "place_word.print"):
+            self.assertEqual(game.timings.to_dict()[phase]["count"], 1)
+        self.assertEqual(PROCESS_TIMINGS.to_dict()["make_move.pass"]["count"], before + 1)
@@ -0,0 +1,73 @@
+import unittest
+from math import comb
+
+import config
+from game_play.lexi_grid import LexiGrid
+from game_play.player import Player
+from game_play.unseen import UnseenTracker, draw_probability, hypergeometric_at_least
+from helper.text_output import suppress_output
+
+
+class StubDictionary:
+    def __init__(self, valid_words):
+        self.valid_words = {word.upper() for word in valid_words}
+
+    def check_word(self, word: str) -> bool:
+        return word.upper() in self.valid_words
+
+    def check_words(self, words) -> list[str]:
+        return [word for word in dict.fromkeys(words) if not self.check_word(word)]
+
+
+class TestDrawProbability(unittest.TestCase):
+    def test_single_letter_matches_closed_form(self):
+        # One U among 10 tiles, drawing 3: 1 - C(9,3)/C(10,3)
+        expected = 1 - comb(9, 3) / comb(10, 3)
+        self.assertAlmostEqual(draw_probability({"U": 1, "E": 9}, "U", 3), expected)
+        self.assertAlmostEqual(hypergeometric_at_least(1, 10, 3, 1), expected)
+        self.assertEqual(draw_probability({"U": 1, "E": 9}, "UU", 3), 0.0)
+
+    def test_combination_of_letters(self):
+        # Q and U from {Q, U, E, E}, drawing 2: only one of the six pairs
+        self.assertAlmostEqual(draw_probability({"Q": 1, "U": 1, "E": 2}, "QU", 2), 1 / 6)
+        self.assertAlmostEqual(draw_probability({"Q": 1, "U": 1, "E": 2}, "QU", 4), 1.0)
+
+
+class TestUnseenTracker(unittest.TestCase):
+    def setUp(self):
+        self.alice = Player("alice")
+        self.bob = Player("bob")
+        with suppress_output():
+            self.game = LexiGrid([self.alice, self.bob], dictionary=StubDictionary(["HELLO"]))
+
+    def assert_matches_rebuild(self):
+        fresh = UnseenTracker(self.game.players)
+        fresh.rebuild(self.game.board)
+        for player in self.game.players:
+            self.assertEqual(self.game.unseen.unseen_for(player), fresh.unseen_for(player))
+
+    def test_views_exclude_own_rack(self):
+        total = sum(config.TILE_DISTRIBUTION.values())
+        self.assertEqual(self.game.unseen.num_unseen(self.alice), total - len(self.alice.rack))
+        self.assert_matches_rebuild()
+
+    def test_tracker_follows_plays_exchanges_and_challenges(self):
+        with suppress_output():
+            self.alice.rack = list("HELLO") + self.alice.rack[:2]
+            self.game.unseen.rebuild(self.game.board)
+            self.game.make_move(self.game.parse_move("play hello h8 h"))
+            self.assert_matches_rebuild()
+
+            self.game.make_move(self.game.parse_move("ex " + "".join(self.bob.rack[:3])))
+            self.assert_matches_rebuild()
+
+            self.alice.rack = list("XYZZYAB")
+            self.game.unseen.rebuild(self.game.board)
+            self.assertEqual(self.game.make_move(self.game.parse_move("play xyzzy l3 v")).value, "next")
+            self.assertEqual(self.game.make_move(self.game.parse_move("challenge")).value, "next")
+        self.assertIsNone(self.game.board.get_letter(2, 11))
+        self.assert_matches_rebuild()
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,32 @@
+import unittest
+
+from game_play.word_index import WordIndex, rack_subsets
+
+WORDS = ["Cat", "act", "TAC", "tact", "at", "ta", "qat", "quat", "qaid", "aqua", "cate", "bake", "babe", "zzz"]
+
+
+class TestWordIndex(unittest.TestCase):
+    def setUp(self):
+        self.index = WordIndex(WORDS)
+
+    def test_anagrams_and_blanks(self):
+        self.assertEqual(self.index.anagrams("tca"), ["ACT", "CAT", "TAC"])
+        self.assertEqual(self.index.anagrams("ta?"), ["ACT", "CAT", "QAT", "TAC"])
+
+    def test_words_from_rack_longest_first(self):
+        self.assertEqual(self.index.words_from_rack("CATT"), ["TACT", "ACT", "CAT", "TAC", "AT", "TA"])
+        self.assertIn("QUAT", self.index.words_from_rack("QAT?"))
+
+    def test_patterns_and_letter_filters(self):
+        self.assertEqual(self.index.match("?A?E"), ["BABE", "BAKE", "CATE"])
+        self.assertEqual(self.index.find(length=4, contains="Q", excludes="U"), ["QAID"])
+        self.assertEqual(self.index.find(contains="ZZ"), ["ZZZ"])
+        self.assertEqual(self.index.find(rack="CATE", pattern="?A??"), ["CATE"])
+        self.assertEqual(self.index.find(pattern="Q???", contains="U"), ["QUAT"])
+
+    def test_rack_subsets_are_distinct(self):
+        self.assertEqual(rack_subsets("AAB"), ["AAB", "AA", "AB", "A", "B"])
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)